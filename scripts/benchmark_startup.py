@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+benchmark_startup.py
+
+Mide el coste de arranque de `src.main` usando `python -X importtime` y protege
+contra regresiones.
+
+Para cada escenario (ej. `--help`, `--validate-profile`) lanza el proceso varias
+veces y registra:
+- El tiempo hasta la primera línea de salida (el primer log, o la ayuda de argparse).
+- El tiempo total del proceso.
+- Los módulos importados y los más costosos según `-X importtime`.
+
+Se considera regresión:
+- Que un escenario importe un módulo prohibido para él (ej. `pywinauto` al pedir
+  `--help`). Esta comprobación es determinista y no depende de la máquina.
+- Que la mediana del tiempo hasta la primera salida supere la línea base guardada
+  con `--save-baseline` en más de la tolerancia indicada.
+
+Uso (desde la raíz del proyecto):
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --runs 10 --save-baseline data/startup_baseline.json
+    python scripts/benchmark_startup.py --baseline data/startup_baseline.json --tolerance 0.25
+
+El código de salida es 1 si se detecta alguna regresión.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Módulos de la capa de automatización: ningún escenario de este benchmark los necesita.
+AUTOMATION_MODULES = {"pywinauto", "pyperclip", "PIL", "Xlib"}
+# Módulos de la capa de datos: `--help` no debe cargarlos.
+DATA_MODULES = {"pandas", "numpy", "openpyxl", "pyarrow"}
+
+SCENARIOS = {
+    "help": {
+        "args": ["--help"],
+        "forbidden": AUTOMATION_MODULES | DATA_MODULES,
+    },
+    "validate-profile": {
+        "args": ["--profile", "dev_example", "--validate-profile"],
+        "forbidden": AUTOMATION_MODULES,
+    },
+}
+
+
+def parse_importtime(stderr_text: str) -> dict[str, int]:
+    """
+    Interpreta la salida de `-X importtime`. Devuelve módulo -> tiempo acumulado
+    en microsegundos (solo las líneas de importación, no otros mensajes).
+    """
+    modules = {}
+    for line in stderr_text.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        try:
+            _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+            modules[name.strip()] = int(cumulative)
+        except ValueError:
+            continue
+    return modules
+
+
+def run_once(args: list[str]) -> dict:
+    """Lanza `python -X importtime -m src.main <args>` y mide su arranque."""
+    env = dict(os.environ, PYTHONUNBUFFERED="1")
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as stderr_file:
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-X", "importtime", "-m", "src.main", *args],
+            cwd=PROJECT_ROOT,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            text=True,
+        )
+        first_line = process.stdout.readline()
+        first_output = time.perf_counter() - start if first_line else None
+        process.stdout.read()
+        returncode = process.wait()
+        total = time.perf_counter() - start
+
+        stderr_file.seek(0)
+        modules = parse_importtime(stderr_file.read())
+
+    return {
+        "returncode": returncode,
+        "first_output": first_output if first_output is not None else total,
+        "total": total,
+        "modules": modules,
+    }
+
+
+def benchmark(name: str, scenario: dict, runs: int) -> dict:
+    samples = [run_once(scenario["args"]) for _ in range(runs)]
+    last = samples[-1]
+    top_level = {module.split(".")[0] for module in last["modules"]}
+    heaviest = sorted(
+        ((module, us) for module, us in last["modules"].items() if "." not in module),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:5]
+    return {
+        "name": name,
+        "returncode": last["returncode"],
+        "first_output": statistics.median(s["first_output"] for s in samples),
+        "total": statistics.median(s["total"] for s in samples),
+        "module_count": len(last["modules"]),
+        "forbidden_loaded": sorted(top_level & scenario["forbidden"]),
+        "heaviest": heaviest,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de arranque de src.main basado en -X importtime.")
+    parser.add_argument("--runs", type=int, default=5, help="Ejecuciones por escenario (se usa la mediana).")
+    parser.add_argument("--baseline", type=Path, help="Archivo JSON con la línea base a comparar.")
+    parser.add_argument("--save-baseline", type=Path, help="Guarda los resultados como nueva línea base.")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25,
+        help="Margen relativo permitido sobre la línea base (por defecto 0.25 = 25%%)."
+    )
+    args = parser.parse_args()
+
+    results = [benchmark(name, scenario, args.runs) for name, scenario in SCENARIOS.items()]
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline else {}
+
+    regressions = []
+    print("======================================================")
+    print("        Benchmark de arranque de src.main             ")
+    print("======================================================")
+    for result in results:
+        print(f"\n[{result['name']}]")
+        print(f"  Primera salida (mediana): {result['first_output'] * 1000:8.1f} ms")
+        print(f"  Proceso completo (mediana): {result['total'] * 1000:6.1f} ms")
+        print(f"  Módulos importados: {result['module_count']}")
+        for module, us in result["heaviest"]:
+            print(f"    - {module:<30} {us / 1000:8.1f} ms")
+
+        if result["returncode"] != 0:
+            regressions.append(f"{result['name']}: el proceso terminó con código {result['returncode']}.")
+        if result["forbidden_loaded"]:
+            regressions.append(f"{result['name']}: importa módulos pesados innecesarios {result['forbidden_loaded']}.")
+
+        reference = baseline.get(result["name"])
+        if reference is not None:
+            limit = reference["first_output"] * (1 + args.tolerance)
+            print(f"  Línea base: {reference['first_output'] * 1000:.1f} ms (límite {limit * 1000:.1f} ms)")
+            if result["first_output"] > limit:
+                regressions.append(
+                    f"{result['name']}: {result['first_output'] * 1000:.1f} ms hasta la primera salida "
+                    f"supera el límite de {limit * 1000:.1f} ms."
+                )
+
+    if args.save_baseline:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.save_baseline.write_text(json.dumps(
+            {r["name"]: {"first_output": r["first_output"], "total": r["total"]} for r in results},
+            indent=2,
+        ), encoding="utf-8")
+        print(f"\nLínea base guardada en '{args.save_baseline}'.")
+
+    print("\n------------------------------------------------------")
+    if regressions:
+        print("REGRESIONES DETECTADAS:")
+        for message in regressions:
+            print(f"  - {message}")
+        sys.exit(1)
+    print("Sin regresiones de arranque.")
+
+
+if __name__ == "__main__":
+    main()
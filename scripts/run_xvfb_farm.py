@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+run_xvfb_farm.py
+
+Ejecuta el pipeline completo contra una granja de K displays virtuales (Xvfb),
+cada uno con su propio SAF y su propio proceso de automatización (ver
+`src/automation/strategies/remote/xvfb_farm.py`).
+
+Sirve como benchmark honesto del camino real de teclado y portapapeles en
+paralelo, y como plantilla para repartir trabajo en producción. El reporte de
+resumen es el mismo que genera `src.main`; el log final indica el rendimiento
+en tareas por segundo.
+
+Requisitos (Linux): `Xvfb`, un gestor de ventanas EWMH (por defecto `openbox`)
+y python-xlib. El perfil debe apuntar a la ventana del SAF
+(`window_title = SAF - Stunt Action Facsimile v0.2`).
+
+Uso (desde la raíz del proyecto):
+    python scripts/run_xvfb_farm.py --profile dev_saf --input-file data/samples/facturacion_anonymized.xlsx --workers 4
+    python scripts/run_xvfb_farm.py --profile dev_saf --input-file <archivo.xlsx> --workers 2 --window-manager none
+"""
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.logger_setup import setup_logging  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ejecuta la automatización en K displays Xvfb con SAF.")
+    parser.add_argument("--profile", required=True, help="Perfil cuyo 'window_title' apunta al SAF.")
+    parser.add_argument("--input-file", type=Path, required=True, help="Archivo Excel de entrada.")
+    parser.add_argument("--workers", type=int, default=2, help="Número de displays y procesos worker.")
+    parser.add_argument(
+        "--window-manager", default="openbox",
+        help="Gestor de ventanas a lanzar en cada display ('none' para no lanzar ninguno)."
+    )
+    parser.add_argument("--screen", default="1280x800x24", help="Geometría y profundidad de cada Xvfb.")
+    args = parser.parse_args()
+
+    setup_logging()
+    logger = logging.getLogger("run_xvfb_farm")
+
+    from src.automation.strategies.remote.xvfb_farm import XvfbFarmAutomator
+    from src.config_loader import ConfigLoader
+    from src.core.orchestrator import Orchestrator
+    from src.data_handler.filter import DataFilterer
+    from src.data_handler.loader import ExcelLoader
+    from src.data_handler.validator import DataValidator
+
+    automator = XvfbFarmAutomator(
+        workers=args.workers,
+        window_manager=None if args.window_manager.lower() == "none" else args.window_manager,
+        screen=args.screen,
+    )
+    orchestrator = Orchestrator(
+        config_loader=ConfigLoader(),
+        data_loader=ExcelLoader(cache_dir=Path("data/cache")),
+        data_filterer=DataFilterer(),
+        data_validator=DataValidator(),
+        automator=automator,
+    )
+    try:
+        orchestrator.run(profile_name=args.profile, input_file_path=args.input_file)
+    except Exception as e:
+        logger.critical(f"La granja terminó con un error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# src/automation/abc/async_automator_interface.py
+
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+
+from src.automation.common.results import TaskResult
+from src.core.models import FacturacionData
+from src.core.profile import ProfileSpec
+
+
+class AsyncAutomatorInterface(ABC):
+    """
+    Contrato de las estrategias de automatización asíncronas: el mismo que
+    `AutomatorInterface`, con cada fase como corrutina.
+
+    Permite que un único bucle de asyncio coordine muchas sesiones, cada una
+    cediendo el control mientras espera a la GUI, en lugar de dedicar un hilo a
+    cada sesión. El Orchestrator, que es síncrono, las ejecuta a través de
+    `SyncAutomatorAdapter`.
+    """
+
+    @abstractmethod
+    async def initialize(self, profile: ProfileSpec) -> None:
+        """
+        Prepara el automator para la ejecución (ver `AutomatorInterface.initialize`).
+
+        Raises:
+            Exception: Si la inicialización falla (ej. la ventana no se encuentra).
+        """
+        pass
+
+    @abstractmethod
+    async def process_billing_tasks(self, tasks: Sequence[FacturacionData]) -> List[TaskResult]:
+        """
+        Procesa las tareas y retorna un `TaskResult` por tarea, en el orden de entrada.
+        """
+        pass
+
+    @abstractmethod
+    async def shutdown(self) -> None:
+        """
+        Libera los recursos del automator. Debe llamarse incluso si la
+        automatización falla.
+        """
+        pass
@@ -1,10 +1,10 @@
 # src/automation/abc/automator_interface.py
 
 from abc import ABC, abstractmethod
-from configparser import ConfigParser
-from typing import List
+from typing import Sequence
 
 from src.core.models import FacturacionData
+from src.core.profile import ProfileSpec
 
 
 class AutomatorInterface(ABC):
@@ -18,7 +18,7 @@ class AutomatorInterface(ABC):
     """
 
     @abstractmethod
-    def initialize(self, config: ConfigParser) -> None:
+    def initialize(self, profile: ProfileSpec) -> None:
         """
         Prepara el automator para la ejecución.
 
@@ -27,8 +27,8 @@ class AutomatorInterface(ABC):
         cualquier otra configuración inicial necesaria.
 
         Args:
-            config: El objeto ConfigParser que contiene los ajustes del perfil,
-                    permitiendo al automator leer su propia configuración.
+            profile: El perfil compilado; el automator lee sus ajustes de
+                     `profile.automation`.
 
         Raises:
             Exception: Si la inicialización falla (ej. la ventana no se encuentra).
@@ -36,7 +36,7 @@ class AutomatorInterface(ABC):
         pass
 
     @abstractmethod
-    def process_billing_tasks(self, tasks: List[FacturacionData]) -> None:
+    def process_billing_tasks(self, tasks: Sequence[FacturacionData]) -> None:
         """
         Ejecuta el bucle principal de automatización para una lista de tareas.
 
@@ -45,8 +45,9 @@ class AutomatorInterface(ABC):
         para cada uno.
 
         Args:
-            tasks: Una lista de objetos FacturacionData, cada uno representando
-                   una fila del Excel a procesar.
+            tasks: Una secuencia de objetos FacturacionData (una lista o un
+                   `TaskBatch` columnar), cada uno representando una fila del
+                   Excel a procesar.
         """
         pass
 
@@ -0,0 +1,53 @@
+# src/automation/common/async_adapter.py
+"""
+Adaptador que permite al Orchestrator (síncrono) ejecutar un automator
+asíncrono sin cambios en su código.
+"""
+
+import asyncio
+from typing import Awaitable, List, Optional, Sequence, TypeVar
+
+from src.automation.abc.async_automator_interface import AsyncAutomatorInterface
+from src.automation.abc.automator_interface import AutomatorInterface
+from src.automation.common.results import TaskResult
+from src.core.models import FacturacionData
+from src.core.profile import ProfileSpec
+
+T = TypeVar('T')
+
+
+class SyncAutomatorAdapter(AutomatorInterface):
+    """
+    Expone un `AsyncAutomatorInterface` como `AutomatorInterface`.
+
+    Todas las fases se ejecutan en un mismo bucle de eventos propio, creado en
+    la primera llamada y cerrado en `shutdown`: el automator puede conservar
+    entre fases objetos ligados al bucle (subprocesos, eventos, tareas). Debe
+    usarse desde un hilo sin un bucle de asyncio en marcha.
+    """
+
+    def __init__(self, automator: AsyncAutomatorInterface):
+        self.automator = automator
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _run(self, coroutine: Awaitable[T]) -> T:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coroutine)
+
+    def initialize(self, profile: ProfileSpec) -> None:
+        self._run(self.automator.initialize(profile))
+
+    def process_billing_tasks(self, tasks: Sequence[FacturacionData]) -> List[TaskResult]:
+        return self._run(self.automator.process_billing_tasks(tasks))
+
+    def shutdown(self) -> None:
+        try:
+            self._run(self.automator.shutdown())
+        finally:
+            loop, self._loop = self._loop, None
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.run_until_complete(loop.shutdown_default_executor())
+            finally:
+                loop.close()
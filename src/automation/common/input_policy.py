@@ -0,0 +1,73 @@
+# src/automation/common/input_policy.py
+"""
+Política de entrada de texto por campo: escribir tecla a tecla o pegar.
+
+Escribir un valor largo (ej. 'CAP PRO UNIPA BARBACOAS ACDO-VOLUNTADES') con una
+pausa por tecla tarda segundos sobre un escritorio remoto; pegarlo cuesta lo
+mismo sea cual sea su longitud. [AutomationInput] decide, por campo:
+- `type`: siempre tecla a tecla.
+- `paste`: siempre por portapapeles (Ctrl+V).
+- `auto` (por defecto): pegar si el valor tiene al menos `paste_min_length`
+  caracteres; escribir si es más corto.
+"""
+
+from configparser import ConfigParser
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping
+
+from src.core.constants import ConfigKeys, ConfigSections
+
+
+class InputModes:
+    """Valores admitidos por campo en [AutomationInput]."""
+    TYPE = 'type'
+    PASTE = 'paste'
+    AUTO = 'auto'
+    ALL = (TYPE, PASTE, AUTO)
+
+
+@dataclass(frozen=True)
+class InputPolicy:
+    """
+    Atributos:
+        paste_min_length: Longitud a partir de la cual `auto` pega el valor.
+        modes: Campo lógico -> modo; los campos ausentes usan `auto`.
+    """
+    paste_min_length: int = 20
+    modes: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+
+    def should_paste(self, field_name: str, value: str) -> bool:
+        mode = self.modes.get(field_name, InputModes.AUTO)
+        if mode == InputModes.AUTO:
+            return len(value) >= self.paste_min_length
+        return mode == InputModes.PASTE
+
+
+def compile_input_policy(config: ConfigParser) -> InputPolicy:
+    """
+    Compila [AutomationInput]; sin la sección, todos los campos usan `auto`.
+
+    Raises:
+        ValueError: Si algún campo declara un modo desconocido.
+    """
+    defaults = InputPolicy()
+    if not config.has_section(ConfigSections.AUTOMATION_INPUT):
+        return defaults
+
+    section = config[ConfigSections.AUTOMATION_INPUT]
+    modes = {}
+    for key, value in section.items():
+        if key == ConfigKeys.PASTE_MIN_LENGTH:
+            continue
+        mode = value.strip().lower()
+        if mode not in InputModes.ALL:
+            raise ValueError(
+                f"Modo de entrada inválido para '{key}' en [{ConfigSections.AUTOMATION_INPUT}]: '{value}'. "
+                f"Opciones: {', '.join(InputModes.ALL)}."
+            )
+        modes[key] = mode
+    return InputPolicy(
+        paste_min_length=section.getint(ConfigKeys.PASTE_MIN_LENGTH, fallback=defaults.paste_min_length),
+        modes=MappingProxyType(modes),
+    )
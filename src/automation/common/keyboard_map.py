@@ -0,0 +1,137 @@
+# src/automation/common/keyboard_map.py
+"""
+Intérprete de la sintaxis de teclas de `pywinauto.keyboard.send_keys`.
+
+Los handlers describen las pulsaciones con esa sintaxis (ej. '{ESC 3}', '^n',
+'{TAB}'). Los backends que inyectan teclas por su cuenta (ver
+`XlibBackend`) la traducen aquí a una lista de `KeyStroke` independiente de
+la plataforma. Se soporta el subconjunto usado por el bot:
+- Teclas con nombre: '{ENTER}', '{TAB 2}', '{F5}'... y literales como '{+}'.
+- Modificadores '^' (Ctrl), '+' (Shift) y '%' (Alt) sobre la tecla siguiente o
+  sobre un grupo entre paréntesis: '^(ac)'.
+- '~' como atajo de ENTER. Los espacios se escriben (equivale a `with_spaces=True`).
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Tuple
+
+# Modificador de send_keys -> nombre de keysym de X11.
+MODIFIERS = {'^': 'Control_L', '+': 'Shift_L', '%': 'Alt_L'}
+
+# Nombre de tecla de send_keys -> nombre de keysym de X11.
+NAMED_KEYS = {
+    'ENTER': 'Return',
+    'TAB': 'Tab',
+    'ESC': 'Escape',
+    'ESCAPE': 'Escape',
+    'SPACE': 'space',
+    'BACKSPACE': 'BackSpace',
+    'BKSP': 'BackSpace',
+    'BS': 'BackSpace',
+    'DEL': 'Delete',
+    'DELETE': 'Delete',
+    'INS': 'Insert',
+    'INSERT': 'Insert',
+    'HOME': 'Home',
+    'END': 'End',
+    'PGUP': 'Prior',
+    'PGDN': 'Next',
+    'UP': 'Up',
+    'DOWN': 'Down',
+    'LEFT': 'Left',
+    'RIGHT': 'Right',
+    **{f'F{n}': f'F{n}' for n in range(1, 25)},
+}
+
+
+@dataclass(frozen=True)
+class KeyStroke:
+    """
+    Una pulsación: `key` es un nombre de keysym (ej. 'Return') o un único
+    carácter a escribir; `modifiers` son los keysyms a mantener pulsados.
+    """
+    key: str
+    modifiers: Tuple[str, ...] = ()
+
+
+# Caracteres con significado especial en la sintaxis de send_keys.
+_SPECIAL_CHARS = frozenset('{}+^%~()')
+
+
+def escape_text(text: str) -> str:
+    """Escapa `text` para que `send_keys` lo escriba literalmente (ej. '+' -> '{+}')."""
+    return "".join(f"{{{char}}}" if char in _SPECIAL_CHARS else char for char in text)
+
+
+def parse_key_sequence(keys: str) -> List[KeyStroke]:
+    """
+    Traduce una cadena en sintaxis de `send_keys` a pulsaciones.
+
+    Las secuencias se interpretan una sola vez: el bot repite las mismas
+    (ej. '{ESC 3}', '^n') en cada tarea.
+
+    Raises:
+        ValueError: Si la secuencia está mal formada o usa una tecla desconocida.
+    """
+    return list(_parse_cached(keys))
+
+
+@lru_cache(maxsize=256)
+def _parse_cached(keys: str) -> Tuple[KeyStroke, ...]:
+    strokes: List[KeyStroke] = []
+    pending: List[str] = []                  # Modificadores para la próxima tecla o grupo.
+    groups: List[Tuple[str, ...]] = []       # Modificadores de los grupos abiertos.
+    i = 0
+
+    while i < len(keys):
+        char = keys[i]
+        if char in MODIFIERS:
+            pending.append(MODIFIERS[char])
+            i += 1
+            continue
+        if char == '(':
+            groups.append(tuple(pending))
+            pending = []
+            i += 1
+            continue
+        if char == ')':
+            if not groups:
+                raise ValueError(f"Paréntesis sin abrir en la secuencia de teclas: '{keys}'")
+            groups.pop()
+            i += 1
+            continue
+
+        repeat = 1
+        if char == '{':
+            # Se busca desde i + 2 para admitir el literal '{}}'.
+            end = keys.find('}', i + 2)
+            if end == -1:
+                raise ValueError(f"Llave sin cerrar en la secuencia de teclas: '{keys}'")
+            name, _, count = keys[i + 1:end].partition(' ')
+            i = end + 1
+            if count:
+                try:
+                    repeat = int(count)
+                except ValueError:
+                    raise ValueError(f"Repetición inválida '{count}' en la secuencia de teclas: '{keys}'")
+            if name.upper() in NAMED_KEYS:
+                key = NAMED_KEYS[name.upper()]
+            elif len(name) == 1:
+                key = name
+            else:
+                raise ValueError(f"Tecla desconocida '{{{name}}}' en la secuencia de teclas: '{keys}'")
+        elif char == '~':
+            key = 'Return'
+            i += 1
+        else:
+            key = char
+            i += 1
+
+        modifiers = tuple(m for group in groups for m in group) + tuple(pending)
+        strokes.extend([KeyStroke(key, modifiers)] * repeat)
+        pending = []
+
+    if groups:
+        raise ValueError(f"Paréntesis sin cerrar en la secuencia de teclas: '{keys}'")
+    return tuple(strokes)
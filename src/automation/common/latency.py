@@ -0,0 +1,144 @@
+# src/automation/common/latency.py
+"""
+Modelo de latencia autoajustable para las esperas de la GUI.
+
+Los valores de [AutomationTimeouts] se calibran a mano para el peor día del
+escritorio remoto. Este módulo registra cuánto tarda realmente cada tipo de
+acción (carga de paciente, nueva factura, copia al portapapeles) y deriva de
+ello los tiempos efectivos:
+- Tiempo límite: percentil alto de las muestras recientes multiplicado por un
+  margen, acotado por el valor del perfil (que sigue siendo el máximo).
+- Retardo del primer sondeo: fracción de la media móvil exponencial (EWMA), para
+  no sondear (ej. copiar el portapapeles) antes de que la GUI pueda estar lista.
+
+El modelo se guarda en JSON entre ejecuciones (ver `RemoteAutomator`).
+"""
+
+import json
+import logging
+import math
+import os
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Optional
+
+# Versión del formato del archivo persistido. Si cambia, el modelo guardado se descarta.
+_FORMAT_VERSION = 1
+
+
+class LatencyModel:
+    """
+    Estadísticas de latencia por tipo de acción (ver `LatencyActions`).
+
+    Mientras una acción tenga menos de `min_samples` observaciones, el modelo no
+    se pronuncia y se usan los valores del perfil sin cambios.
+    """
+
+    def __init__(
+        self,
+        window: int = 50,
+        percentile: float = 0.95,
+        margin: float = 1.5,
+        min_samples: int = 10,
+        alpha: float = 0.2,
+        floor: float = 0.05,
+    ):
+        """
+        Args:
+            window: Número de muestras recientes consideradas por acción.
+            percentile: Percentil de las muestras usado como base del tiempo límite.
+            margin: Factor de seguridad aplicado sobre ese percentil.
+            min_samples: Muestras necesarias antes de ajustar los tiempos.
+            alpha: Peso de la última muestra en la EWMA.
+            floor: Tiempo límite mínimo, en segundos.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.window = window
+        self.percentile = percentile
+        self.margin = margin
+        self.min_samples = min_samples
+        self.alpha = alpha
+        self.floor = floor
+        self._samples: Dict[str, Deque[float]] = {}
+        self._ewma: Dict[str, float] = {}
+        self.dirty = False
+
+    def record(self, action: str, seconds: float) -> None:
+        """Registra la latencia observada (en segundos) de una acción."""
+        samples = self._samples.setdefault(action, deque(maxlen=self.window))
+        samples.append(seconds)
+        previous = self._ewma.get(action)
+        self._ewma[action] = seconds if previous is None else previous + self.alpha * (seconds - previous)
+        self.dirty = True
+
+    def sample_count(self, action: str) -> int:
+        return len(self._samples.get(action, ()))
+
+    def mean(self, action: str) -> Optional[float]:
+        """Media móvil exponencial de la acción, o None si no hay suficientes muestras."""
+        if self.sample_count(action) < self.min_samples:
+            return None
+        return self._ewma[action]
+
+    def quantile(self, action: str) -> Optional[float]:
+        """Percentil configurado de las muestras recientes, o None si no hay suficientes."""
+        if self.sample_count(action) < self.min_samples:
+            return None
+        ordered = sorted(self._samples[action])
+        index = min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)
+        return ordered[index]
+
+    def timeout_for(self, action: str, upper_bound: float) -> float:
+        """Tiempo límite efectivo de la acción, nunca mayor que `upper_bound` (el del perfil)."""
+        quantile = self.quantile(action)
+        if quantile is None:
+            return upper_bound
+        return min(upper_bound, max(self.floor, quantile * self.margin))
+
+    def first_poll_delay(self, action: str) -> float:
+        """Espera antes del primer sondeo: la mitad de la latencia media observada."""
+        mean = self.mean(action)
+        return 0.0 if mean is None else mean / 2
+
+    def to_dict(self) -> dict:
+        return {
+            "version": _FORMAT_VERSION,
+            "actions": {
+                action: {"samples": list(samples), "ewma": self._ewma[action]}
+                for action, samples in self._samples.items()
+            },
+        }
+
+    @classmethod
+    def load(cls, path: Path, **kwargs) -> 'LatencyModel':
+        """
+        Carga un modelo guardado con `save`. Si el archivo no existe, está dañado o
+        es de otra versión, retorna un modelo vacío (se vuelve a aprender).
+        """
+        model = cls(**kwargs)
+        if not path.is_file():
+            return model
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") != _FORMAT_VERSION:
+                model.logger.info(f"Modelo de latencia '{path}' de otra versión. Se descarta.")
+                return model
+            for action, entry in data["actions"].items():
+                model._samples[action] = deque((float(s) for s in entry["samples"]), maxlen=model.window)
+                model._ewma[action] = float(entry["ewma"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            model.logger.warning(f"No se pudo leer el modelo de latencia '{path}': {e}. Se empieza de cero.")
+            return cls(**kwargs)
+        model.logger.info(
+            "Modelo de latencia cargado: "
+            + ", ".join(f"{a}={model.sample_count(a)} muestras" for a in model._samples)
+        )
+        return model
+
+    def save(self, path: Path) -> None:
+        """Guarda el modelo de forma atómica (escritura a un temporal y reemplazo)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+        self.dirty = False
@@ -0,0 +1,260 @@
+# src/automation/common/mission.py
+"""
+Manifiesto declarativo de la misión: los estados de la FSM de cada tarea, sus
+acciones y las clases de error que se reintentan o hacen fallar la tarea.
+
+El manifiesto es un JSON opcional junto al perfil (`<perfil>.mission.json`).
+Sin él se usa `DEFAULT_MISSION`, el flujo histórico del bot. Formato:
+
+    {
+      "initial": "ENSURING_INITIAL_STATE",
+      "states": [
+        {"name": "ENSURING_INITIAL_STATE", "steps": [{"call": "ensure_initial_state"}], "next": "FINDING_PATIENT"},
+        {"name": "FINDING_PATIENT", "steps": [{"call": "find_patient"}], "next": "INITIATING_NEW_BILLING"},
+        {"name": "INITIATING_NEW_BILLING", "steps": [{"keys": "^n"},
+            {"wait": "main_window", "timeout_ms": 1500}], "next": "TASK_SUCCESSFUL"}
+      ],
+      "errors": {"retry": ["ApplicationStateNotReadyError", "ClipboardError"],
+                 "fail": ["PatientIDMismatchError", "PatientDataMismatchError"]}
+    }
+
+Cada paso tiene exactamente una operación:
+- `call`: una acción del handler (ver `MISSION_ACTIONS`).
+- `keys`: una secuencia en sintaxis de `send_keys` (se valida al compilar).
+- `enter`: escribe o pega un campo de la tarea (según [AutomationInput]);
+  admite `date_format` para las fechas.
+- `wait`: espera fija de `timeout_ms` a que la ventana principal
+  (`main_window`) complete un cambio de pantalla; admite `description`. No
+  sondea ni alimenta el modelo de latencia: sobre RDP la ventana del cliente
+  siempre está activa y no hay una señal observable (ver
+  `MainWindowHandler._settle`). A diferencia de `pause_ms`, no se omite en
+  modo optimista.
+- `pause_ms`: espera fija de cortesía (se omite en modo optimista).
+- `verify`: verifica al paciente cargado (`patient`).
+
+Sin `errors` se usan las clases de la misión por defecto. Los nombres de
+estado son miembros de `TaskState`. Un estado que verifica al paciente
+(`verify` o `call: find_patient`) marca el fin de la vía rápida del modo
+optimista. El manifiesto se compila una vez al cargar el perfil; el
+automator lo traduce después a una tabla de transiciones (ver
+`RemoteAutomator.initialize`).
+"""
+
+from dataclasses import dataclass, fields as dataclass_fields
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple, Type
+
+from src.automation.common.keyboard_map import parse_key_sequence
+from src.automation.common.states import TaskState
+from src.core import exceptions
+from src.core.models import FacturacionData
+
+
+class MissionOps:
+    """Operaciones admitidas en un paso del manifiesto."""
+    CALL = 'call'
+    KEYS = 'keys'
+    ENTER = 'enter'
+    WAIT = 'wait'
+    PAUSE = 'pause_ms'
+    VERIFY = 'verify'
+    ALL = (CALL, KEYS, ENTER, WAIT, PAUSE, VERIFY)
+
+
+# Acciones de `MainWindowHandler` invocables con `call` -> si reciben la tarea.
+MISSION_ACTIONS = MappingProxyType({
+    'ensure_initial_state': False,
+    'find_patient': True,
+    'validate_patient_loaded': True,
+    'initiate_new_billing': False,
+})
+# Acciones que terminan verificando al paciente.
+_VERIFYING_ACTIONS = frozenset({'find_patient', 'validate_patient_loaded'})
+_WAIT_PROBES = frozenset({'main_window'})
+_VERIFY_TARGETS = frozenset({'patient'})
+_TASK_FIELDS = frozenset(f.name for f in dataclass_fields(FacturacionData))
+# Estados que gestiona el propio automator y no pueden declararse en el manifiesto.
+_RESERVED_STATES = frozenset({TaskState.READY_FOR_NEW_TASK, TaskState.TASK_SUCCESSFUL, TaskState.TASK_FAILED})
+# Clases de error por defecto, si el manifiesto no declara `errors`.
+_DEFAULT_ERRORS = MappingProxyType({
+    'retry': ('ApplicationStateNotReadyError', 'ClipboardError'),
+    'fail': ('PatientIDMismatchError', 'PatientDataMismatchError'),
+})
+
+
+@dataclass(frozen=True)
+class MissionStep:
+    """
+    Un paso compilado.
+
+    Atributos:
+        op: Operación (ver `MissionOps`).
+        target: Acción, secuencia de teclas, campo o condición, según `op`.
+        seconds: Duración de `wait` o de `pause_ms`.
+        description: Texto para los logs de `wait`.
+        date_format: Formato de las fechas para `enter`.
+    """
+    op: str
+    target: str = ''
+    seconds: Optional[float] = None
+    description: Optional[str] = None
+    date_format: str = '%d/%m/%Y'
+
+
+@dataclass(frozen=True)
+class MissionState:
+    state: TaskState
+    steps: Tuple[MissionStep, ...]
+    next: TaskState
+    # True si al completar el estado el paciente queda verificado.
+    verifies: bool = False
+
+
+@dataclass(frozen=True)
+class MissionSpec:
+    """
+    Misión compilada.
+
+    Atributos:
+        initial: Primer estado de cada tarea.
+        states: Estado -> definición.
+        retryable: Errores que se reintentan (hasta `max_retries`).
+        fatal: Errores que hacen fallar la tarea sin reintentos.
+    """
+    initial: TaskState
+    states: Mapping[TaskState, MissionState]
+    retryable: Tuple[Type[Exception], ...]
+    fatal: Tuple[Type[Exception], ...]
+
+
+def compile_mission(manifest: Mapping[str, Any]) -> MissionSpec:
+    """
+    Valida y compila un manifiesto ya leído de JSON.
+
+    Raises:
+        ValueError: Si el manifiesto es inválido (estado, acción, campo,
+                    secuencia o clase de error desconocidos, o un flujo que no
+                    llega a TASK_SUCCESSFUL).
+    """
+    raw_states = manifest.get('states')
+    if not isinstance(raw_states, list) or not raw_states:
+        raise ValueError("El manifiesto de misión debe declarar una lista 'states' no vacía.")
+
+    states = {}
+    for raw in raw_states:
+        state = _state(raw.get('name'), "name")
+        if state in _RESERVED_STATES:
+            raise ValueError(f"El estado '{state.name}' lo gestiona el automator y no puede declararse.")
+        if state in states:
+            raise ValueError(f"El estado '{state.name}' está declarado más de una vez.")
+        steps = tuple(_compile_step(state, step) for step in raw.get('steps', ()))
+        if not steps:
+            raise ValueError(f"El estado '{state.name}' no declara ningún paso.")
+        states[state] = MissionState(
+            state=state,
+            steps=steps,
+            next=_state(raw.get('next'), f"next de {state.name}"),
+            verifies=any(
+                step.op == MissionOps.VERIFY or (step.op == MissionOps.CALL and step.target in _VERIFYING_ACTIONS)
+                for step in steps
+            ),
+        )
+
+    initial = _state(manifest.get('initial', raw_states[0].get('name')), "initial")
+    _check_flow(initial, states)
+
+    errors = manifest.get('errors', _DEFAULT_ERRORS)
+    retryable = _error_classes(errors.get('retry', ()))
+    fatal = _error_classes(errors.get('fail', ()))
+    overlap = set(retryable) & set(fatal)
+    if overlap:
+        raise ValueError(f"Errores declarados a la vez como 'retry' y 'fail': {sorted(c.__name__ for c in overlap)}.")
+
+    return MissionSpec(initial=initial, states=MappingProxyType(states), retryable=retryable, fatal=fatal)
+
+
+def _state(name: Any, where: str) -> TaskState:
+    try:
+        return TaskState[name]
+    except (KeyError, TypeError):
+        raise ValueError(f"Estado desconocido en el manifiesto ({where}): '{name}'.")
+
+
+def _compile_step(state: TaskState, raw: Mapping[str, Any]) -> MissionStep:
+    ops = [op for op in MissionOps.ALL if op in raw]
+    if len(ops) != 1:
+        raise ValueError(
+            f"Cada paso de '{state.name}' debe tener exactamente una operación de {MissionOps.ALL}: {raw}"
+        )
+    op = ops[0]
+    value = raw[op]
+
+    if op == MissionOps.CALL:
+        if value not in MISSION_ACTIONS:
+            raise ValueError(f"Acción desconocida en '{state.name}': '{value}'. Opciones: {sorted(MISSION_ACTIONS)}.")
+        return MissionStep(op=op, target=value)
+    if op == MissionOps.KEYS:
+        parse_key_sequence(value)  # Lanza ValueError si la secuencia está mal formada.
+        return MissionStep(op=op, target=value)
+    if op == MissionOps.ENTER:
+        if value not in _TASK_FIELDS:
+            raise ValueError(f"Campo desconocido en '{state.name}': '{value}'.")
+        return MissionStep(op=op, target=value, date_format=raw.get('date_format', MissionStep.date_format))
+    if op == MissionOps.WAIT:
+        if value not in _WAIT_PROBES:
+            raise ValueError(f"Condición de espera desconocida en '{state.name}': '{value}'. Opciones: {sorted(_WAIT_PROBES)}.")
+        if 'timeout_ms' not in raw:
+            raise ValueError(f"La espera '{value}' de '{state.name}' requiere 'timeout_ms'.")
+        if 'latency' in raw:
+            raise ValueError(
+                f"La espera '{value}' de '{state.name}' es un tiempo fijo y no admite 'latency': "
+                "no hay una señal observable de la que aprender."
+            )
+        return MissionStep(
+            op=op, target=value, seconds=float(raw['timeout_ms']) / 1000.0,
+            description=raw.get('description', state.name.lower()),
+        )
+    if op == MissionOps.PAUSE:
+        return MissionStep(op=op, seconds=float(value) / 1000.0)
+    if value not in _VERIFY_TARGETS:
+        raise ValueError(f"Verificación desconocida en '{state.name}': '{value}'. Opciones: {sorted(_VERIFY_TARGETS)}.")
+    return MissionStep(op=op, target=value)
+
+
+def _check_flow(initial: TaskState, states: Mapping[TaskState, MissionState]) -> None:
+    """Cada estado tiene un único sucesor: el recorrido desde `initial` debe llegar al éxito."""
+    visited = set()
+    current = initial
+    while current != TaskState.TASK_SUCCESSFUL:
+        if current not in states:
+            raise ValueError(f"El flujo de la misión llega al estado no declarado '{current.name}'.")
+        if current in visited:
+            raise ValueError(f"El flujo de la misión tiene un ciclo en '{current.name}' y nunca termina.")
+        visited.add(current)
+        current = states[current].next
+    unreachable = sorted(s.name for s in states if s not in visited)
+    if unreachable:
+        raise ValueError(f"Estados inalcanzables desde '{initial.name}': {unreachable}.")
+
+
+def _error_classes(names) -> Tuple[Type[Exception], ...]:
+    classes = []
+    for name in names:
+        error = getattr(exceptions, name, None)
+        if not (isinstance(error, type) and issubclass(error, exceptions.AutomationError)):
+            raise ValueError(f"Clase de error desconocida en el manifiesto: '{name}'.")
+        classes.append(error)
+    return tuple(classes)
+
+
+# Flujo histórico del bot, usado cuando el perfil no trae manifiesto.
+DEFAULT_MISSION_MANIFEST = {
+    'initial': TaskState.ENSURING_INITIAL_STATE.name,
+    'states': [
+        {'name': 'ENSURING_INITIAL_STATE', 'steps': [{'call': 'ensure_initial_state'}], 'next': 'FINDING_PATIENT'},
+        {'name': 'FINDING_PATIENT', 'steps': [{'call': 'find_patient'}], 'next': 'INITIATING_NEW_BILLING'},
+        {'name': 'INITIATING_NEW_BILLING', 'steps': [{'call': 'initiate_new_billing'}], 'next': 'TASK_SUCCESSFUL'},
+    ],
+    'errors': {name: list(classes) for name, classes in _DEFAULT_ERRORS.items()},
+}
+DEFAULT_MISSION = compile_mission(DEFAULT_MISSION_MANIFEST)
@@ -0,0 +1,145 @@
+# src/automation/common/readback.py
+"""
+Lectura en bloque de varios campos de la GUI en un solo viaje del portapapeles.
+
+En lugar de navegar y copiar campo por campo, una secuencia configurada en
+[AutomationReadback] selecciona una región (o copia varios campos a la vez) y
+un parser declarado en el perfil divide el contenido del portapapeles en
+valores con nombre. Cada nombre es un campo de `FacturacionData`, de modo que
+cualquier número de campos se verifica con una sola copia.
+
+Parsers disponibles:
+- `delimited`: separa el texto por `delimiter` y asigna las partes, en orden, a
+  los nombres de `fields`. El nombre `_` descarta la parte correspondiente.
+- `regex`: aplica `pattern` y usa sus grupos con nombre.
+"""
+
+import re
+from configparser import ConfigParser
+from dataclasses import dataclass, fields as dataclass_fields
+from datetime import date
+from typing import Dict, Optional, Tuple, Union
+
+from src.core.constants import ConfigKeys, ConfigSections
+from src.core.models import FacturacionData
+
+_TASK_FIELDS = frozenset(f.name for f in dataclass_fields(FacturacionData))
+
+
+@dataclass(frozen=True)
+class DelimitedReadbackParser:
+    delimiter: str
+    fields: Tuple[str, ...]
+
+    def parse(self, payload: str) -> Dict[str, str]:
+        """Raises: ValueError si el contenido tiene menos partes que campos declarados."""
+        parts = payload.strip('\r\n').split(self.delimiter)
+        if len(parts) < len(self.fields):
+            raise ValueError(f"Se esperaban {len(self.fields)} partes y se leyeron {len(parts)}.")
+        return {name: part.strip() for name, part in zip(self.fields, parts) if name != '_'}
+
+
+@dataclass(frozen=True)
+class RegexReadbackParser:
+    pattern: re.Pattern
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return tuple(self.pattern.groupindex)
+
+    def parse(self, payload: str) -> Dict[str, str]:
+        """Raises: ValueError si el contenido no coincide con el patrón."""
+        match = self.pattern.search(payload)
+        if match is None:
+            raise ValueError("El contenido no coincide con el patrón de lectura.")
+        return {name: value.strip() for name, value in match.groupdict().items() if value is not None}
+
+
+@dataclass(frozen=True)
+class ReadbackSpec:
+    """
+    Lectura en bloque compilada.
+
+    Atributos:
+        sequence: Teclas que seleccionan la región a copiar (antes del Ctrl+C).
+        parser: Divide el contenido copiado en campo -> valor.
+        date_format: Formato con el que la GUI muestra las fechas.
+    """
+    sequence: str
+    parser: Union[DelimitedReadbackParser, RegexReadbackParser]
+    date_format: str = '%d/%m/%Y'
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return tuple(name for name in self.parser.fields if name != '_')
+
+    def expected_values(self, task: FacturacionData) -> Dict[str, str]:
+        expected = {}
+        for name in self.fields:
+            value = getattr(task, name)
+            if value is None:
+                expected[name] = ''
+            elif isinstance(value, date):
+                expected[name] = value.strftime(self.date_format)
+            else:
+                expected[name] = str(value).strip()
+        return expected
+
+    def compare(self, task: FacturacionData, values: Dict[str, str]) -> Dict[str, Tuple[str, str]]:
+        """
+        Retorna campo -> (esperado, encontrado) para cada campo que no coincide.
+        La comparación ignora mayúsculas y espacios repetidos; un campo ausente
+        en `values` cuenta como discrepancia.
+        """
+        mismatches = {}
+        for name, expected in self.expected_values(task).items():
+            found = values.get(name, '')
+            if _normalize(found) != _normalize(expected):
+                mismatches[name] = (expected, found)
+        return mismatches
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+def compile_readback(config: ConfigParser) -> Optional[ReadbackSpec]:
+    """
+    Compila [AutomationReadback], o retorna None si el perfil no la declara.
+
+    Raises:
+        ValueError: Si el parser es desconocido, el patrón es inválido o algún
+                    campo no existe en `FacturacionData`.
+    """
+    if not config.has_section(ConfigSections.AUTOMATION_READBACK):
+        return None
+    section = config[ConfigSections.AUTOMATION_READBACK]
+    kind = section.get(ConfigKeys.READBACK_PARSER, 'delimited').strip().lower()
+
+    if kind == 'delimited':
+        # Permite escribir separadores como '\t' o '|' en el .ini.
+        delimiter = section.get(ConfigKeys.READBACK_DELIMITER, r'\t', raw=True).encode().decode('unicode_escape')
+        names = tuple(n.strip() for n in section.get(ConfigKeys.READBACK_FIELDS, '').split(',') if n.strip())
+        parser = DelimitedReadbackParser(delimiter=delimiter, fields=names)
+    elif kind == 'regex':
+        pattern = section.get(ConfigKeys.READBACK_PATTERN, raw=True)
+        if pattern is None:
+            raise ValueError(f"El parser 'regex' requiere la clave '{ConfigKeys.READBACK_PATTERN}'.")
+        try:
+            parser = RegexReadbackParser(re.compile(pattern))
+        except re.error as e:
+            raise ValueError(f"Patrón de lectura inválido: {e}")
+    else:
+        raise ValueError(f"Parser de lectura desconocido: '{kind}'. Opciones: delimited, regex.")
+
+    spec = ReadbackSpec(
+        sequence=section.get(ConfigKeys.READBACK_SEQUENCE, '^a'),
+        parser=parser,
+        date_format=section.get(ConfigKeys.READBACK_DATE_FORMAT, '%d/%m/%Y', raw=True),
+    )
+    if not spec.fields:
+        raise ValueError(f"[{ConfigSections.AUTOMATION_READBACK}] no declara ningún campo a verificar.")
+    unknown = sorted(set(spec.fields) - _TASK_FIELDS)
+    if unknown:
+        raise ValueError(f"Campos de lectura desconocidos en [{ConfigSections.AUTOMATION_READBACK}]: {unknown}.")
+    return spec
@@ -11,7 +11,10 @@ class TaskState(Enum):
     ENSURING_INITIAL_STATE = auto()
     FINDING_PATIENT = auto()
     INITIATING_NEW_BILLING = auto()
-    # En futuros hitos, añadiríamos: NAVIGATING_TO_INGRESO, FILLING_INGRESO_DATA, etc.
+    # Pasos previstos para próximos hitos; se activan declarándolos en el
+    # manifiesto de misión (ver `mission`), sin tocar el automator.
+    NAVIGATING_TO_INGRESO = auto()
+    FILLING_INGRESO_DATA = auto()
 
     # Estados terminales (final del ciclo para una tarea)
     TASK_SUCCESSFUL = auto()
@@ -0,0 +1,335 @@
+# src/automation/strategies/remote/async_automator.py
+"""
+Automatización de varias sesiones de escritorio remoto desde un único bucle de
+asyncio.
+
+Es el equivalente asíncrono de `ParallelAutomator`: cada sesión declarada en
+[AutomationSessions] (o, si no hay ninguna, la ventana de `window_title`) tiene
+su `AsyncRemoteControlFacade` y su `AsyncMainWindowHandler`, y toma tareas de
+una cola compartida. En lugar de un hilo por sesión, cada sesión es una
+corrutina que cede el bucle mientras espera a la GUI, así que coordinar muchas
+sesiones cuesta poco más que coordinar una.
+
+Cada tarea recorre la misma FSM declarada en el manifiesto de misión que usa
+`RemoteAutomator`, con sus reintentos y clases de error. Una tarea que supera
+`session_task_timeout` se cancela y retira a su sesión; una sesión que lanza
+una excepción se retira y su tarea vuelve a la cola. Los resultados se
+devuelven en el orden de entrada.
+
+Se ejecuta desde el Orchestrator con `SyncAutomatorAdapter`.
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.automation.abc.async_automator_interface import AsyncAutomatorInterface
+from src.automation.common.latency import LatencyModel
+from src.automation.common.results import TaskResult, TaskResultStatus
+from src.automation.common.states import TaskState
+from src.automation.strategies.remote.async_remote_control import AsyncRemoteControlFacade
+from src.automation.strategies.remote.automator import failure_screenshot_path
+from src.automation.strategies.remote.handlers.async_main_window_handler import AsyncMainWindowHandler
+from src.core.constants import ConfigKeys, ConfigSections
+from src.core.exceptions import AutomationError
+from src.core.models import FacturacionData
+from src.core.profile import AutomationSpec, ProfileSpec, SessionSpec
+
+Step = Callable[[FacturacionData], Awaitable[None]]
+
+
+class _AsyncSession:
+    """Estado de ejecución de una sesión dentro de `AsyncRemoteAutomator`."""
+
+    def __init__(self, spec: SessionSpec, facade: AsyncRemoteControlFacade, logger: logging.Logger):
+        self.spec = spec
+        self.facade = facade
+        self.logger = logger
+        self.transitions: Dict[TaskState, Tuple[Step, TaskState]] = {}
+        self.latency_path: Optional[Path] = None
+        # Índice de la tarea en curso, o None si está libre.
+        self.current: Optional[int] = None
+        self.retired = False
+        self.completed = 0
+
+
+class AsyncRemoteAutomator(AsyncAutomatorInterface):
+    """Procesa las tareas en N sesiones concurrentes dentro de un bucle de asyncio (ver módulo)."""
+
+    def __init__(
+        self,
+        latency_dir: Optional[Path] = Path("data/latency"),
+        facade_factory: Callable[[], AsyncRemoteControlFacade] = AsyncRemoteControlFacade,
+    ):
+        """
+        Args:
+            latency_dir: Directorio de los modelos de latencia (uno por sesión).
+                         Si es None, no se persisten.
+            facade_factory: Construye la fachada de cada sesión.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.latency_dir = latency_dir
+        self._facade_factory = facade_factory
+        self.settings: Optional[AutomationSpec] = None
+        self.sessions: List[_AsyncSession] = []
+        self.max_retries = 0
+        self._initial_state = TaskState.ENSURING_INITIAL_STATE
+        self._retryable_errors: Tuple[type, ...] = ()
+        self._fatal_errors: Tuple[type, ...] = ()
+        # Avisa a las sesiones libres de que otra terminó o se retiró (ver `_next_task`).
+        self._changed: Optional[asyncio.Condition] = None
+
+    async def initialize(self, profile: ProfileSpec) -> None:
+        """
+        Inicializa todas las sesiones a la vez. Las que fallan se descartan;
+        basta con que una quede lista para continuar.
+
+        Raises:
+            RuntimeError: Si el perfil no declara ventana ni sesiones, o si
+                          ninguna sesión pudo inicializarse.
+        """
+        self.settings = profile.automation
+        specs = self.settings.sessions
+        if not specs:
+            if not self.settings.window_title:
+                self.logger.critical(
+                    f"La automatización requiere la clave '{ConfigKeys.WINDOW_TITLE}' en '[{ConfigSections.AUTOMATION}]' "
+                    f"o la sección '[{ConfigSections.AUTOMATION_SESSIONS}]' en el perfil."
+                )
+                raise RuntimeError("Configuración de automatización incompleta.")
+            specs = (SessionSpec(name=profile.name, window_title=self.settings.window_title),)
+        if self.settings.calibrate_session or self.settings.optimistic_mode:
+            self.logger.info("La calibración de sesión y el modo optimista no aplican al automator asíncrono; se omiten.")
+
+        mission = self.settings.mission
+        self._initial_state = mission.initial
+        self._retryable_errors = mission.retryable
+        self._fatal_errors = mission.fatal
+        self.max_retries = self.settings.max_retries
+
+        self.logger.info(f"Inicializando {len(specs)} sesiones en un único bucle de eventos...")
+        outcomes = await asyncio.gather(*(self._initialize_session(profile, spec) for spec in specs))
+        self.sessions = [session for session in outcomes if session is not None]
+        if not self.sessions:
+            raise RuntimeError("Ninguna sesión de automatización pudo inicializarse.")
+        self.logger.info(
+            f"{len(self.sessions)}/{len(specs)} sesiones listas: {', '.join(s.spec.name for s in self.sessions)}."
+        )
+
+    async def _initialize_session(self, profile: ProfileSpec, spec: SessionSpec) -> Optional[_AsyncSession]:
+        facade = self._facade_factory()
+        facade.display_name = spec.display
+        facade.poll_interval = self.settings.poll_interval
+        facade.key_pause = self.settings.key_pause
+        facade.linux_backend = self.settings.linux_backend
+        session = _AsyncSession(spec, facade, logging.getLogger(f"{self.__class__.__name__}[{spec.name}]"))
+        self._load_latency_model(session, profile)
+        try:
+            await facade.find_and_focus_window(spec.window_title)
+            handler = AsyncMainWindowHandler(remote_control=facade, settings=self.settings)
+            session.transitions = {
+                state: (self._bind_steps(handler, state_spec.steps), state_spec.next)
+                for state, state_spec in self.settings.mission.states.items()
+            }
+        except Exception as e:
+            self.logger.error(f"La sesión '{spec.name}' no pudo inicializarse y se descarta: {e}")
+            facade.close()
+            return None
+        return session
+
+    @staticmethod
+    def _bind_steps(handler: AsyncMainWindowHandler, steps) -> Step:
+        bound = [handler.bind_step(step) for step in steps]
+        if len(bound) == 1:
+            return bound[0]
+
+        async def run(task: FacturacionData) -> None:
+            for step in bound:
+                await step(task)
+        return run
+
+    async def process_billing_tasks(self, tasks: Sequence[FacturacionData]) -> List[TaskResult]:
+        if not self.sessions:
+            raise RuntimeError("El automator asíncrono no puede procesar tareas porque no tiene sesiones inicializadas.")
+
+        active = [session for session in self.sessions if not session.retired]
+        self.logger.info(f"Iniciando el procesamiento de {len(tasks)} tareas en {len(active)} sesiones.")
+        pending: "asyncio.Queue[int]" = asyncio.Queue()
+        for index in range(len(tasks)):
+            pending.put_nowait(index)
+        results: List[Optional[TaskResult]] = [None] * len(tasks)
+        self._changed = asyncio.Condition()
+
+        await asyncio.gather(*(self._run_session(session, active, tasks, pending, results) for session in active))
+
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = TaskResult(
+                    status=TaskResultStatus.FAILED_UNEXPECTED_ERROR,
+                    task_identifier=tasks[index].numero_historia,
+                    message="No quedó ninguna sesión disponible para procesar la tarea.",
+                )
+        self.logger.info(
+            "Procesamiento asíncrono finalizado. Tareas por sesión: "
+            + ", ".join(f"{s.spec.name}={s.completed}" for s in active)
+        )
+        return results
+
+    async def _run_session(
+        self,
+        session: _AsyncSession,
+        peers: List[_AsyncSession],
+        tasks: Sequence[FacturacionData],
+        pending: "asyncio.Queue[int]",
+        results: List[Optional[TaskResult]],
+    ) -> None:
+        """Bucle de trabajo de una sesión: toma tareas de la cola hasta vaciarla."""
+        timeout = self.settings.session_task_timeout or None
+        try:
+            while True:
+                index = await self._next_task(session, peers, pending)
+                if index is None:
+                    return
+                session.current = index
+                task = tasks[index]
+                session.logger.info(f"--- [ Tarea {index + 1}/{len(tasks)} ] Procesando Historia Clínica: {task.numero_historia} ---")
+                try:
+                    results[index] = await asyncio.wait_for(self._process_task(session, task), timeout)
+                except asyncio.TimeoutError:
+                    session.logger.error(
+                        f"La tarea {task.numero_historia} superó {timeout:.0f} s; la sesión se da por perdida y deja de recibir tareas."
+                    )
+                    session.retired = True
+                    results[index] = TaskResult(
+                        status=TaskResultStatus.FAILED_UNEXPECTED_ERROR,
+                        task_identifier=task.numero_historia,
+                        message=f"La sesión '{session.spec.name}' no respondió en {timeout:.0f} s.",
+                    )
+                    return
+                except Exception as e:
+                    session.logger.error(f"La sesión falló y se retira; su tarea vuelve a la cola. Error: {e}")
+                    session.retired = True
+                    pending.put_nowait(index)
+                    return
+                session.completed += 1
+                session.current = None
+                async with self._changed:
+                    self._changed.notify_all()
+        finally:
+            session.current = None
+            async with self._changed:
+                self._changed.notify_all()
+
+    async def _next_task(
+        self, session: _AsyncSession, peers: List[_AsyncSession], pending: "asyncio.Queue[int]"
+    ) -> Optional[int]:
+        """
+        Toma el índice de la siguiente tarea, o None si la sesión debe terminar.
+        Con la cola vacía, espera mientras otra sesión tenga una tarea en curso:
+        si esa sesión falla, su tarea vuelve a la cola.
+        """
+        async with self._changed:
+            while not session.retired:
+                if not pending.empty():
+                    return pending.get_nowait()
+                if not any(p.current is not None for p in peers if p is not session and not p.retired):
+                    return None
+                await self._changed.wait()
+        return None
+
+    async def _process_task(self, session: _AsyncSession, task: FacturacionData) -> TaskResult:
+        """Recorre la FSM de la misión para una tarea (ver `RemoteAutomator.process_billing_tasks`)."""
+        logger = session.logger
+        current_state = TaskState.READY_FOR_NEW_TASK
+        retry_count = 0
+        while True:
+            try:
+                transition = session.transitions.get(current_state)
+                if transition is not None:
+                    run, next_state = transition
+                    await run(task)
+                    if next_state == TaskState.TASK_SUCCESSFUL:
+                        await session.facade.flush()
+                    current_state = next_state
+                elif current_state == TaskState.READY_FOR_NEW_TASK:
+                    retry_count = 0
+                    current_state = self._initial_state
+                elif current_state == TaskState.TASK_SUCCESSFUL:
+                    logger.info(f"Tarea para la historia {task.numero_historia} COMPLETADA con éxito.")
+                    return TaskResult(status=TaskResultStatus.SUCCESS, task_identifier=task.numero_historia)
+
+            except self._retryable_errors as e:
+                session.facade.discard_pending_keys()
+                logger.warning(f"Error REINTENTABLE en estado {current_state.name}: {e}")
+                if retry_count >= self.max_retries:
+                    logger.error(f"Se alcanzó el máximo de reintentos ({self.max_retries}). La tarea ha fallado.")
+                    return TaskResult(
+                        status=TaskResultStatus.FAILED_RETRY_LIMIT, task_identifier=task.numero_historia,
+                        message=str(e), failed_at_state=current_state,
+                    )
+                retry_count += 1
+                logger.info(f"Intentando de nuevo... (Intento {retry_count}/{self.max_retries})")
+                await session.facade.wait(1.0)
+
+            except self._fatal_errors as e:
+                session.facade.discard_pending_keys()
+                logger.critical(f"Error CRÍTICO NO REINTENTABLE en estado {current_state.name}: {e}")
+                return TaskResult(
+                    status=TaskResultStatus.FAILED_UNRECOVERABLE, task_identifier=task.numero_historia,
+                    message=str(e), failed_at_state=current_state,
+                )
+
+            except Exception as e:
+                session.facade.discard_pending_keys()
+                logger.critical(
+                    f"Error INESPERADO en estado {current_state.name}. La tarea ha fallado. Error: {e}", exc_info=True
+                )
+                try:
+                    await session.facade.take_screenshot(failure_screenshot_path(task, current_state))
+                except Exception as screenshot_err:
+                    logger.warning(f"Falló la captura de pantalla de diagnóstico: {screenshot_err}")
+                return TaskResult(
+                    status=TaskResultStatus.FAILED_UNEXPECTED_ERROR, task_identifier=task.numero_historia,
+                    message=str(e), failed_at_state=current_state,
+                )
+
+    def _load_latency_model(self, session: _AsyncSession, profile: ProfileSpec) -> None:
+        """Asigna a la fachada de la sesión su modelo de latencia, si está habilitado."""
+        if not self.settings.adaptive_timeouts:
+            return
+        if self.latency_dir is None:
+            session.facade.latency_model = LatencyModel()
+            return
+        # Con una sola ventana (sin [AutomationSessions]) se comparte el archivo de `RemoteAutomator`.
+        suffix = f".{session.spec.name}" if self.settings.sessions else ""
+        session.latency_path = self.latency_dir / f"{profile.name}{suffix}.json"
+        session.facade.latency_model = LatencyModel.load(session.latency_path)
+
+    def _close_session(self, session: _AsyncSession) -> None:
+        model = session.facade.latency_model
+        if model is not None and session.latency_path is not None and model.dirty:
+            try:
+                model.save(session.latency_path)
+            except OSError as e:
+                session.logger.warning(f"No se pudo guardar el modelo de latencia: {e}")
+        if session.facade.action_costs:
+            session.logger.info(f"Coste medio por acción del backend: {session.facade.describe_action_costs()}")
+        session.facade.close()
+
+    async def shutdown(self) -> None:
+        self.logger.info("Finalizando todas las sesiones.")
+        for session in self.sessions:
+            try:
+                await session.facade.flush()
+            except AutomationError as e:
+                session.logger.warning(f"No se pudieron enviar las teclas pendientes al finalizar: {e}")
+        # Guardar modelos y cerrar conexiones es E/S bloqueante: cada sesión se cierra en un hilo, a la vez.
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(self._close_session, session) for session in self.sessions), return_exceptions=True
+        )
+        for session, outcome in zip(self.sessions, outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.warning(f"Falló el cierre de la sesión '{session.spec.name}': {outcome}")
+        self.sessions = []
+        self.settings = None
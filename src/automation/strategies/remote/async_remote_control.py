@@ -0,0 +1,225 @@
+# src/automation/strategies/remote/async_remote_control.py
+"""
+Variante asíncrona de la Fachada de Control Remoto, para coordinar muchas
+sesiones desde un único bucle de asyncio (ver `AsyncRemoteAutomator`).
+
+Comparte con `RemoteControlFacade` su base (`BaseRemoteControlFacade`: backend,
+display, modelo de latencia, búfer de teclas, costes por acción) y el plan de
+las esperas (`WaitSchedule`); lo que cambia es que todo método que espera o
+hace E/S es una corrutina:
+- Las esperas usan `asyncio.sleep`, de modo que otras sesiones avanzan mientras tanto.
+- Las llamadas a xdotool son subprocesos de asyncio; las de python-xlib se hacen
+  en el propio bucle y el teclado XTest solo cede en la pausa entre teclas (ver
+  `WindowBackend.*_async`).
+- El portapapeles nativo despierta al bucle cuando cambia (ver `X11Clipboard._wait_async`);
+  pyperclip y las capturas de pantalla, que bloquean, van a un hilo.
+
+`type_keys` sigue siendo síncrono: solo encola teclas. Por ahora solo Linux.
+"""
+
+import asyncio
+import inspect
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from src.automation.strategies.remote import probes
+from src.automation.strategies.remote.backends.x11_clipboard import X11Clipboard
+from src.automation.strategies.remote.remote_control import BaseRemoteControlFacade, _pyperclip
+from src.core.constants import LatencyActions
+from src.core.exceptions import AutomationError, ClipboardError, FocusError, ReadinessTimeoutError
+
+
+class AsyncRemoteControlFacade(BaseRemoteControlFacade):
+    """Fachada de control remoto cuyas acciones de E/S son corrutinas (ver módulo)."""
+
+    async def find_and_focus_window(self, title: str) -> None:
+        """
+        Busca una ventana por su título y la trae al frente.
+
+        Raises:
+            FocusError: Si la ventana no puede ser encontrada o activada.
+            NotImplementedError: Fuera de Linux.
+        """
+        if not sys.platform.startswith('linux'):
+            raise NotImplementedError(f"La fachada asíncrona no está implementada para: {sys.platform}")
+        self.logger.info(f"Buscando y enfocando ventana con título: '{title}'")
+
+        backend = self._linux_backend()
+        try:
+            with self._timed('find_window'):
+                self.window_id = await backend.find_window_async(title)
+            self.logger.info(f"Ventana encontrada con ID: {self.window_id} (backend {backend.name})")
+            self._start_focus_tracker()
+            with self._timed('activate'):
+                await backend.activate_async(self.window_id)
+        except FocusError as e:
+            self.logger.critical(f"No se pudo encontrar o activar la ventana '{title}'. Error: {e}")
+            raise
+        try:
+            await self.wait_until(probes.window_active(self), timeout=0.5, description="ventana activada")
+        except ReadinessTimeoutError:
+            self.logger.warning("La ventana no se reporta como activa tras activarla; se verificará antes de cada acción.")
+
+    async def is_window_active(self) -> bool:
+        if self.focus_tracker is not None and self.focus_tracker.running:
+            return self.focus_tracker.is_active(int(self.window_id))
+        with self._timed('active_window'):
+            return await self._linux_backend().active_window_async() == self.window_id
+
+    async def _ensure_focus(self) -> None:
+        if self.window_id is None:
+            raise FocusError("La ventana no ha sido inicializada. Llama a 'find_and_focus_window' primero.")
+        if await self.is_window_active():
+            return
+        self.logger.warning("Ventana perdió el foco. Intentando recuperarlo...")
+        with self._timed('activate'):
+            await self._linux_backend().activate_async(self.window_id)
+        try:
+            await self.wait_until(probes.window_active(self), timeout=0.5, description="foco recuperado")
+        except ReadinessTimeoutError as e:
+            raise FocusError("No se pudo recuperar el foco de la ventana.") from e
+
+    async def wait(self, seconds: float) -> None:
+        """Pausa esta sesión sin detener a las demás."""
+        await self.flush()
+        self.logger.debug(f"Pausando ejecución por {seconds:.2f} segundos.")
+        await asyncio.sleep(seconds)
+
+    async def wait_until(
+        self,
+        condition: Callable[[], Any],
+        timeout: float,
+        poll_interval: Optional[float] = None,
+        backoff: float = 1.5,
+        max_interval: float = 0.5,
+        description: str = "condición de disponibilidad",
+        action: Optional[str] = None,
+        exhaust_upper_bound: bool = False,
+    ) -> Any:
+        """
+        Como `RemoteControlFacade.wait_until`, pero `condition` puede devolver
+        una corrutina (se espera su resultado) y el intervalo entre sondeos
+        cede el bucle.
+
+        Raises:
+            ReadinessTimeoutError: Si la condición no se cumple a tiempo.
+        """
+        await self.flush()
+        schedule = self._wait_schedule(
+            timeout, poll_interval, backoff, max_interval, description, action, exhaust_upper_bound
+        )
+        if schedule.first_delay > 0:
+            await asyncio.sleep(schedule.first_delay)
+        while True:
+            try:
+                result = condition()
+                if inspect.isawaitable(result):
+                    result = await result
+            except AutomationError as e:
+                if not e.is_retryable:
+                    raise
+                schedule.failed(e)
+            else:
+                if schedule.satisfied(result):
+                    return result
+            await asyncio.sleep(schedule.next_delay())
+
+    async def flush(self) -> None:
+        """Envía las teclas encoladas con foco garantizado (ver `RemoteControlFacade.flush`)."""
+        if not self._pending_keys:
+            return
+        pending, self._pending_keys = self._pending_keys, []
+        await self._ensure_focus()
+        backend = self._linux_backend()
+        for keys, pause in pending:
+            self.logger.info(f"Enviando teclas: '{keys}'")
+            with self._timed('send_keys'):
+                await backend.send_keys_async(keys, pause)
+
+    async def paste_clipboard(self) -> str:
+        clipboard = self._native_clipboard()
+        if clipboard is not None:
+            content = await clipboard.read_async(timeout=1.0)
+            if content is None:
+                raise ClipboardError("El propietario del portapapeles no entregó su contenido.")
+            return content
+        pyperclip = _pyperclip()
+        try:
+            return await asyncio.to_thread(pyperclip.paste)
+        except pyperclip.PyperclipException as e:
+            raise ClipboardError("Fallo técnico al leer el contenido del portapapeles.") from e
+
+    async def copy_to_clipboard(self, text: str, timeout: float = 1.0) -> None:
+        clipboard = self._native_clipboard()
+        if clipboard is not None:
+            clipboard.write(text)
+            return
+
+        pyperclip = _pyperclip()
+        try:
+            await asyncio.to_thread(pyperclip.copy, text)
+        except pyperclip.PyperclipException as e:
+            raise ClipboardError("Fallo técnico al copiar texto al portapapeles.") from e
+
+        async def published() -> bool:
+            return await self.paste_clipboard() == text
+        try:
+            await self.wait_until(published, timeout=timeout, description="texto publicado en el portapapeles")
+        except ReadinessTimeoutError as e:
+            raise ClipboardError("El portapapeles no refleja el texto copiado.") from e
+
+    async def paste_text(self, text: str, timeout: float = 1.0) -> None:
+        await self.flush()
+        await self.copy_to_clipboard(text, timeout)
+        self.type_keys('^v')
+        await self.flush()
+
+    async def read_clipboard_with_sentinel(self, timeout: float = 1.0) -> str:
+        """
+        Copia el campo con el foco y retorna su contenido (ver
+        `RemoteControlFacade.read_clipboard_with_sentinel`).
+
+        Raises:
+            ClipboardError: Si la operación de copia/lectura falla.
+        """
+        clipboard = self._native_clipboard()
+        if clipboard is not None:
+            return await self._read_clipboard_native(clipboard, timeout)
+
+        pyperclip = _pyperclip()
+        sentinel = f"__SENTINEL_{time.monotonic()}__"
+        try:
+            await asyncio.to_thread(pyperclip.copy, sentinel)
+        except pyperclip.PyperclipException as e:
+            raise ClipboardError("Fallo técnico al copiar el centinela al portapapeles.") from e
+
+        self.type_keys('^c')
+        await self.flush()
+
+        async def changed() -> Optional[str]:
+            content = await self.paste_clipboard()
+            return None if content == sentinel else content
+        try:
+            content = await self.wait_until(
+                changed, timeout=timeout, description="copia al portapapeles", action=LatencyActions.CLIPBOARD_COPY
+            )
+        except ReadinessTimeoutError as e:
+            raise ClipboardError("La operación de copia no tuvo efecto (el centinela persiste).") from e
+        return content
+
+    async def _read_clipboard_native(self, clipboard: X11Clipboard, timeout: float) -> str:
+        await self.flush()
+        start = time.monotonic()
+        since = clipboard.owner_changes
+        self.type_keys('^c')
+        await self.flush()
+        if not await clipboard.wait_for_owner_change_async(since, timeout):
+            raise ClipboardError("La operación de copia no tuvo efecto (el portapapeles no cambió de propietario).")
+        content = await clipboard.read_async(timeout=max(0.0, start + timeout - time.monotonic()))
+        return self._native_read_result(content, start)
+
+    async def take_screenshot(self, file_path: Path) -> None:
+        """Toma y guarda la captura en un hilo: codificar y escribir la imagen no bloquea a las demás sesiones."""
+        await asyncio.to_thread(self._capture_screenshot, file_path)
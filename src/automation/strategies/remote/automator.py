@@ -1,25 +1,35 @@
 # src/automation/strategies/remote/automator.py
 
 import logging
-from configparser import ConfigParser, NoOptionError, NoSectionError
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from src.automation.abc.automator_interface import AutomatorInterface
+from src.automation.common.latency import LatencyModel
+from src.automation.common.mission import MissionSpec
 from src.automation.common.results import TaskResult, TaskResultStatus
 from src.automation.common.states import TaskState
+from src.automation.strategies.remote.calibration import SessionPerformanceProfile, calibrate
 from src.automation.strategies.remote.handlers.main_window_handler import (
     MainWindowHandler,
 )
 from src.automation.strategies.remote.remote_control import RemoteControlFacade
-from src.core.constants import ConfigSections
-from src.core.exceptions import (
-    ApplicationStateNotReadyError,
-    ClipboardError,
-    PatientIDMismatchError,
-)
+from src.core.constants import ConfigKeys, ConfigSections
+from src.core.exceptions import AutomationError
 from src.core.models import FacturacionData
+from src.core.profile import AutomationSpec, ProfileSpec
+
+# Tareas optimistas consecutivas que pueden fallar antes de desactivar el modo optimista.
+_MAX_CONSECUTIVE_FALLBACKS = 3
+
+
+def failure_screenshot_path(task: FacturacionData, state: TaskState) -> Path:
+    """Ruta de la captura de diagnóstico de una tarea que falló en `state`."""
+    # Limpia el identificador de la tarea para crear un nombre de archivo seguro.
+    safe_task_id = "".join(c for c in task.numero_historia if c.isalnum() or c in ('-', '_')).rstrip()
+    filename = f"FAILURE_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{safe_task_id}_{state.name}.png"
+    return Path("data/output/screenshots") / filename
 
 
 class RemoteAutomator(AutomatorInterface):
@@ -29,59 +39,95 @@ class RemoteAutomator(AutomatorInterface):
     para el proceso de interacción con la GUI.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        latency_dir: Optional[Path] = Path("data/latency"),
+        session_name: Optional[str] = None,
+        display_name: Optional[str] = None,
+    ):
         """
         Prepara el automator, inicializando sus componentes principales.
         En esta fase, los handlers aún no se instancian, ya que dependen
         de una conexión exitosa con la ventana de destino.
+
+        Args:
+            latency_dir: Directorio donde se guarda el modelo de latencia de cada
+                         perfil entre ejecuciones. Si es None, no se persiste.
+            session_name: Nombre de la sesión cuando el automator es una de varias
+                          (ver `ParallelAutomator`); separa sus logs y su modelo de latencia.
+            display_name: Display de X de la sesión; None usa `$DISPLAY`.
         """
-        self.logger = logging.getLogger(self.__class__.__name__)
+        self.session_name = session_name
+        self.logger = logging.getLogger(
+            self.__class__.__name__ if session_name is None else f"{self.__class__.__name__}[{session_name}]"
+        )
         self.facade = RemoteControlFacade()
-        self.config: ConfigParser | None = None
+        self.facade.display_name = display_name
+        self.settings: AutomationSpec | None = None
         self.main_window_handler: MainWindowHandler | None = None
         self.max_retries: int = 0
+        self.latency_dir = latency_dir
+        self._latency_path: Optional[Path] = None
+        self.session_profile: Optional[SessionPerformanceProfile] = None
+        # Modo optimista: se desactiva solo tras varias tareas seguidas que necesitaron repetirse.
+        self.optimistic_enabled = False
+        self.optimistic_stats = {'fast': 0, 'fallback': 0}
+        self._consecutive_fallbacks = 0
+        # Tabla de transiciones compilada del manifiesto de misión (ver `_compile_transitions`).
+        self._transitions: Dict[TaskState, Tuple[Callable[[FacturacionData], None], TaskState, bool]] = {}
+        self._initial_state = TaskState.ENSURING_INITIAL_STATE
+        self._retryable_errors: Tuple[type, ...] = ()
+        self._fatal_errors: Tuple[type, ...] = ()
 
-    def initialize(self, config: ConfigParser) -> None:
+    def initialize(self, profile: ProfileSpec) -> None:
         """
         Establece la conexión con la aplicación de destino y, si tiene éxito,
         inicializa todos los handlers necesarios, inyectando sus dependencias.
         """
         self.logger.info("Inicializando el automator remoto...")
-        self.config = config
+        self.settings = profile.automation
 
-        try:
-            window_title = self.config.get(
-                ConfigSections.AUTOMATION, "window_title"
+        if not self.settings.window_title:
+            self.logger.critical(
+                f"La configuración de automatización es inválida. "
+                f"Asegúrese de que la sección '[{ConfigSections.AUTOMATION}]' y la clave '{ConfigKeys.WINDOW_TITLE}' existan en el perfil."
             )
-            self.facade.find_and_focus_window(window_title)
+            raise RuntimeError("Configuración de automatización incompleta.")
+
+        self.facade.poll_interval = self.settings.poll_interval
+        self.facade.key_pause = self.settings.key_pause
+        self.facade.linux_backend = self.settings.linux_backend
+        self._load_latency_model(profile.name)
+        try:
+            self.facade.find_and_focus_window(self.settings.window_title)
             self.logger.info(
                 "Conexión con la ventana de destino establecida exitosamente."
             )
 
             self.main_window_handler = MainWindowHandler(
-                remote_control=self.facade, config=self.config
-            )
-            self.max_retries = self.config.getint(
-                "AutomationRetries", "max_retries", fallback=1
+                remote_control=self.facade, settings=self.settings
             )
+            if self.settings.calibrate_session:
+                self.main_window_handler.ensure_initial_state()
+                self.session_profile = calibrate(
+                    self.facade, self.settings.key_pause, self.settings.clipboard_timeout
+                )
+
+            self._compile_transitions(self.settings.mission)
+            self.optimistic_enabled = self.settings.optimistic_mode
+            self.max_retries = self.settings.max_retries
             self.logger.info(
                 f"Configuración de reintentos cargada: {self.max_retries} reintentos máximos por acción."
             )
             self.logger.info("Todos los handlers de automatización han sido inicializados.")
 
-        except (NoSectionError, NoOptionError) as e:
-            self.logger.critical(
-                f"La configuración de automatización es inválida. "
-                f"Asegúrese de que la sección '[{ConfigSections.AUTOMATION}]' y la clave 'window_title' existan en el perfil."
-            )
-            raise RuntimeError("Configuración de automatización incompleta.") from e
         except Exception as e:
             self.logger.critical(
                 f"Falló la inicialización del automator: {e}", exc_info=True
             )
             raise
 
-    def process_billing_tasks(self, tasks: List[FacturacionData]) -> List[TaskResult]:
+    def process_billing_tasks(self, tasks: Sequence[FacturacionData]) -> List[TaskResult]:
         task_count = len(tasks)
         self.logger.info(f"Iniciando el procesamiento de {task_count} tarea{'s' if task_count != 1 else ''}.")
         
@@ -97,29 +143,40 @@ class RemoteAutomator(AutomatorInterface):
 
             current_state = TaskState.READY_FOR_NEW_TASK
             retry_count = 0
+            # En modo optimista, los estados previos a la verificación del paciente
+            # corren sin esperas de cortesía. Si algo falla antes de verificar, la
+            # tarea vuelve al último estado verificado (el inicio) y se repite con
+            # los tiempos completos, sin consumir reintentos.
+            optimistic = self.optimistic_enabled
+            unverified = optimistic
             
             while True:
                 self.logger.debug(f"Estado actual: {current_state.name}, Reintentos: {retry_count}")
                 
                 try:
-                    if current_state == TaskState.READY_FOR_NEW_TASK:
-                        retry_count = 0
-                        current_state = TaskState.ENSURING_INITIAL_STATE
-
-                    elif current_state == TaskState.ENSURING_INITIAL_STATE:
-                        self.main_window_handler.ensure_initial_state()
-                        current_state = TaskState.FINDING_PATIENT
-
-                    elif current_state == TaskState.FINDING_PATIENT:
-                        self.main_window_handler.find_patient(task)
-                        current_state = TaskState.INITIATING_NEW_BILLING
+                    transition = self._transitions.get(current_state)
+                    if transition is not None:
+                        run, next_state, verifies = transition
+                        run(task)
+                        if next_state == TaskState.TASK_SUCCESSFUL:
+                            # Las teclas que el último estado dejó en el búfer deben
+                            # llegar a la GUI antes de dar la tarea por completada.
+                            self.facade.flush()
+                        if verifies:
+                            # El paciente quedó verificado: a partir de aquí no hay rebobinado.
+                            unverified = False
+                        current_state = next_state
 
-                    elif current_state == TaskState.INITIATING_NEW_BILLING:
-                        self.main_window_handler.initiate_new_billing()
-                        current_state = TaskState.TASK_SUCCESSFUL
+                    elif current_state == TaskState.READY_FOR_NEW_TASK:
+                        retry_count = 0
+                        self.main_window_handler.optimistic = optimistic
+                        current_state = self._initial_state
 
                     elif current_state == TaskState.TASK_SUCCESSFUL:
                         self.logger.info(f"Tarea para la historia {task.numero_historia} COMPLETADA con éxito.")
+                        if optimistic:
+                            self.optimistic_stats['fast'] += 1
+                            self._consecutive_fallbacks = 0
                         results.append(TaskResult(
                             status=TaskResultStatus.SUCCESS,
                             task_identifier=task.numero_historia
@@ -130,7 +187,12 @@ class RemoteAutomator(AutomatorInterface):
                         self.logger.error(f"Tarea para la historia {task.numero_historia} FALLÓ y no se pudo recuperar.")
                         break
 
-                except (ApplicationStateNotReadyError, ClipboardError) as e:
+                except self._retryable_errors as e:
+                    self.facade.discard_pending_keys()
+                    if unverified:
+                        current_state = self._fall_back_to_conservative(current_state, e)
+                        optimistic = unverified = False
+                        continue
                     self.logger.warning(f"Error REINTENTABLE en estado {current_state.name}: {e}")
                     if retry_count < self.max_retries:
                         retry_count += 1
@@ -146,7 +208,12 @@ class RemoteAutomator(AutomatorInterface):
                         ))
                         current_state = TaskState.TASK_FAILED
                 
-                except PatientIDMismatchError as e:
+                except self._fatal_errors as e:
+                    self.facade.discard_pending_keys()
+                    if unverified:
+                        current_state = self._fall_back_to_conservative(current_state, e)
+                        optimistic = unverified = False
+                        continue
                     self.logger.critical(f"Error CRÍTICO NO REINTENTABLE en estado {current_state.name}: {e}")
                     results.append(TaskResult(
                         status=TaskResultStatus.FAILED_UNRECOVERABLE,
@@ -157,6 +224,11 @@ class RemoteAutomator(AutomatorInterface):
                     current_state = TaskState.TASK_FAILED
 
                 except Exception as e:
+                    self.facade.discard_pending_keys()
+                    if unverified and isinstance(e, AutomationError):
+                        current_state = self._fall_back_to_conservative(current_state, e)
+                        optimistic = unverified = False
+                        continue
                     self.logger.critical(
                         f"Error INESPERADO en estado {current_state.name}. La tarea ha fallado. Error: {e}",
                         exc_info=True,
@@ -164,23 +236,8 @@ class RemoteAutomator(AutomatorInterface):
 
                     # --- INICIO: LÓGICA DE CAPTURA DE PANTALLA ---
                     try:
-                        # Define una ruta base para las capturas, consistente con la estructura del proyecto.
-                        screenshot_dir = Path("data/output/screenshots")
-                        
-                        # Limpia el identificador de la tarea para crear un nombre de archivo seguro.
-                        safe_task_id = "".join(
-                            c for c in task.numero_historia if c.isalnum() or c in ('-', '_')
-                        ).rstrip()
-
-                        # Construye un nombre de archivo descriptivo para el diagnóstico.
-                        filename = (
-                            f"FAILURE_{datetime.now().strftime('%Y%m%d_%H%M%S')}_"
-                            f"{safe_task_id}_{current_state.name}.png"
-                        )
-                        file_path = screenshot_dir / filename
-                        
                         # Delega la acción a la fachada.
-                        self.facade.take_screenshot(file_path)
+                        self.facade.take_screenshot(failure_screenshot_path(task, current_state))
 
                     except Exception as screenshot_err:
                         # Si la captura falla, no debe detener el flujo principal de reporte de errores.
@@ -200,10 +257,104 @@ class RemoteAutomator(AutomatorInterface):
                     )
                     current_state = TaskState.TASK_FAILED
 
+        if self.optimistic_stats['fast'] or self.optimistic_stats['fallback']:
+            self.logger.info(
+                f"Modo optimista: {self.optimistic_stats['fast']} tareas por la vía rápida, "
+                f"{self.optimistic_stats['fallback']} repetidas con tiempos completos."
+            )
         self.logger.info("Procesamiento de todas las tareas finalizado.")
         return results
 
+    def _fall_back_to_conservative(self, failed_state: TaskState, error: Exception) -> TaskState:
+        """
+        Rebobina una tarea optimista que falló antes de verificar al paciente.
+        Retorna el último estado verificado, desde el que se repite la tarea con
+        los tiempos completos. Si varias tareas seguidas necesitan repetirse, el
+        modo optimista se desactiva para el resto de la ejecución.
+        """
+        self.logger.warning(
+            f"La vía rápida falló en {failed_state.name} ({error}). "
+            "Repitiendo la tarea desde el inicio con tiempos completos."
+        )
+        self.main_window_handler.optimistic = False
+        self.optimistic_stats['fallback'] += 1
+        self._consecutive_fallbacks += 1
+        if self._consecutive_fallbacks >= _MAX_CONSECUTIVE_FALLBACKS:
+            self.optimistic_enabled = False
+            self.logger.warning(
+                f"{self._consecutive_fallbacks} tareas seguidas necesitaron repetirse; "
+                "se desactiva el modo optimista para el resto de la ejecución."
+            )
+        return self._initial_state
+
+    def _compile_transitions(self, mission: MissionSpec) -> None:
+        """
+        Traduce el manifiesto de misión a una tabla estado -> (acción, siguiente
+        estado, verifica). Cada acción queda ya ligada al handler, de modo que
+        despachar un estado es una búsqueda en la tabla y una llamada.
+        """
+        self._transitions = {
+            state: (self._bind_steps(spec.steps), spec.next, spec.verifies)
+            for state, spec in mission.states.items()
+        }
+        self._initial_state = mission.initial
+        self._retryable_errors = mission.retryable
+        self._fatal_errors = mission.fatal
+        self.logger.info(
+            "Misión compilada: " + " -> ".join(self._describe_flow(mission)) + "."
+        )
+
+    def _bind_steps(self, steps) -> Callable[[FacturacionData], None]:
+        bound = [self.main_window_handler.bind_step(step) for step in steps]
+        if len(bound) == 1:
+            return bound[0]
+
+        def run(task: FacturacionData) -> None:
+            for step in bound:
+                step(task)
+        return run
+
+    @staticmethod
+    def _describe_flow(mission: MissionSpec) -> List[str]:
+        names, state = [], mission.initial
+        while state in mission.states:
+            names.append(state.name)
+            state = mission.states[state].next
+        return names
+
+    def _load_latency_model(self, profile_name: str) -> None:
+        """Asigna a la fachada el modelo de latencia del perfil, si está habilitado."""
+        if not self.settings.adaptive_timeouts:
+            self.facade.latency_model = None
+            return
+        if self.latency_dir is None:
+            self._latency_path = None
+            self.facade.latency_model = LatencyModel()
+            return
+        # Cada sesión aprende su propia latencia: los escritorios remotos no responden igual.
+        suffix = f".{self.session_name}" if self.session_name else ""
+        self._latency_path = self.latency_dir / f"{profile_name}{suffix}.json"
+        self.facade.latency_model = LatencyModel.load(self._latency_path)
+
+    def _save_latency_model(self) -> None:
+        model = self.facade.latency_model
+        if model is None or self._latency_path is None or not model.dirty:
+            return
+        try:
+            model.save(self._latency_path)
+            self.logger.info(f"Modelo de latencia guardado en '{self._latency_path}'.")
+        except OSError as e:
+            self.logger.warning(f"No se pudo guardar el modelo de latencia: {e}")
+
     def shutdown(self) -> None:
         self.logger.info("Finalizando el automator remoto y liberando recursos.")
-        self.config = None
+        try:
+            self.facade.flush()
+        except AutomationError as e:
+            self.logger.warning(f"No se pudieron enviar las teclas pendientes al finalizar: {e}")
+        self._save_latency_model()
+        if self.facade.action_costs:
+            self.logger.info(f"Coste medio por acción del backend: {self.facade.describe_action_costs()}")
+        self.facade.close()
+        self.settings = None
         self.main_window_handler = None
\ No newline at end of file
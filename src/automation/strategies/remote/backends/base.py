@@ -0,0 +1,55 @@
+# src/automation/strategies/remote/backends/base.py
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class WindowBackend(ABC):
+    """
+    Contrato de los backends de ventanas y teclado que usa `RemoteControlFacade`
+    en Linux. Permite elegir entre el backend nativo en proceso (`XlibBackend`)
+    y el basado en procesos externos (`XdotoolBackend`) sin cambiar la fachada.
+
+    Los IDs de ventana se manejan como cadenas decimales, el formato de xdotool.
+    Los fallos de búsqueda o activación se señalan con `FocusError`.
+
+    Los métodos `*_async` son las variantes para `AsyncRemoteControlFacade`.
+    Por defecto ejecutan la llamada síncrona en el propio bucle (válido para
+    backends en proceso, cuyas llamadas son viajes de ida y vuelta sin
+    esperas), salvo el teclado, que espera entre teclas y va a un hilo.
+    """
+
+    #: Nombre corto del backend, para logs y para el ajuste `linux_backend` del perfil.
+    name: str = ""
+
+    @abstractmethod
+    def find_window(self, title: str) -> str:
+        """Retorna el ID de la ventana con el título dado. Lanza `FocusError` si no existe."""
+
+    @abstractmethod
+    def activate(self, window_id: str) -> None:
+        """Pide al gestor de ventanas que active (enfoque y traiga al frente) la ventana."""
+
+    @abstractmethod
+    def active_window(self) -> Optional[str]:
+        """ID de la ventana activa, o None si no se puede determinar."""
+
+    @abstractmethod
+    def send_keys(self, keys: str, pause: float) -> None:
+        """Envía una secuencia en sintaxis de `send_keys` a la ventana con el foco."""
+
+    async def find_window_async(self, title: str) -> str:
+        return self.find_window(title)
+
+    async def activate_async(self, window_id: str) -> None:
+        self.activate(window_id)
+
+    async def active_window_async(self) -> Optional[str]:
+        return self.active_window()
+
+    async def send_keys_async(self, keys: str, pause: float) -> None:
+        await asyncio.to_thread(self.send_keys, keys, pause)
+
+    def close(self) -> None:
+        """Libera los recursos del backend (ej. conexiones). Por defecto no hace nada."""
@@ -0,0 +1,243 @@
+# src/automation/strategies/remote/backends/x11_clipboard.py
+"""
+Portapapeles nativo de X11, en proceso, sobre python-xlib.
+
+En Linux cada llamada de pyperclip lanza `xclip` o `xsel`, y la lectura con
+centinela tiene que sondear hasta ver el cambio. `X11Clipboard` mantiene su
+propia conexión y una ventana invisible, y:
+- Se suscribe con XFixes a los cambios de propietario de CLIPBOARD, de modo
+  que sabe en el mismo instante en que la GUI completa un Ctrl+C.
+- Lee el contenido con `ConvertSelection` y espera el `SelectionNotify`.
+- Escribe texto adueñándose de CLIPBOARD y atendiendo las peticiones
+  (`SelectionRequest`) de otras aplicaciones, para poder pegarlo con Ctrl+V.
+
+Un hilo propio procesa los eventos; el resto del proceso espera en una
+`threading.Condition`, o en un bucle de asyncio con las variantes `*_async`
+(el hilo de eventos despierta al bucle con `call_soon_threadsafe`). Se crea con `X11Clipboard.create`, que retorna None si
+el entorno no lo soporta (sin python-xlib, sin servidor X o sin XFixes).
+"""
+
+import asyncio
+import logging
+import select
+import threading
+import time
+from typing import Callable, List, Optional
+
+
+class X11Clipboard:
+    """Portapapeles CLIPBOARD con notificación de cambios (ver módulo)."""
+
+    def __init__(self, display, poll_timeout: float = 0.5):
+        """Usar `create`: el constructor asume una conexión con XFixes ya validada."""
+        from Xlib import X
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._X = X
+        self._display = display
+        self.poll_timeout = poll_timeout
+        self._atoms = {
+            name: display.intern_atom(name)
+            for name in ('CLIPBOARD', 'UTF8_STRING', 'TARGETS', 'TEXT', 'STRING', '_PRAXIS_CLIPBOARD')
+        }
+        self._window = display.screen().root.create_window(0, 0, 1, 1, 0, X.CopyFromParent)
+        self._condition = threading.Condition()
+        # Callbacks a invocar (desde el hilo de eventos) en cada cambio de estado; ver `_wait_async`.
+        self._watchers: List[Callable[[], None]] = []
+        # Número de veces que CLIPBOARD cambió de propietario (incluidos nuestros propios `write`).
+        self.owner_changes = 0
+        self._owned_text: Optional[bytes] = None
+        self._read_pending = False
+        self._read_result: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def create(cls, display_name: Optional[str] = None) -> Optional['X11Clipboard']:
+        logger = logging.getLogger(cls.__name__)
+        try:
+            from Xlib import display
+            from Xlib.error import DisplayError
+            from Xlib.ext import xfixes
+        except ImportError:
+            logger.info("python-xlib no está disponible; el portapapeles usará pyperclip.")
+            return None
+        try:
+            connection = display.Display(display_name)
+        except (DisplayError, OSError) as e:
+            logger.info(f"No se pudo conectar al servidor X ({e}); el portapapeles usará pyperclip.")
+            return None
+        if not connection.has_extension('XFIXES'):
+            logger.info("El servidor X no ofrece XFixes; el portapapeles usará pyperclip.")
+            connection.close()
+            return None
+
+        connection.xfixes_query_version()
+        clipboard = cls(connection)
+        connection.xfixes_select_selection_input(
+            clipboard._window, clipboard._atoms['CLIPBOARD'], xfixes.XFixesSetSelectionOwnerNotifyMask
+        )
+        connection.flush()
+        clipboard._thread = threading.Thread(target=clipboard._run, name="X11Clipboard", daemon=True)
+        clipboard._thread.start()
+        logger.info("Portapapeles nativo de X11 activo (notificación de cambios por XFixes).")
+        return clipboard
+
+    # --- API ----------------------------------------------------------------
+
+    def wait_for_owner_change(self, since: int, timeout: float) -> bool:
+        """Espera a que `owner_changes` supere `since`. Retorna False si vence el tiempo."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self.owner_changes > since, timeout=timeout)
+
+    def read(self, timeout: float) -> Optional[str]:
+        """Lee el contenido de CLIPBOARD como texto, o None si el propietario no responde a tiempo."""
+        if self._owned_text is not None:
+            return self._owned_text.decode('utf-8')
+        with self._condition:
+            self._request_read()
+            self._condition.wait_for(lambda: not self._read_pending, timeout=timeout)
+            self._read_pending = False
+            return self._read_result
+
+    def _request_read(self) -> None:
+        """Pide el contenido de CLIPBOARD; la respuesta llega como `SelectionNotify`. Requiere `_condition`."""
+        self._read_pending = True
+        self._read_result = None
+        self._window.convert_selection(
+            self._atoms['CLIPBOARD'], self._atoms['UTF8_STRING'], self._atoms['_PRAXIS_CLIPBOARD'],
+            self._X.CurrentTime
+        )
+        self._display.flush()
+
+    def write(self, text: str) -> None:
+        """Publica `text` en CLIPBOARD; se sirve a quien lo pida hasta que otro se adueñe."""
+        with self._condition:
+            self._owned_text = text.encode('utf-8')
+            self._window.set_selection_owner(self._atoms['CLIPBOARD'], self._X.CurrentTime)
+            self._display.flush()
+
+    # --- API asíncrona -------------------------------------------------------
+
+    async def wait_for_owner_change_async(self, since: int, timeout: float) -> bool:
+        """Como `wait_for_owner_change`, sin bloquear el bucle de eventos."""
+        return await self._wait_async(lambda: self.owner_changes > since, timeout)
+
+    async def read_async(self, timeout: float) -> Optional[str]:
+        """Como `read`, sin bloquear el bucle de eventos."""
+        if self._owned_text is not None:
+            return self._owned_text.decode('utf-8')
+        with self._condition:
+            self._request_read()
+        await self._wait_async(lambda: not self._read_pending, timeout)
+        with self._condition:
+            self._read_pending = False
+            return self._read_result
+
+    async def _wait_async(self, predicate: Callable[[], bool], timeout: float) -> bool:
+        """
+        Espera a que `predicate` (evaluado con `_condition`) se cumpla. El hilo
+        de eventos despierta al bucle en cada cambio; no hay sondeo.
+        """
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+        wake = lambda: loop.call_soon_threadsafe(changed.set)  # noqa: E731
+        with self._condition:
+            self._watchers.append(wake)
+        try:
+            deadline = loop.time() + timeout
+            while True:
+                # `changed` solo se modifica desde el bucle, así que limpiarlo antes
+                # de evaluar el predicado no pierde ningún aviso.
+                changed.clear()
+                with self._condition:
+                    if predicate():
+                        return True
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._condition:
+                self._watchers.remove(wake)
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_timeout * 2)
+            self._thread = None
+        self._display.close()
+
+    # --- Hilo de eventos ----------------------------------------------------
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                if not self._display.pending_events():
+                    select.select([self._display.fileno()], [], [], self.poll_timeout)
+                    continue
+                self._handle_event(self._display.next_event())
+        except Exception as e:
+            self.logger.warning(f"El portapapeles nativo se detuvo por un error de X: {e}")
+
+    def _handle_event(self, event) -> None:
+        from Xlib.ext import xfixes
+        X = self._X
+        if isinstance(event, xfixes.SetSelectionOwnerNotify):
+            with self._condition:
+                if event.owner != self._window.id:
+                    self._owned_text = None
+                self.owner_changes += 1
+                self._notify()
+        elif event.type == X.SelectionNotify:
+            self._on_selection_notify(event)
+        elif event.type == X.SelectionRequest:
+            self._on_selection_request(event)
+        elif event.type == X.SelectionClear:
+            with self._condition:
+                self._owned_text = None
+
+    def _on_selection_notify(self, event) -> None:
+        """Respuesta del propietario a nuestro `convert_selection`."""
+        text = None
+        if event.property != self._X.NONE:
+            prop = self._window.get_full_property(event.property, self._X.AnyPropertyType)
+            self._window.delete_property(event.property)
+            if prop is not None and isinstance(prop.value, bytes):
+                text = prop.value.decode('utf-8', errors='replace')
+        with self._condition:
+            self._read_result = text
+            self._read_pending = False
+            self._notify()
+
+    def _notify(self) -> None:
+        """Despierta a quienes esperan un cambio, con hilos o con asyncio. Requiere `_condition`."""
+        self._condition.notify_all()
+        for wake in self._watchers:
+            wake()
+
+    def _on_selection_request(self, event) -> None:
+        """Otra aplicación (ej. la GUI al pegar) pide el texto que publicamos."""
+        from Xlib import Xatom
+        from Xlib.protocol import event as xevent
+        X = self._X
+        prop = event.property if event.property != X.NONE else event.target
+        data = self._owned_text
+        if data is None:
+            prop = X.NONE
+        elif event.target == self._atoms['TARGETS']:
+            targets = [self._atoms['TARGETS'], self._atoms['UTF8_STRING'], self._atoms['TEXT'], self._atoms['STRING']]
+            event.requestor.change_property(prop, Xatom.ATOM, 32, targets)
+        elif event.target in (self._atoms['UTF8_STRING'], self._atoms['TEXT'], self._atoms['STRING']):
+            event.requestor.change_property(prop, event.target, 8, data)
+        else:
+            prop = X.NONE
+
+        reply = xevent.SelectionNotify(
+            time=event.time, requestor=event.requestor, selection=event.selection,
+            target=event.target, property=prop,
+        )
+        event.requestor.send_event(reply)
+        self._display.flush()
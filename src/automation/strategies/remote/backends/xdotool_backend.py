@@ -0,0 +1,95 @@
+# src/automation/strategies/remote/backends/xdotool_backend.py
+"""
+Backend de Linux basado en procesos externos: `xdotool` para buscar y activar
+ventanas y `pywinauto.keyboard` para el teclado. Es el comportamiento original
+de la fachada y se mantiene como respaldo cuando el backend nativo no está
+disponible. Las variantes asíncronas lanzan los mismos comandos con
+`asyncio.create_subprocess_exec`.
+"""
+
+import asyncio
+import logging
+import subprocess
+from typing import Optional
+
+from src.automation.strategies.remote.backends.base import WindowBackend
+from src.core.exceptions import FocusError
+
+
+class XdotoolBackend(WindowBackend):
+    name = "xdotool"
+
+    def __init__(self, timeout: float = 10):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.timeout = timeout
+
+    def find_window(self, title: str) -> str:
+        try:
+            result = subprocess.run(
+                ['xdotool', 'search', '--limit', '1', '--name', title],
+                capture_output=True, text=True, check=True, timeout=self.timeout
+            )
+        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            raise FocusError(f"No se pudo encontrar la ventana '{title}' con xdotool.") from e
+        window_id = result.stdout.strip()
+        if not window_id:
+            raise FocusError(f"No se pudo encontrar la ventana '{title}' con xdotool.")
+        return window_id
+
+    def activate(self, window_id: str) -> None:
+        # 'windowactivate' es más robusto que 'windowfocus'
+        try:
+            subprocess.run(['xdotool', 'windowactivate', window_id], check=True, timeout=self.timeout)
+        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            raise FocusError("Falló la dependencia 'xdotool' al activar la ventana.") from e
+
+    def active_window(self) -> Optional[str]:
+        try:
+            return subprocess.check_output(['xdotool', 'getactivewindow'], timeout=self.timeout).strip().decode()
+        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            raise FocusError("Falló la dependencia 'xdotool' al verificar el foco.") from e
+
+    # --- Variantes asíncronas: los mismos comandos como subprocesos de asyncio ---
+
+    async def find_window_async(self, title: str) -> str:
+        try:
+            window_id = await self._run_async('search', '--limit', '1', '--name', title)
+        except FocusError as e:
+            raise FocusError(f"No se pudo encontrar la ventana '{title}' con xdotool.") from e
+        if not window_id:
+            raise FocusError(f"No se pudo encontrar la ventana '{title}' con xdotool.")
+        return window_id
+
+    async def activate_async(self, window_id: str) -> None:
+        try:
+            await self._run_async('windowactivate', window_id)
+        except FocusError as e:
+            raise FocusError("Falló la dependencia 'xdotool' al activar la ventana.") from e
+
+    async def active_window_async(self) -> Optional[str]:
+        try:
+            return await self._run_async('getactivewindow')
+        except FocusError as e:
+            raise FocusError("Falló la dependencia 'xdotool' al verificar el foco.") from e
+
+    async def _run_async(self, *args: str) -> str:
+        """Ejecuta `xdotool *args` sin bloquear el bucle y retorna su salida. Lanza `FocusError` si falla."""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                'xdotool', *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+            )
+        except FileNotFoundError as e:
+            raise FocusError("No se encontró 'xdotool' en el PATH.") from e
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=self.timeout)
+        except asyncio.TimeoutError as e:
+            process.kill()
+            await process.wait()
+            raise FocusError(f"'xdotool {args[0]}' no respondió en {self.timeout} s.") from e
+        if process.returncode != 0:
+            raise FocusError(f"'xdotool {args[0]}' terminó con código {process.returncode}.")
+        return stdout.decode().strip()
+
+    def send_keys(self, keys: str, pause: float) -> None:
+        from pywinauto.keyboard import send_keys
+        send_keys(keys, with_spaces=True, pause=pause)
@@ -0,0 +1,189 @@
+# src/automation/strategies/remote/backends/xlib_backend.py
+"""
+Backend nativo de Linux, en proceso, sobre python-xlib:
+- Búsqueda de ventanas por EWMH (`_NET_CLIENT_LIST` y `_NET_WM_NAME`) con un
+  índice título -> ventana en caché, que solo se reconstruye si la ventana
+  cacheada ya no existe o cambió de título.
+- Activación con el mensaje EWMH `_NET_ACTIVE_WINDOW`, como hace xdotool.
+- Teclado con la extensión XTest.
+
+Evita lanzar un proceso por cada búsqueda, activación o verificación de foco.
+Se crea con `XlibBackend.create`, que retorna None si el entorno no lo soporta
+(sin python-xlib, sin servidor X, sin XTest o sin gestor de ventanas EWMH).
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+from src.automation.common.keyboard_map import KeyStroke, parse_key_sequence
+from src.automation.strategies.remote.backends.base import WindowBackend
+from src.core.exceptions import FocusError
+
+# Indicación de origen del mensaje _NET_ACTIVE_WINDOW: 2 = herramienta de
+# control (como xdotool); los gestores de ventanas la respetan sin heurísticas
+# anti-robo de foco.
+_SOURCE_PAGER = 2
+
+
+class XlibBackend(WindowBackend):
+    name = "xlib"
+
+    def __init__(self, display):
+        """Usar `create`: el constructor asume una conexión ya validada."""
+        from Xlib import X, Xatom
+        from Xlib.error import BadWindow, XError
+        self._X = X
+        self._Xatom = Xatom
+        self._BadWindow = BadWindow
+        self._XError = XError
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._display = display
+        self._root = display.screen().root
+        self._atoms = {
+            name: display.intern_atom(name)
+            for name in ('_NET_ACTIVE_WINDOW', '_NET_CLIENT_LIST', '_NET_WM_NAME', 'UTF8_STRING')
+        }
+        self._title_index: Dict[str, int] = {}
+        self._keycodes: Dict[str, tuple] = {}
+
+    @classmethod
+    def create(cls, display_name: Optional[str] = None) -> Optional['XlibBackend']:
+        logger = logging.getLogger(cls.__name__)
+        try:
+            from Xlib import X, display
+            from Xlib.error import DisplayError
+        except ImportError:
+            logger.info("python-xlib no está disponible; se usará el backend xdotool.")
+            return None
+        try:
+            connection = display.Display(display_name)
+        except (DisplayError, OSError) as e:
+            logger.info(f"No se pudo conectar al servidor X ({e}); se usará el backend xdotool.")
+            return None
+
+        if not connection.has_extension('XTEST'):
+            logger.info("El servidor X no ofrece la extensión XTest; se usará el backend xdotool.")
+            connection.close()
+            return None
+        backend = cls(connection)
+        if backend._root.get_full_property(backend._atoms['_NET_CLIENT_LIST'], X.AnyPropertyType) is None:
+            logger.info("El gestor de ventanas no publica _NET_CLIENT_LIST (EWMH); se usará el backend xdotool.")
+            connection.close()
+            return None
+        return backend
+
+    # --- Ventanas -----------------------------------------------------------
+
+    def find_window(self, title: str) -> str:
+        window = self._title_index.get(title)
+        if window is not None and self._title_of(window) == title:
+            return str(window)
+
+        self._rebuild_index()
+        window = self._title_index.get(title)
+        if window is None:
+            # Como `xdotool search --name`, se acepta una coincidencia parcial.
+            window = next((w for t, w in self._title_index.items() if title in t), None)
+        if window is None:
+            raise FocusError(f"No se pudo encontrar la ventana '{title}' en el servidor X.")
+        self._title_index[title] = window
+        return str(window)
+
+    def activate(self, window_id: str) -> None:
+        from Xlib.protocol import event
+        X = self._X
+        try:
+            message = event.ClientMessage(
+                window=self._display.create_resource_object('window', int(window_id)),
+                client_type=self._atoms['_NET_ACTIVE_WINDOW'],
+                data=(32, [_SOURCE_PAGER, X.CurrentTime, 0, 0, 0]),
+            )
+            self._root.send_event(message, event_mask=X.SubstructureRedirectMask | X.SubstructureNotifyMask)
+            self._display.flush()
+        except self._XError as e:
+            raise FocusError(f"No se pudo activar la ventana {window_id}: {e}") from e
+
+    def active_window(self) -> Optional[str]:
+        prop = self._root.get_full_property(self._atoms['_NET_ACTIVE_WINDOW'], self._X.AnyPropertyType)
+        if prop is None or not prop.value:
+            return None
+        return str(int(prop.value[0]))
+
+    def _rebuild_index(self) -> None:
+        prop = self._root.get_full_property(self._atoms['_NET_CLIENT_LIST'], self._Xatom.WINDOW)
+        index = {}
+        for window in (prop.value if prop is not None else ()):
+            title = self._title_of(int(window))
+            if title:
+                index.setdefault(title, int(window))
+        self._title_index = index
+        self.logger.debug(f"Índice de títulos reconstruido: {len(index)} ventanas.")
+
+    def _title_of(self, window_id: int) -> Optional[str]:
+        window = self._display.create_resource_object('window', window_id)
+        try:
+            prop = window.get_full_property(self._atoms['_NET_WM_NAME'], self._atoms['UTF8_STRING'])
+            if prop is None:
+                prop = window.get_full_property(self._Xatom.WM_NAME, self._X.AnyPropertyType)
+        except self._BadWindow:
+            return None
+        if prop is None:
+            return None
+        value = prop.value
+        return value.decode('utf-8', errors='replace') if isinstance(value, bytes) else str(value)
+
+    # --- Teclado ------------------------------------------------------------
+
+    def send_keys(self, keys: str, pause: float) -> None:
+        strokes = parse_key_sequence(keys)
+        for stroke in strokes:
+            self._send_stroke(stroke)
+            if pause:
+                time.sleep(pause)
+
+    async def send_keys_async(self, keys: str, pause: float) -> None:
+        # XTest es una llamada en proceso: solo la pausa entre teclas cede el bucle.
+        for stroke in parse_key_sequence(keys):
+            self._send_stroke(stroke)
+            if pause:
+                await asyncio.sleep(pause)
+
+    def _send_stroke(self, stroke: KeyStroke) -> None:
+        X = self._X
+        keycode, needs_shift = self._keycode(stroke.key)
+        modifiers = [self._keycode(m)[0] for m in stroke.modifiers]
+        if needs_shift and 'Shift_L' not in stroke.modifiers:
+            modifiers.append(self._keycode('Shift_L')[0])
+
+        for modifier in modifiers:
+            self._display.xtest_fake_input(X.KeyPress, modifier)
+        self._display.xtest_fake_input(X.KeyPress, keycode)
+        self._display.xtest_fake_input(X.KeyRelease, keycode)
+        for modifier in reversed(modifiers):
+            self._display.xtest_fake_input(X.KeyRelease, modifier)
+        self._display.sync()
+
+    def _keycode(self, key: str) -> tuple:
+        """Retorna (keycode, requiere_shift) para un keysym o carácter, con caché."""
+        cached = self._keycodes.get(key)
+        if cached is not None:
+            return cached
+        from Xlib import XK
+        if len(key) == 1:
+            # Los keysyms de Latin-1 coinciden con el código del carácter; el resto
+            # de Unicode usa el rango 0x01000000.
+            code = ord(key)
+            keysym = code if code <= 0xff else 0x01000000 | code
+        else:
+            keysym = XK.string_to_keysym(key)
+        for keycode, index in self._display.keysym_to_keycodes(keysym):
+            # Índices 0/1 del mapa: sin y con Shift.
+            if index in (0, 1):
+                self._keycodes[key] = (keycode, index == 1)
+                return self._keycodes[key]
+        raise ValueError(f"El teclado del servidor X no tiene una tecla para '{key}'.")
+
+    def close(self) -> None:
+        self._display.close()
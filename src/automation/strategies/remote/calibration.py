@@ -0,0 +1,157 @@
+# src/automation/strategies/remote/calibration.py
+"""
+Calibración de la sesión remota al inicio de la ejecución.
+
+Antes de la primera tarea se escribe un texto inofensivo en el campo de
+búsqueda de la ventana principal y se lee de vuelta por el portapapeles, para:
+- Medir la latencia entrada→efecto (ida y vuelta del portapapeles) y su jitter.
+- Detectar caracteres perdidos con distintas pausas entre teclas y elegir la
+  más corta que no pierde ninguno.
+
+El resultado es un `SessionPerformanceProfile` que ajusta la pausa de
+`send_keys` de la fachada y el suelo de los tiempos de espera del modelo de
+latencia, en lugar de usar constantes pensadas para el peor enlace.
+
+Como escribe en el campo que tenga el foco, solo se ejecuta si el perfil lo
+pide con `calibrate_session = true`.
+"""
+
+import logging
+import statistics
+import time
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Sequence
+
+from src.automation.strategies.remote.remote_control import RemoteControlFacade
+from src.core.exceptions import AutomationError
+
+# Texto de prueba: solo dígitos, aceptados por cualquier campo de búsqueda.
+_PROBE_TEXT = "0123456789"
+_SELECT_ALL = "^a"
+_CLEAR_SELECTION = "{DEL}"
+
+
+@dataclass(frozen=True)
+class SessionPerformanceProfile:
+    """
+    Rendimiento medido de la sesión remota.
+
+    Atributos:
+        key_pause: Pausa entre teclas elegida, en segundos.
+        clipboard_latency: Mediana de la ida y vuelta del portapapeles, en segundos.
+        clipboard_jitter: Desviación estándar de esa latencia, en segundos.
+        wait_floor: Tiempo mínimo razonable para cualquier espera de la GUI
+                    (la ida y vuelta más lenta observada).
+        dropped_chars: Pausa probada -> caracteres perdidos en total.
+    """
+    key_pause: float
+    clipboard_latency: float
+    clipboard_jitter: float
+    wait_floor: float
+    dropped_chars: Dict[float, int] = field(default_factory=dict)
+
+    def apply(self, facade: RemoteControlFacade) -> None:
+        """Ajusta la fachada (y su modelo de latencia, si lo tiene) a la sesión medida."""
+        facade.key_pause = self.key_pause
+        model = facade.latency_model
+        if model is not None:
+            model.floor = max(model.floor, self.wait_floor)
+
+
+class SessionCalibrator:
+    """Ejecuta la rutina de calibración contra la ventana ya enfocada."""
+
+    def __init__(
+        self,
+        facade: RemoteControlFacade,
+        max_key_pause: float,
+        clipboard_timeout: float,
+        candidate_pauses: Sequence[float] = (0.0, 0.01, 0.02),
+        repetitions: int = 2,
+    ):
+        """
+        Args:
+            facade: Fachada conectada a la ventana de destino.
+            max_key_pause: Pausa del perfil; se usa si ninguna candidata es fiable.
+            clipboard_timeout: Tiempo máximo de cada lectura del portapapeles.
+            candidate_pauses: Pausas a probar, de menor a mayor.
+            repetitions: Escrituras de prueba por cada pausa.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.facade = facade
+        self.max_key_pause = max_key_pause
+        self.clipboard_timeout = clipboard_timeout
+        self.candidate_pauses = [p for p in sorted(candidate_pauses) if p < max_key_pause]
+        self.repetitions = repetitions
+
+    def run(self) -> SessionPerformanceProfile:
+        """
+        Mide la sesión. El campo con el foco queda vacío al terminar.
+
+        Raises:
+            AutomationError: Si la GUI no responde a las lecturas de prueba.
+        """
+        self.logger.info("Calibrando la sesión remota...")
+        round_trips: List[float] = []
+        dropped: Dict[float, int] = {}
+        chosen = self.max_key_pause
+
+        for pause in [*self.candidate_pauses, self.max_key_pause]:
+            dropped[pause] = sum(self._probe(pause, round_trips) for _ in range(self.repetitions))
+            self.logger.debug(f"Pausa {pause * 1000:.0f} ms: {dropped[pause]} caracteres perdidos.")
+            if dropped[pause] == 0:
+                chosen = pause
+                break
+
+        profile = SessionPerformanceProfile(
+            key_pause=chosen,
+            clipboard_latency=statistics.median(round_trips),
+            clipboard_jitter=statistics.pstdev(round_trips),
+            wait_floor=max(round_trips),
+            dropped_chars=dropped,
+        )
+        self.logger.info(
+            f"Calibración completada: pausa entre teclas {profile.key_pause * 1000:.0f} ms, "
+            f"portapapeles {profile.clipboard_latency * 1000:.0f} ms "
+            f"(±{profile.clipboard_jitter * 1000:.0f} ms), suelo de espera {profile.wait_floor * 1000:.0f} ms."
+        )
+        return profile
+
+    def _probe(self, pause: float, round_trips: List[float]) -> int:
+        """Escribe el texto de prueba con `pause`, lo lee de vuelta y retorna los caracteres perdidos."""
+        self.facade.type_keys(_PROBE_TEXT, pause=pause)
+        self.facade.type_keys(_SELECT_ALL)
+        # El texto se envía antes de medir: la ida y vuelta solo incluye la copia.
+        self.facade.flush()
+        start = time.monotonic()
+        try:
+            found = self.facade.read_clipboard_with_sentinel(timeout=self.clipboard_timeout).strip()
+        finally:
+            self.facade.type_keys(_CLEAR_SELECTION)
+        # La fachada ya registra esta lectura en el modelo de latencia (si lo hay).
+        round_trips.append(time.monotonic() - start)
+
+        matched = sum(block.size for block in SequenceMatcher(None, _PROBE_TEXT, found).get_matching_blocks())
+        return len(_PROBE_TEXT) - matched
+
+
+def calibrate(
+    facade: RemoteControlFacade, max_key_pause: float, clipboard_timeout: float
+) -> Optional[SessionPerformanceProfile]:
+    """
+    Calibra la sesión y aplica el resultado a la fachada. Un fallo de la
+    calibración no es fatal: se registra y se mantienen los valores del perfil.
+
+    Returns:
+        El `SessionPerformanceProfile` medido, o None si la calibración falló.
+    """
+    try:
+        profile = SessionCalibrator(facade, max_key_pause, clipboard_timeout).run()
+    except AutomationError as e:
+        logging.getLogger(SessionCalibrator.__name__).warning(
+            f"La calibración de la sesión falló ({e}); se usan los tiempos del perfil."
+        )
+        return None
+    profile.apply(facade)
+    return profile
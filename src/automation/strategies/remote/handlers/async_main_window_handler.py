@@ -0,0 +1,112 @@
+# src/automation/strategies/remote/handlers/async_main_window_handler.py
+
+"""
+Variante asíncrona de `MainWindowHandler` para `AsyncRemoteControlFacade`:
+las mismas acciones, como corrutinas. La traducción de la misión y el veredicto
+de la validación se comparten a través de `BaseMainWindowHandler`.
+"""
+
+from typing import Optional
+
+from src.automation.common.keyboard_map import escape_text
+from src.automation.strategies.remote import probes
+from src.automation.strategies.remote.async_remote_control import AsyncRemoteControlFacade
+from src.automation.strategies.remote.handlers.main_window_handler import BaseMainWindowHandler, _field_text
+from src.core.constants import LatencyActions, LogicalFields
+from src.core.exceptions import ReadinessTimeoutError
+from src.core.models import FacturacionData
+
+
+class AsyncMainWindowHandler(BaseMainWindowHandler):
+    """`MainWindowHandler` cuyas acciones son corrutinas (ver módulo)."""
+
+    remote_control: AsyncRemoteControlFacade
+
+    async def ensure_initial_state(self) -> None:
+        self.logger.info("Reseteando la GUI a un estado inicial conocido...")
+        self.remote_control.type_keys('{ESC 3}')
+        if not self.optimistic:
+            await self._settle("diálogos cerrados", self._initial_state_timeout)
+        self.logger.info("Estado inicial de la GUI preparado para la siguiente tarea.")
+
+    async def find_patient(self, task: FacturacionData) -> None:
+        self.logger.info(f"Buscando paciente con historia clínica: {task.numero_historia}")
+        await self._enter_value(LogicalFields.NUMERO_HISTORIA, task.numero_historia)
+        if not self.optimistic:
+            await self.remote_control.wait(self._generic_delay)
+        self.remote_control.type_keys('{ENTER}')
+        await self.validate_patient_loaded(task)
+        self.logger.info("Búsqueda y validación del paciente completadas.")
+
+    async def _enter_value(self, field_name: str, value: str) -> None:
+        if self._input_policy.should_paste(field_name, value):
+            self.logger.debug(f"Pegando '{field_name}' ({len(value)} caracteres) desde el portapapeles.")
+            await self.remote_control.paste_text(value, timeout=self._clipboard_timeout)
+        else:
+            self.remote_control.type_keys(escape_text(value))
+
+    async def validate_patient_loaded(self, task: FacturacionData) -> None:
+        """
+        Raises:
+            PatientIDMismatchError: Si el campo muestra un ID distinto al esperado.
+            PatientDataMismatchError: Si la identificación coincide pero otro campo leído no.
+            ReadinessTimeoutError: Si el campo nunca pudo leerse.
+        """
+        self.logger.info(f"Iniciando validación para el paciente con ID: {task.identificacion}")
+        if self._readback is not None:
+            await self._validate_with_readback(task)
+            return
+
+        self.remote_control.type_keys(self._nav_to_id_sequence)
+        expected_id = task.identificacion.strip()
+        probe = probes.AsyncFieldValueProbe(self.remote_control, expected_id, read_timeout=self._clipboard_timeout)
+        try:
+            await self.remote_control.wait_until(
+                probe, timeout=self._patient_load_wait, description=f"paciente '{expected_id}' cargado",
+                action=LatencyActions.PATIENT_LOAD, exhaust_upper_bound=True
+            )
+        except ReadinessTimeoutError:
+            self._raise_patient_mismatch(expected_id, probe)
+            raise
+
+        self.logger.info(f"VALIDACIÓN EXITOSA: El paciente '{expected_id}' se ha cargado correctamente.")
+
+    async def _validate_with_readback(self, task: FacturacionData) -> None:
+        self.remote_control.type_keys(self._readback.sequence)
+        probe = probes.AsyncReadbackProbe(self.remote_control, self._readback, task, read_timeout=self._clipboard_timeout)
+        try:
+            await self.remote_control.wait_until(
+                probe, timeout=self._patient_load_wait,
+                description=f"paciente '{task.identificacion.strip()}' cargado (lectura en bloque)",
+                action=LatencyActions.PATIENT_LOAD, exhaust_upper_bound=True
+            )
+        except ReadinessTimeoutError:
+            self._raise_readback_mismatch(probe)
+            raise
+
+        self.logger.info(
+            f"VALIDACIÓN EXITOSA: El paciente '{task.identificacion.strip()}' se ha cargado correctamente "
+            f"({len(self._readback.fields)} campos verificados en una lectura)."
+        )
+
+    async def initiate_new_billing(self) -> None:
+        self.logger.info("Iniciando nuevo proceso de facturación (Ctrl+N)...")
+        self.remote_control.type_keys('^n')
+        await self._settle("nueva factura abierta", self._new_billing_timeout)
+        self.logger.info("Comando para nuevo proceso de facturación enviado.")
+
+    async def _settle(self, description: str, seconds: float) -> None:
+        self.logger.debug(f"Esperando {seconds:.2f} s ({description}).")
+        await self.remote_control.wait(seconds)
+
+    async def _type_keys(self, keys: str) -> None:
+        self.remote_control.type_keys(keys)
+
+    async def _enter_field(self, task: FacturacionData, field_name: str, date_format: Optional[str]) -> None:
+        text = _field_text(task, field_name, date_format)
+        if text is not None:
+            await self._enter_value(field_name, text)
+
+    async def _pause(self, seconds: float) -> None:
+        if not self.optimistic:
+            await self.remote_control.wait(seconds)
@@ -6,53 +6,141 @@ toda la lógica de interacción con la ventana principal del software de factura
 """
 
 import logging
-from configparser import ConfigParser, NoSectionError
+from datetime import date
+from typing import Callable, Optional
 
-from src.automation.strategies.remote.remote_control import RemoteControlFacade
-from src.core.exceptions import PatientIDMismatchError
+from src.automation.common.keyboard_map import escape_text
+from src.automation.common.mission import MISSION_ACTIONS, MissionOps, MissionStep
+from src.automation.strategies.remote import probes
+from src.automation.strategies.remote.remote_control import BaseRemoteControlFacade, RemoteControlFacade
+from src.core.constants import LatencyActions, LogicalFields
+from src.core.exceptions import PatientDataMismatchError, PatientIDMismatchError, ReadinessTimeoutError
 from src.core.models import FacturacionData
+from src.core.profile import AutomationSpec
 
 
-class MainWindowHandler:
+def _field_text(task: FacturacionData, field_name: str, date_format: Optional[str]) -> Optional[str]:
+    """Texto a introducir para un campo de la tarea (None si el campo está vacío)."""
+    value = getattr(task, field_name)
+    if value is None:
+        return None
+    return value.strftime(date_format) if isinstance(value, date) else str(value).strip()
+
+
+class BaseMainWindowHandler:
     """
-    Encapsula la lógica de negocio para las acciones realizadas en la ventana
-    principal del Software de Facturación (SF), como la búsqueda y validación
-    de pacientes.
+    Configuración y decisiones comunes a `MainWindowHandler` y a su variante
+    asíncrona: la traducción de la misión a llamadas y el veredicto de la
+    validación del paciente. Las subclases aportan las acciones, síncronas o
+    como corrutinas, con los mismos nombres: `validate_patient_loaded`,
+    `_type_keys`, `_enter_field`, `_pause` y `_settle`, además de las acciones
+    de `MISSION_ACTIONS`.
     """
 
-    def __init__(self, remote_control: RemoteControlFacade, config: ConfigParser):
+    def __init__(self, remote_control: BaseRemoteControlFacade, settings: AutomationSpec):
         """
-        Inicializa el handler con sus dependencias y carga la configuración
-        específica para la automatización desde el perfil.
+        Inicializa el handler con sus dependencias y la configuración de
+        automatización ya compilada del perfil.
 
         Args:
             remote_control: La fachada para interactuar con la GUI.
-            config: El objeto de configuración cargado desde el perfil .ini.
+            settings: Los ajustes de automatización del perfil (tiempos en segundos).
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.remote_control = remote_control
-        self.config = config
+        self.settings = settings
 
-        # Carga de parámetros de temporización desde la configuración.
-        self._generic_delay = self.config.getfloat('AutomationTimeouts', 'generic_action_delay_ms', fallback=100) / 1000.0
-        self._patient_load_wait = self.config.getfloat('AutomationTimeouts', 'patient_load_wait_ms', fallback=3000) / 1000.0
+        # Parámetros de temporización (ya convertidos a segundos al compilar el perfil).
+        # `_patient_load_wait` y `_clipboard_timeout` son tiempos máximos: se sondea
+        # la GUI con `wait_until` y se continúa en cuanto está lista. Los demás son
+        # esperas fijas (ver `_settle`).
+        self._generic_delay = settings.generic_action_delay
+        self._patient_load_wait = settings.patient_load_wait
+        self._initial_state_timeout = settings.initial_state_timeout
+        self._new_billing_timeout = settings.new_billing_timeout
+        self._clipboard_timeout = settings.clipboard_timeout
 
-        # --- MEJORA CLAVE: Carga de Secuencias de Teclas desde Configuración ---
-        # Se externaliza la lógica de navegación a los perfiles .ini para
+        # La secuencia de navegación se externaliza a [AutomationSequences] para
         # desacoplar al bot de los cambios en el layout de la GUI.
-        try:
-            self._nav_to_id_sequence = self.config.get(
-                'AutomationSequences',
-                'nav_to_id_field',
-                fallback='{TAB}'  # Valor por defecto seguro si la clave no existe.
-            )
-            self.logger.info(f"Secuencia de navegación al campo ID cargada: '{self._nav_to_id_sequence}'")
-        except NoSectionError:
-            self.logger.warning(
-                "La sección [AutomationSequences] no se encontró en el perfil. "
-                "Usando valores de navegación por defecto. Se recomienda añadirla."
-            )
-            self._nav_to_id_sequence = '{TAB}'
+        self._nav_to_id_sequence = settings.nav_to_id_sequence
+        self.logger.info(f"Secuencia de navegación al campo ID cargada: '{self._nav_to_id_sequence}'")
+
+        # Si el perfil declara [AutomationReadback], la validación verifica todos
+        # sus campos con una sola copia en lugar de leer solo la identificación.
+        self._readback = settings.readback
+        self._input_policy = settings.input_policy
+
+        # Modo optimista (lo activa el automator por tarea): se omiten las esperas
+        # de cortesía previas a la verificación del paciente, que es la que detecta
+        # si algo salió mal. Ver `RemoteAutomator.process_billing_tasks`.
+        self.optimistic = False
+        if self._readback is not None:
+            self.logger.info(f"Lectura en bloque configurada para los campos: {', '.join(self._readback.fields)}")
+
+    def bind_step(self, step: MissionStep) -> Callable[[FacturacionData], object]:
+        """
+        Traduce un paso del manifiesto de misión a una llamada ya resuelta que
+        recibe la tarea. Se hace una sola vez, al inicializar el automator. En
+        la variante asíncrona la llamada devuelve una corrutina.
+        """
+        if step.op == MissionOps.CALL:
+            action = getattr(self, step.target)
+            return action if MISSION_ACTIONS[step.target] else (lambda task: action())
+        if step.op == MissionOps.KEYS:
+            keys = step.target
+            return lambda task: self._type_keys(keys)
+        if step.op == MissionOps.ENTER:
+            field_name, date_format = step.target, step.date_format
+            return lambda task: self._enter_field(task, field_name, date_format)
+        if step.op == MissionOps.WAIT:
+            description, seconds = step.description, step.seconds
+            return lambda task: self._settle(description, seconds)
+        if step.op == MissionOps.PAUSE:
+            seconds = step.seconds
+            return lambda task: self._pause(seconds)
+        if step.op == MissionOps.VERIFY:
+            return self.validate_patient_loaded
+        raise ValueError(f"Operación de misión desconocida: '{step.op}'")
+
+    def _raise_patient_mismatch(self, expected_id: str, probe: probes.FieldValueCheck) -> None:
+        """
+        Veredicto de una validación por ID cuya espera venció: lanza la
+        discrepancia si el campo pudo leerse. Si nunca se leyó, retorna y el
+        llamador propaga la espera vencida, que es reintentable.
+
+        Raises:
+            PatientIDMismatchError: Si el campo muestra un ID distinto al esperado.
+        """
+        if probe.last_value is None:
+            return
+        self.logger.error(f"¡FALLO DE VALIDACIÓN! ID Esperado: '{expected_id}', Encontrado: '{probe.last_value}'")
+        raise PatientIDMismatchError(expected_id=expected_id, found_id=probe.last_value)
+
+    def _raise_readback_mismatch(self, probe: probes.ReadbackCheck) -> None:
+        """
+        Como `_raise_patient_mismatch`, para una lectura en bloque.
+
+        Raises:
+            PatientIDMismatchError: Si la identificación leída no coincide.
+            PatientDataMismatchError: Si la identificación coincide pero otro campo no.
+        """
+        if probe.last_values is None:
+            return
+        self.logger.error(f"¡FALLO DE VALIDACIÓN! Discrepancias: {probe.mismatches}")
+        if LogicalFields.IDENTIFICACION in probe.mismatches:
+            expected_id, found_id = probe.mismatches[LogicalFields.IDENTIFICACION]
+            raise PatientIDMismatchError(expected_id=expected_id, found_id=found_id)
+        raise PatientDataMismatchError(probe.mismatches)
+
+
+class MainWindowHandler(BaseMainWindowHandler):
+    """
+    Encapsula la lógica de negocio para las acciones realizadas en la ventana
+    principal del Software de Facturación (SF), como la búsqueda y validación
+    de pacientes.
+    """
+
+    remote_control: RemoteControlFacade
 
     def ensure_initial_state(self) -> None:
         """
@@ -61,7 +149,8 @@ class MainWindowHandler:
         """
         self.logger.info("Reseteando la GUI a un estado inicial conocido...")
         self.remote_control.type_keys('{ESC 3}')
-        self.remote_control.wait(0.5)
+        if not self.optimistic:
+            self._settle("diálogos cerrados", self._initial_state_timeout)
         self.logger.info("Estado inicial de la GUI preparado para la siguiente tarea.")
 
     def find_patient(self, task: FacturacionData) -> None:
@@ -70,44 +159,114 @@ class MainWindowHandler:
         """
         self.logger.info(f"Buscando paciente con historia clínica: {task.numero_historia}")
 
-        self.remote_control.type_keys(task.numero_historia)
-        self.remote_control.wait(self._generic_delay)
+        self._enter_value(LogicalFields.NUMERO_HISTORIA, task.numero_historia)
+        if not self.optimistic:
+            self.remote_control.wait(self._generic_delay)
 
         self.remote_control.type_keys('{ENTER}')
 
-        self.logger.info(f"Esperando {self._patient_load_wait:.2f} segundos a que carguen los datos del paciente...")
-        self.remote_control.wait(self._patient_load_wait)
-
-        # La validación ahora usará la secuencia de navegación cargada desde el .ini
+        # La validación sondea el campo de ID hasta que muestre al paciente
+        # esperado, por lo que también cumple la función de esperar la carga.
         self.validate_patient_loaded(task)
 
         self.logger.info("Búsqueda y validación del paciente completadas.")
 
+    def _enter_value(self, field_name: str, value: str) -> None:
+        """
+        Introduce el valor de un campo en el control con el foco, escribiéndolo o
+        pegándolo según [AutomationInput] (ver `InputPolicy`).
+        """
+        if self._input_policy.should_paste(field_name, value):
+            self.logger.debug(f"Pegando '{field_name}' ({len(value)} caracteres) desde el portapapeles.")
+            self.remote_control.paste_text(value, timeout=self._clipboard_timeout)
+        else:
+            self.remote_control.type_keys(escape_text(value))
+
     def validate_patient_loaded(self, task: FacturacionData) -> None:
         """
         Valida que el paciente correcto se ha cargado en la GUI.
-        Navega al campo de ID y compara su contenido con los datos esperados.
+
+        Navega una vez al campo de ID y lo copia repetidamente hasta que contenga
+        el ID esperado o venza `patient_load_wait_ms`, aunque el modelo de
+        latencia haya aprendido un tiempo menor: una carga lenta no es una
+        discrepancia. Solo si al vencer el campo sigue mostrando otro valor se
+        considera una discrepancia. Con
+        [AutomationReadback] se hace lo mismo con todos los campos declarados.
+
+        Raises:
+            PatientIDMismatchError: Si el campo muestra un ID distinto al esperado.
+            PatientDataMismatchError: Si la identificación coincide pero otro campo leído no.
+            ReadinessTimeoutError: Si el campo nunca pudo leerse.
         """
         self.logger.info(f"Iniciando validación para el paciente con ID: {task.identificacion}")
+        if self._readback is not None:
+            self._validate_with_readback(task)
+            return
 
         # Se utiliza la secuencia de navegación leída desde el perfil en lugar de un valor codificado.
         self.remote_control.type_keys(self._nav_to_id_sequence)
-        self.remote_control.wait(0.2)
 
-        found_id = self.remote_control.read_clipboard_with_sentinel()
         expected_id = task.identificacion.strip()
-
-        if found_id.strip() != expected_id:
-            self.logger.error(f"¡FALLO DE VALIDACIÓN! ID Esperado: '{expected_id}', Encontrado: '{found_id.strip()}'")
-            raise PatientIDMismatchError(expected_id=expected_id, found_id=found_id.strip())
+        probe = probes.FieldValueProbe(self.remote_control, expected_id, read_timeout=self._clipboard_timeout)
+        try:
+            self.remote_control.wait_until(
+                probe, timeout=self._patient_load_wait, description=f"paciente '{expected_id}' cargado",
+                action=LatencyActions.PATIENT_LOAD, exhaust_upper_bound=True
+            )
+        except ReadinessTimeoutError:
+            self._raise_patient_mismatch(expected_id, probe)
+            raise
 
         self.logger.info(f"VALIDACIÓN EXITOSA: El paciente '{expected_id}' se ha cargado correctamente.")
 
+    def _validate_with_readback(self, task: FacturacionData) -> None:
+        self.remote_control.type_keys(self._readback.sequence)
+
+        probe = probes.ReadbackProbe(self.remote_control, self._readback, task, read_timeout=self._clipboard_timeout)
+        try:
+            self.remote_control.wait_until(
+                probe, timeout=self._patient_load_wait,
+                description=f"paciente '{task.identificacion.strip()}' cargado (lectura en bloque)",
+                action=LatencyActions.PATIENT_LOAD, exhaust_upper_bound=True
+            )
+        except ReadinessTimeoutError:
+            self._raise_readback_mismatch(probe)
+            raise
+
+        self.logger.info(
+            f"VALIDACIÓN EXITOSA: El paciente '{task.identificacion.strip()}' se ha cargado correctamente "
+            f"({len(self._readback.fields)} campos verificados en una lectura)."
+        )
+
     def initiate_new_billing(self) -> None:
         """
         Envía la combinación de teclas para iniciar un nuevo proceso de facturación.
         """
         self.logger.info("Iniciando nuevo proceso de facturación (Ctrl+N)...")
         self.remote_control.type_keys('^n')
-        self.remote_control.wait(1.5)
-        self.logger.info("Comando para nuevo proceso de facturación enviado.")
\ No newline at end of file
+        self._settle("nueva factura abierta", self._new_billing_timeout)
+        self.logger.info("Comando para nuevo proceso de facturación enviado.")
+
+    def _settle(self, description: str, seconds: float) -> None:
+        """
+        Da a la aplicación un tiempo fijo para completar un cambio de pantalla
+        (cerrar diálogos, abrir una factura). No es una sonda de disponibilidad:
+        sobre RDP la ventana del cliente está siempre activa y no hay una señal
+        observable de que la aplicación terminó, así que el tiempo no se acorta
+        ni alimenta el modelo de latencia. El foco se verifica con el siguiente
+        envío de teclas.
+        """
+        self.logger.debug(f"Esperando {seconds:.2f} s ({description}).")
+        self.remote_control.wait(seconds)
+
+    def _type_keys(self, keys: str) -> None:
+        self.remote_control.type_keys(keys)
+
+    def _enter_field(self, task: FacturacionData, field_name: str, date_format: Optional[str]) -> None:
+        text = _field_text(task, field_name, date_format)
+        if text is not None:
+            self._enter_value(field_name, text)
+
+    def _pause(self, seconds: float) -> None:
+        if not self.optimistic:
+            self.remote_control.wait(seconds)
@@ -0,0 +1,254 @@
+# src/automation/strategies/remote/parallel_automator.py
+"""
+Automatización en paralelo sobre varias sesiones de escritorio remoto.
+
+Cada sesión declarada en [AutomationSessions] es un `RemoteAutomator`
+completo (su propia fachada, su `MainWindowHandler` y su FSM) que corre en un
+hilo propio. Las sesiones no reciben un reparto fijo: toman la siguiente tarea
+de una cola compartida en cuanto terminan la anterior, así que una sesión
+lenta simplemente procesa menos tareas y las demás absorben el resto.
+
+Una sesión que pasa más de `session_task_timeout` en una misma tarea se da por
+perdida: su tarea se reporta como fallida y la sesión deja de recibir trabajo,
+sin bloquear a las demás. Una sesión cuyo automator lanza una excepción (en
+lugar de reportar un `TaskResult`) se retira y su tarea vuelve a la cola.
+
+Los resultados se devuelven en el orden de entrada de las tareas.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from src.automation.abc.automator_interface import AutomatorInterface
+from src.automation.common.results import TaskResult, TaskResultStatus
+from src.automation.strategies.remote.automator import RemoteAutomator
+from src.core.constants import ConfigSections
+from src.core.models import FacturacionData
+from src.core.profile import ProfileSpec, SessionSpec
+
+
+class _Session:
+    """Estado de ejecución de una sesión dentro de `ParallelAutomator`."""
+
+    def __init__(self, spec: SessionSpec, automator: RemoteAutomator):
+        self.spec = spec
+        self.automator = automator
+        # Tarea en curso como (índice, instante de inicio), o None si está libre.
+        self.current: Optional[Tuple[int, float]] = None
+        # True si la sesión se retiró (tarea colgada o error del automator).
+        self.retired = False
+        self.completed = 0
+        self.thread: Optional[threading.Thread] = None
+
+
+class ParallelAutomator(AutomatorInterface):
+    """
+    Reparte las tareas entre N sesiones independientes de `RemoteAutomator`
+    (ver el docstring del módulo).
+    """
+
+    def __init__(
+        self,
+        latency_dir: Optional[Path] = Path("data/latency"),
+        automator_factory: Callable[..., RemoteAutomator] = RemoteAutomator,
+    ):
+        """
+        Args:
+            latency_dir: Directorio de los modelos de latencia (uno por sesión).
+            automator_factory: Construye el automator de cada sesión; recibe
+                               `latency_dir`, `session_name` y `display_name`.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.latency_dir = latency_dir
+        self._automator_factory = automator_factory
+        self.sessions: List[_Session] = []
+        self.task_timeout = 0.0
+        # Protege la cola de resultados y el estado de las sesiones.
+        self._done = threading.Condition()
+
+    def initialize(self, profile: ProfileSpec) -> None:
+        """
+        Inicializa todas las sesiones a la vez. Las que fallan se descartan;
+        basta con que una quede lista para continuar.
+
+        Raises:
+            RuntimeError: Si el perfil no declara sesiones o ninguna pudo inicializarse.
+        """
+        specs = profile.automation.sessions
+        if not specs:
+            self.logger.critical(
+                f"La automatización paralela requiere la sección '[{ConfigSections.AUTOMATION_SESSIONS}]' en el perfil."
+            )
+            raise RuntimeError("Configuración de sesiones incompleta.")
+
+        self.logger.info(f"Inicializando {len(specs)} sesiones en paralelo...")
+        self.task_timeout = profile.automation.session_task_timeout
+        with ThreadPoolExecutor(max_workers=len(specs), thread_name_prefix="SessionInit") as pool:
+            outcomes = list(pool.map(lambda spec: self._initialize_session(profile, spec), specs))
+        self.sessions = [session for session in outcomes if session is not None]
+
+        if not self.sessions:
+            raise RuntimeError("Ninguna sesión de automatización pudo inicializarse.")
+        self.logger.info(
+            f"{len(self.sessions)}/{len(specs)} sesiones listas: "
+            f"{', '.join(s.spec.name for s in self.sessions)}."
+        )
+
+    def _initialize_session(self, profile: ProfileSpec, spec: SessionSpec) -> Optional[_Session]:
+        automator = self._automator_factory(
+            latency_dir=self.latency_dir, session_name=spec.name, display_name=spec.display
+        )
+        session_profile = replace(profile, automation=replace(profile.automation, window_title=spec.window_title))
+        try:
+            automator.initialize(session_profile)
+        except Exception as e:
+            self.logger.error(f"La sesión '{spec.name}' no pudo inicializarse y se descarta: {e}")
+            try:
+                automator.shutdown()
+            except Exception:
+                pass
+            return None
+        return _Session(spec, automator)
+
+    def process_billing_tasks(self, tasks: Sequence[FacturacionData]) -> List[TaskResult]:
+        if not self.sessions:
+            raise RuntimeError("El automator paralelo no puede procesar tareas porque no tiene sesiones inicializadas.")
+
+        task_count = len(tasks)
+        active = [session for session in self.sessions if not session.retired]
+        self.logger.info(f"Iniciando el procesamiento de {task_count} tareas en {len(active)} sesiones.")
+
+        pending: "queue.SimpleQueue[int]" = queue.SimpleQueue()
+        for index in range(task_count):
+            pending.put(index)
+        results: List[Optional[TaskResult]] = [None] * task_count
+
+        for session in active:
+            session.thread = threading.Thread(
+                target=self._run_session, args=(session, active, tasks, pending, results),
+                name=f"Session-{session.spec.name}", daemon=True,
+            )
+            session.thread.start()
+
+        self._monitor(active, tasks, results)
+
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = TaskResult(
+                    status=TaskResultStatus.FAILED_UNEXPECTED_ERROR,
+                    task_identifier=tasks[index].numero_historia,
+                    message="No quedó ninguna sesión disponible para procesar la tarea.",
+                )
+
+        self.logger.info(
+            "Procesamiento paralelo finalizado. Tareas por sesión: "
+            + ", ".join(f"{s.spec.name}={s.completed}" for s in active)
+        )
+        return results
+
+    def _run_session(
+        self,
+        session: _Session,
+        peers: List[_Session],
+        tasks: Sequence[FacturacionData],
+        pending: "queue.SimpleQueue[int]",
+        results: List[Optional[TaskResult]],
+    ) -> None:
+        """Bucle de trabajo de una sesión: toma tareas de la cola hasta vaciarla."""
+        try:
+            while True:
+                with self._done:
+                    index = self._next_task(session, peers, pending)
+                    if index is None:
+                        return
+                    session.current = (index, time.monotonic())
+
+                try:
+                    result = session.automator.process_billing_tasks([tasks[index]])[0]
+                except Exception as e:
+                    with self._done:
+                        if not session.retired:
+                            self.logger.error(
+                                f"La sesión '{session.spec.name}' falló y se retira; su tarea vuelve a la cola. Error: {e}"
+                            )
+                            session.retired = True
+                            session.current = None
+                            pending.put(index)
+                    return
+
+                with self._done:
+                    if session.retired:
+                        # El monitor ya reportó la tarea como perdida; el resultado tardío se descarta.
+                        return
+                    session.current = None
+                    session.completed += 1
+                    results[index] = result
+                    self._done.notify_all()
+        finally:
+            with self._done:
+                self._done.notify_all()
+
+    def _next_task(self, session: _Session, peers: List[_Session], pending: "queue.SimpleQueue[int]") -> Optional[int]:
+        """
+        Toma el índice de la siguiente tarea, o None si la sesión debe terminar.
+        Con la cola vacía, espera mientras otra sesión tenga una tarea en curso:
+        si esa sesión falla, su tarea vuelve a la cola. Requiere `self._done`.
+        """
+        while not session.retired:
+            try:
+                return pending.get_nowait()
+            except queue.Empty:
+                if not any(p.current is not None for p in peers if p is not session and not p.retired):
+                    return None
+                self._done.wait()
+        return None
+
+    def _monitor(
+        self,
+        sessions: List[_Session],
+        tasks: Sequence[FacturacionData],
+        results: List[Optional[TaskResult]],
+    ) -> None:
+        """
+        Espera a que las sesiones terminen y retira las que se quedan colgadas en
+        una tarea más de `task_timeout` segundos.
+        """
+        check_interval = min(1.0, self.task_timeout / 4) if self.task_timeout > 0 else 1.0
+        with self._done:
+            while any(s.thread.is_alive() and not s.retired for s in sessions):
+                now = time.monotonic()
+                for session in sessions:
+                    if session.retired or session.current is None:
+                        continue
+                    index, started = session.current
+                    if self.task_timeout > 0 and now - started > self.task_timeout:
+                        self.logger.error(
+                            f"La sesión '{session.spec.name}' lleva {now - started:.0f} s en la tarea "
+                            f"{tasks[index].numero_historia}; se da por perdida y deja de recibir tareas."
+                        )
+                        session.retired = True
+                        session.current = None
+                        results[index] = TaskResult(
+                            status=TaskResultStatus.FAILED_UNEXPECTED_ERROR,
+                            task_identifier=tasks[index].numero_historia,
+                            message=f"La sesión '{session.spec.name}' no respondió en {self.task_timeout:.0f} s.",
+                        )
+                        self._done.notify_all()
+                self._done.wait(timeout=check_interval)
+
+    def shutdown(self) -> None:
+        self.logger.info("Finalizando todas las sesiones.")
+        for session in self.sessions:
+            if session.thread is not None and session.thread.is_alive():
+                self.logger.warning(f"La sesión '{session.spec.name}' sigue ocupada; se libera igualmente.")
+            try:
+                session.automator.shutdown()
+            except Exception as e:
+                self.logger.warning(f"Falló el cierre de la sesión '{session.spec.name}': {e}")
+        self.sessions = []
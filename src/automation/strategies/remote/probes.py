@@ -0,0 +1,133 @@
+# src/automation/strategies/remote/probes.py
+"""
+Biblioteca de sondas de disponibilidad para `RemoteControlFacade.wait_until`.
+
+Una sonda es un callable sin argumentos que inspecciona la GUI y devuelve:
+- `None` o `False` mientras la GUI aún no alcanzó el estado esperado, o
+- cualquier otro valor (incluida una cadena vacía) cuando ya lo alcanzó; ese
+  valor es el que devuelve `wait_until`.
+
+Una sonda también puede lanzar un `AutomationError` reintentable (ej. un fallo
+transitorio del portapapeles); `wait_until` lo trata como "aún no listo".
+
+Con `AsyncRemoteControlFacade` las sondas son corrutinas: `window_active` sirve
+tal cual (devuelve la corrutina de la fachada) y las que leen el portapapeles
+tienen su variante `Async*`.
+"""
+
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.automation.common.readback import ReadbackSpec
+    from src.automation.strategies.remote.async_remote_control import AsyncRemoteControlFacade
+    from src.automation.strategies.remote.remote_control import RemoteControlFacade
+    from src.core.models import FacturacionData
+
+
+def window_active(facade: 'RemoteControlFacade') -> Callable[[], bool]:
+    """Lista cuando la ventana de destino es la ventana activa (ej. tras cerrar diálogos)."""
+    def probe() -> bool:
+        return facade.is_window_active()
+    return probe
+
+
+def clipboard_changed(facade: 'RemoteControlFacade', sentinel: str) -> Callable[[], Optional[str]]:
+    """Lista cuando el portapapeles ya no contiene el centinela; devuelve su contenido."""
+    def probe() -> Optional[str]:
+        content = facade.paste_clipboard()
+        return None if content == sentinel else content
+    return probe
+
+
+class FieldValueCheck:
+    """
+    Estado y criterio de `FieldValueProbe`/`AsyncFieldValueProbe`: lista cuando
+    el campo con el foco contiene el valor esperado.
+
+    Atributos:
+        last_value: El último valor leído del campo (None si aún no se pudo leer),
+                    útil para reportar la discrepancia si la espera vence.
+    """
+
+    def __init__(self, facade, expected: str, read_timeout: float):
+        self.facade = facade
+        self.expected = expected.strip()
+        self.read_timeout = read_timeout
+        self.last_value: Optional[str] = None
+
+    def _check(self, content: str) -> bool:
+        self.last_value = content.strip()
+        return self.last_value == self.expected
+
+
+class FieldValueProbe(FieldValueCheck):
+    """
+    Lista cuando el campo con el foco contiene el valor esperado. Cada evaluación
+    copia el campo con `read_clipboard_with_sentinel`, sin mover el foco, por lo
+    que puede repetirse tantas veces como sea necesario.
+    """
+
+    facade: 'RemoteControlFacade'
+
+    def __call__(self) -> bool:
+        return self._check(self.facade.read_clipboard_with_sentinel(timeout=self.read_timeout))
+
+
+class AsyncFieldValueProbe(FieldValueCheck):
+    """Como `FieldValueProbe`, para `AsyncRemoteControlFacade`."""
+
+    facade: 'AsyncRemoteControlFacade'
+
+    async def __call__(self) -> bool:
+        return self._check(await self.facade.read_clipboard_with_sentinel(timeout=self.read_timeout))
+
+
+class ReadbackCheck:
+    """
+    Estado y criterio de `ReadbackProbe`/`AsyncReadbackProbe`: lista cuando todos
+    los campos de una lectura en bloque coinciden con la tarea. Un contenido que
+    el parser del perfil no reconoce cuenta como "aún no".
+
+    Atributos:
+        last_values: Los últimos valores leídos (None si aún no se pudo interpretar).
+        mismatches: Campo -> (esperado, encontrado) de la última lectura.
+    """
+
+    def __init__(self, facade, readback: 'ReadbackSpec', task: 'FacturacionData', read_timeout: float):
+        self.facade = facade
+        self.readback = readback
+        self.task = task
+        self.read_timeout = read_timeout
+        self.last_values: Optional[Dict[str, str]] = None
+        self.mismatches: Dict[str, Tuple[str, str]] = {}
+
+    def _check(self, payload: str) -> bool:
+        try:
+            values = self.readback.parser.parse(payload)
+        except ValueError:
+            return False
+        self.last_values = values
+        self.mismatches = self.readback.compare(self.task, values)
+        return not self.mismatches
+
+
+class ReadbackProbe(ReadbackCheck):
+    """
+    Lista cuando todos los campos de una lectura en bloque coinciden con la tarea.
+    Cada evaluación copia la región ya seleccionada y la divide con el parser
+    del perfil.
+    """
+
+    facade: 'RemoteControlFacade'
+
+    def __call__(self) -> bool:
+        return self._check(self.facade.read_clipboard_with_sentinel(timeout=self.read_timeout))
+
+
+class AsyncReadbackProbe(ReadbackCheck):
+    """Como `ReadbackProbe`, para `AsyncRemoteControlFacade`."""
+
+    facade: 'AsyncRemoteControlFacade'
+
+    async def __call__(self) -> bool:
+        return self._check(await self.facade.read_clipboard_with_sentinel(timeout=self.read_timeout))
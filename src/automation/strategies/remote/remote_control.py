@@ -6,43 +6,358 @@ en diferentes sistemas operativos (Windows y Linux).
 """
 
 import logging
-import subprocess
 import sys
 import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
-import pyperclip
-from pywinauto.keyboard import send_keys
+from src.automation.common.latency import LatencyModel
+from src.automation.strategies.remote import probes
+from src.automation.strategies.remote.backends.base import WindowBackend
+from src.automation.strategies.remote.backends.x11_clipboard import X11Clipboard
+from src.automation.strategies.remote.backends.xdotool_backend import XdotoolBackend
+from src.automation.strategies.remote.backends.xlib_backend import XlibBackend
+from src.automation.strategies.remote.x11_focus import X11FocusTracker
+from src.core.constants import LatencyActions, LinuxBackends
+from src.core.exceptions import AutomationError, ClipboardError, FocusError, ReadinessTimeoutError
 
-from src.core.exceptions import ClipboardError, FocusError
+T = TypeVar('T')
 
-# --- Importación Segura de Dependencias de Captura de Pantalla ---
-try:
-    from PIL import ImageGrab
-except ImportError:
-    ImageGrab = None  # Permite que el módulo se importe sin fallar si Pillow no está.
+# --- Importaciones Diferidas ---
+# pywinauto, pyperclip y Pillow son costosos de importar (en Linux,
+# `pywinauto.keyboard` incluso abre una conexión con el servidor X al cargarse).
+# Se importan la primera vez que se usan, de modo que importar este módulo
+# (ej. para `--help`, validar un perfil o ejecutar solo la fase de datos) no
+# paga ese coste. Tras la primera llamada, `import` solo consulta `sys.modules`.
 
-# --- Importación Condicional Específica de Windows ---
-if sys.platform == 'win32':
+def _send_keys(keys: str, pause: float) -> None:
+    from pywinauto.keyboard import send_keys
+    send_keys(keys, with_spaces=True, pause=pause)
+
+
+def _pyperclip():
+    import pyperclip
+    return pyperclip
+
+
+def _image_grab():
+    """Devuelve `PIL.ImageGrab`, o None si Pillow no está instalado."""
+    try:
+        from PIL import ImageGrab
+    except ImportError:
+        return None
+    return ImageGrab
+
+
+def _windows_desktop():
+    """Devuelve las clases de pywinauto necesarias en Windows (dependencia dura en ese S.O.)."""
     try:
         from pywinauto import Desktop
         from pywinauto.findwindows import ElementNotFoundError
     except ImportError:
-        # En Windows, pywinauto es una dependencia dura.
         raise ImportError("pywinauto no está instalado. Por favor, instálalo con 'pip install pywinauto'")
+    return Desktop, ElementNotFoundError
 
 
-class RemoteControlFacade:
+class WaitSchedule:
     """
-    Fachada que abstrae el control de ventanas para diferentes S.O.
-    Proporciona una API unificada y robusta para interactuar con una ventana.
+    Plan de una espera de `wait_until`, sin E/S: tiempo límite efectivo,
+    retardo inicial, intervalo con backoff y registro en el modelo de latencia.
+
+    Lo comparten `RemoteControlFacade` y `AsyncRemoteControlFacade`, que solo
+    aportan cómo evaluar la condición y cómo dormir entre sondeos:
+
+        schedule = facade._wait_schedule(...)
+        dormir(schedule.first_delay)
+        while True:
+            evaluar la condición -> schedule.satisfied(resultado) / schedule.failed(error)
+            dormir(schedule.next_delay())   # lanza ReadinessTimeoutError al vencer
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        timeout: float,
+        poll_interval: float,
+        backoff: float,
+        max_interval: float,
+        description: str,
+        model: Optional[LatencyModel] = None,
+        action: Optional[str] = None,
+        exhaust_upper_bound: bool = False,
+    ):
+        self.logger = logger
+        self.description = description
+        self.upper_bound = timeout
+        self.timeout = timeout
+        self.model = model if action else None
+        self.action = action
+        self.first_delay = 0.0
+        self.start = time.monotonic()
+        learned = timeout
+        if self.model is not None:
+            learned = self.model.timeout_for(action, timeout)
+            self.first_delay = min(self.model.first_poll_delay(action), learned)
+            if not exhaust_upper_bound:
+                self.timeout = learned
+        # Con `exhaust_upper_bound` el tiempo aprendido no acorta la espera: al
+        # superarlo solo se deja constancia y se sigue sondeando hasta el máximo.
+        self.learned_deadline: Optional[float] = self.start + learned if learned < self.timeout else None
+        self.deadline = self.start + self.timeout
+        self.interval = poll_interval
+        self.backoff = backoff
+        self.max_interval = max_interval
+        self.attempts = 0
+        self.last_error: Optional[AutomationError] = None
+
+    def satisfied(self, result: object) -> bool:
+        """Registra un sondeo; True si su resultado indica que la GUI está lista."""
+        self.attempts += 1
+        if result is None or result is False:
+            return False
+        elapsed = time.monotonic() - self.start
+        self.logger.debug(f"'{self.description}' cumplida en {elapsed:.3f} s ({self.attempts} sondeos).")
+        if self.model is not None:
+            self.model.record(self.action, elapsed)
+        return True
+
+    def failed(self, error: AutomationError) -> None:
+        """Registra un sondeo que lanzó un error reintentable ("aún no")."""
+        self.attempts += 1
+        self.last_error = error
+
+    def next_delay(self) -> float:
+        """
+        Segundos hasta el siguiente sondeo.
+
+        Raises:
+            ReadinessTimeoutError: Si venció el tiempo límite.
+        """
+        now = time.monotonic()
+        if self.learned_deadline is not None and now >= self.learned_deadline:
+            self.learned_deadline = None
+            self.logger.info(
+                f"'{self.description}' supera la latencia aprendida ({now - self.start:.2f} s); "
+                f"se sigue esperando hasta el máximo del perfil ({self.upper_bound:.2f} s)."
+            )
+        remaining = self.deadline - now
+        if remaining <= 0:
+            self.logger.debug(f"'{self.description}' no se cumplió tras {self.attempts} sondeos.")
+            if self.model is not None:
+                # Una espera agotada solo acota la latencia por abajo; se registra
+                # el máximo del perfil para que el modelo se vuelva conservador.
+                self.model.record(self.action, self.upper_bound)
+            raise ReadinessTimeoutError(self.description, self.timeout, self.last_error) from self.last_error
+        delay = min(self.interval, remaining)
+        self.interval = min(self.interval * self.backoff, self.max_interval)
+        return delay
+
+
+class BaseRemoteControlFacade:
+    """
+    Configuración y estado comunes a las fachadas de control remoto (backend,
+    display, modelo de latencia, búfer de teclas, costes por acción) y las
+    operaciones que no esperan ni hacen E/S con la GUI.
+
+    `RemoteControlFacade` añade las acciones síncronas y
+    `AsyncRemoteControlFacade` las mismas acciones como corrutinas.
     """
 
     def __init__(self):
         """Inicializa la fachada y sus propiedades de estado."""
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.window_id = None      # Para Linux (ID de ventana de xdotool)
+        self.window_id = None      # Para Linux (ID de ventana, en decimal como en xdotool)
         self.window_handle = None  # Para Windows (objeto de pywinauto)
+        # Intervalo inicial de sondeo de `wait_until`, en segundos.
+        self.poll_interval = 0.05
+        # Pausa entre teclas de `type_keys`, en segundos. La ajusta el perfil y,
+        # si está habilitada, la calibración de la sesión.
+        self.key_pause = 0.05
+        # Búfer de acciones: secuencias de teclas pendientes de enviar, como
+        # (teclas, pausa). Ver `type_keys` y `flush`.
+        self._pending_keys: List[Tuple[str, float]] = []
+        # En Linux, seguimiento del foco por eventos X11 (None si no está disponible).
+        self.focus_tracker: Optional[X11FocusTracker] = None
+        # Modelo de latencia opcional; lo asigna el automator si el perfil lo habilita.
+        self.latency_model: Optional[LatencyModel] = None
+        # Backend de ventanas y teclado en Linux (ver `backends`). 'auto' prueba el
+        # nativo (python-xlib) y recurre a xdotool si no está disponible.
+        self.linux_backend = LinuxBackends.AUTO
+        self.backend: Optional[WindowBackend] = None
+        # Display de X de la sesión (ej. ':2'); None usa el de `$DISPLAY`. Permite
+        # que varias fachadas del mismo proceso controlen displays distintos.
+        self.display_name: Optional[str] = None
+        # Portapapeles nativo de X11 (None si no está disponible o no se ha creado aún).
+        self.native_clipboard: Optional[X11Clipboard] = None
+        self._native_clipboard_checked = False
+        # Coste acumulado de las llamadas al backend: acción -> (llamadas, segundos).
+        self.action_costs: Dict[str, Tuple[int, float]] = {}
+
+    def _linux_backend(self) -> WindowBackend:
+        """Crea (una sola vez) el backend de Linux según `self.linux_backend`."""
+        if self.backend is None:
+            if self.linux_backend not in LinuxBackends.ALL:
+                raise ValueError(f"Backend de Linux desconocido: '{self.linux_backend}'. Opciones: {LinuxBackends.ALL}")
+            if self.linux_backend in (LinuxBackends.AUTO, LinuxBackends.XLIB):
+                self.backend = XlibBackend.create(self.display_name)
+                if self.backend is None and self.linux_backend == LinuxBackends.XLIB:
+                    raise FocusError("El backend 'xlib' fue solicitado pero no está disponible en este entorno.")
+            if self.backend is None:
+                if self.display_name is not None:
+                    # El teclado de xdotool (pywinauto) siempre escribe en el display del proceso.
+                    raise FocusError(
+                        f"La sesión en el display '{self.display_name}' requiere el backend 'xlib', "
+                        "que no está disponible en este entorno."
+                    )
+                self.backend = XdotoolBackend()
+            self.logger.info(f"Backend de ventanas de Linux: '{self.backend.name}'.")
+        return self.backend
+
+    @contextmanager
+    def _timed(self, action: str) -> Iterator[None]:
+        """Acumula en `action_costs` el tiempo de una llamada al backend."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            calls, total = self.action_costs.get(action, (0, 0.0))
+            self.action_costs[action] = (calls + 1, total + time.perf_counter() - start)
+
+    def describe_action_costs(self) -> str:
+        """Resumen legible del coste medio por acción del backend."""
+        return ", ".join(
+            f"{action}: {calls} x {total / calls * 1000:.2f} ms"
+            for action, (calls, total) in sorted(self.action_costs.items())
+        )
+
+    def _start_focus_tracker(self) -> None:
+        """Activa el seguimiento del foco por eventos, si el entorno lo permite."""
+        if self.focus_tracker is not None and self.focus_tracker.running:
+            return
+        tracker = X11FocusTracker(self.display_name)
+        self.focus_tracker = tracker if tracker.start() else None
+
+    def close(self) -> None:
+        """Libera los recursos persistentes de la fachada (ej. la conexión con X)."""
+        if self.focus_tracker is not None:
+            self.focus_tracker.stop()
+            self.focus_tracker = None
+        if self.backend is not None:
+            self.backend.close()
+            self.backend = None
+        if self.native_clipboard is not None:
+            self.native_clipboard.close()
+            self.native_clipboard = None
+        self._native_clipboard_checked = False
+
+    def type_keys(self, keys: str, pause: Optional[float] = None) -> None:
+        """
+        Encola una secuencia de teclas para la ventana de destino.
+
+        Las teclas no se envían de inmediato: las secuencias consecutivas se
+        acumulan y se envían juntas en el siguiente punto de sincronización
+        (`flush`, que llaman las esperas y la lectura del portapapeles), con una
+        sola verificación de foco por envío.
+
+        Delega la interpretación de teclas especiales (ej. {ENTER}, {TAB}, ^c)
+        al módulo `pywinauto.keyboard`, que proporciona una implementación
+        robusta y multiplataforma.
+
+        Args:
+            keys: La cadena de texto y secuencias a enviar.
+            pause: Pausa entre teclas; por defecto, `self.key_pause`.
+        """
+        pause = self.key_pause if pause is None else pause
+        if self._pending_keys and self._pending_keys[-1][1] == pause:
+            self._pending_keys[-1] = (self._pending_keys[-1][0] + keys, pause)
+        else:
+            self._pending_keys.append((keys, pause))
+
+    def discard_pending_keys(self) -> None:
+        """
+        Descarta las teclas encoladas sin enviarlas. Se usa cuando una tarea
+        falla: la GUI quedó en un estado desconocido y las teclas pensadas para
+        el estado anterior no deben llegar con el reintento ni con la tarea siguiente.
+        """
+        if self._pending_keys:
+            discarded = ''.join(keys for keys, _ in self._pending_keys)
+            self.logger.warning(f"Se descartan teclas pendientes sin enviar: '{discarded}'")
+            self._pending_keys = []
+
+    def _native_clipboard(self) -> Optional[X11Clipboard]:
+        """
+        Crea (una sola vez) el portapapeles nativo en Linux, salvo que el perfil
+        pida el backend `xdotool` (todo por procesos externos). None si no aplica.
+        """
+        if not self._native_clipboard_checked:
+            self._native_clipboard_checked = True
+            if sys.platform.startswith('linux') and self.linux_backend != LinuxBackends.XDOTOOL:
+                self.native_clipboard = X11Clipboard.create(self.display_name)
+        return self.native_clipboard
+
+    def _wait_schedule(
+        self,
+        timeout: float,
+        poll_interval: Optional[float],
+        backoff: float,
+        max_interval: float,
+        description: str,
+        action: Optional[str],
+        exhaust_upper_bound: bool,
+    ) -> WaitSchedule:
+        """Prepara el plan de una espera de `wait_until` (ver `WaitSchedule`)."""
+        return WaitSchedule(
+            self.logger, timeout, self.poll_interval if poll_interval is None else poll_interval,
+            backoff, max_interval, description, self.latency_model, action, exhaust_upper_bound,
+        )
+
+    def _native_read_result(self, content: Optional[str], start: float) -> str:
+        """
+        Cierra una lectura nativa del portapapeles iniciada en `start`: valida el
+        contenido y registra la latencia de la copia.
+
+        Raises:
+            ClipboardError: Si el propietario no entregó el contenido.
+        """
+        if content is None:
+            raise ClipboardError("El propietario del portapapeles no entregó su contenido a tiempo.")
+        elapsed = time.monotonic() - start
+        if self.latency_model is not None:
+            self.latency_model.record(LatencyActions.CLIPBOARD_COPY, elapsed)
+        self.logger.debug(f"Lectura de portapapeles nativa en {elapsed * 1000:.1f} ms. Contenido: '{content[:50]}...'")
+        return content
+
+    def _capture_screenshot(self, file_path: Path) -> None:
+        """Captura el escritorio en `file_path` (ver `RemoteControlFacade.take_screenshot`). Bloquea."""
+        self.logger.info(f"Intentando tomar captura de pantalla de diagnóstico. Destino: {file_path}")
+
+        if sys.platform == 'win32':
+            ImageGrab = _image_grab()
+            if not ImageGrab:
+                self.logger.error("La librería Pillow (PIL) no está disponible. No se puede tomar la captura.")
+                raise ImportError("Pillow no está instalado, imposible tomar captura de pantalla.")
+            
+            try:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                image = ImageGrab.grab(all_screens=True)
+                image.save(file_path)
+                self.logger.info("Captura de pantalla guardada exitosamente en Windows.")
+            except Exception as e:
+                self.logger.error(f"Falló la operación de tomar/guardar la captura de pantalla: {e}")
+                raise
+        else:
+            self.logger.warning(
+                f"La toma de capturas de pantalla no está implementada para el sistema operativo '{sys.platform}'. "
+                "Se omite la acción."
+            )
+
+
+class RemoteControlFacade(BaseRemoteControlFacade):
+    """
+    Fachada que abstrae el control de ventanas para diferentes S.O.
+    Proporciona una API unificada y robusta para interactuar con una ventana.
+    """
 
     def find_and_focus_window(self, title: str) -> None:
         """
@@ -58,25 +373,24 @@ class RemoteControlFacade:
         self.logger.info(f"Buscando y enfocando ventana con título: '{title}' en '{sys.platform}'")
 
         if sys.platform.startswith('linux'):
+            backend = self._linux_backend()
+            try:
+                with self._timed('find_window'):
+                    self.window_id = backend.find_window(title)
+                self.logger.info(f"Ventana encontrada en Linux con ID: {self.window_id} (backend {backend.name})")
+                self._start_focus_tracker()
+                with self._timed('activate'):
+                    backend.activate(self.window_id)
+            except FocusError as e:
+                self.logger.critical(f"No se pudo encontrar o activar la ventana '{title}'. Error: {e}")
+                raise
             try:
-                result = subprocess.run(
-                    ['xdotool', 'search', '--limit', '1', '--name', title],
-                    capture_output=True, text=True, check=True, timeout=10
-                )
-                self.window_id = result.stdout.strip()
-                if not self.window_id:
-                    raise FileNotFoundError
-
-                self.logger.info(f"Ventana encontrada en Linux con ID: {self.window_id}")
-                # 'windowactivate' es más robusto que 'windowfocus'
-                subprocess.run(['xdotool', 'windowactivate', self.window_id], check=True)
-                self.wait(0.5)
-
-            except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
-                self.logger.critical(f"No se pudo encontrar la ventana '{title}' con xdotool. Error: {e}")
-                raise FocusError(f"No se pudo encontrar la ventana '{title}' con xdotool.") from e
+                self.wait_until(probes.window_active(self), timeout=0.5, description="ventana activada")
+            except ReadinessTimeoutError:
+                self.logger.warning("La ventana no se reporta como activa tras activarla; se verificará antes de cada acción.")
 
         elif sys.platform == 'win32':
+            Desktop, ElementNotFoundError = _windows_desktop()
             try:
                 desktop = Desktop(backend='uia')
                 self.window_handle = desktop.window(title=title)
@@ -89,62 +403,195 @@ class RemoteControlFacade:
         else:
             raise NotImplementedError(f"El control remoto no está implementado para: {sys.platform}")
 
+    def is_window_active(self) -> bool:
+        """Indica si la ventana de destino es la ventana activa del escritorio."""
+        if sys.platform == 'win32':
+            return self.window_handle.is_active()
+        if not sys.platform.startswith('linux'):
+            raise NotImplementedError(f"El control remoto no está implementado para: {sys.platform}")
+        if self.focus_tracker is not None and self.focus_tracker.running:
+            # Comparación local: el tracker ya conoce la ventana activa.
+            return self.focus_tracker.is_active(int(self.window_id))
+        with self._timed('active_window'):
+            return self._linux_backend().active_window() == self.window_id
+
     def _ensure_focus(self) -> None:
         """Valida y recupera el foco de la ventana antes de cada acción crítica."""
         self.logger.debug("Asegurando el foco de la ventana...")
         if self.window_handle is None and self.window_id is None:
             raise FocusError("La ventana no ha sido inicializada. Llama a 'find_and_focus_window' primero.")
+        if sys.platform != 'win32' and not sys.platform.startswith('linux'):
+            return
 
-        if sys.platform == 'win32':
-            if not self.window_handle.is_active():
-                self.logger.warning("Ventana perdió el foco. Intentando recuperarlo...")
+        if not self.is_window_active():
+            self.logger.warning("Ventana perdió el foco. Intentando recuperarlo...")
+            if sys.platform == 'win32':
                 self.window_handle.set_focus()
-                self.wait(0.1)
-                if not self.window_handle.is_active():
-                    raise FocusError("No se pudo recuperar el foco de la ventana en Windows.")
-        elif sys.platform.startswith('linux'):
+            else:
+                with self._timed('activate'):
+                    self._linux_backend().activate(self.window_id)
             try:
-                active_window_id = subprocess.check_output(['xdotool', 'getactivewindow']).strip().decode()
-                if self.window_id != active_window_id:
-                    self.logger.warning("Ventana perdió el foco. Intentando recuperarlo...")
-                    subprocess.run(['xdotool', 'windowactivate', self.window_id], check=True)
-                    self.wait(0.1)
-                    active_window_id = subprocess.check_output(['xdotool', 'getactivewindow']).strip().decode()
-                    if self.window_id != active_window_id:
-                        raise FocusError("No se pudo recuperar el foco de la ventana en Linux.")
-            except (FileNotFoundError, subprocess.CalledProcessError) as e:
-                raise FocusError("Falló la dependencia 'xdotool' al verificar el foco.") from e
-        
+                self.wait_until(probes.window_active(self), timeout=0.5, description="foco recuperado")
+            except ReadinessTimeoutError as e:
+                raise FocusError(f"No se pudo recuperar el foco de la ventana en '{sys.platform}'.") from e
+
         self.logger.debug("Foco de la ventana asegurado.")
 
     def wait(self, seconds: float) -> None:
         """Pausa la ejecución durante un número determinado de segundos."""
+        self.flush()
         self.logger.debug(f"Pausando ejecución por {seconds:.2f} segundos.")
         time.sleep(seconds)
 
-    def type_keys(self, keys: str) -> None:
+    def wait_until(
+        self,
+        condition: Callable[[], T],
+        timeout: float,
+        poll_interval: Optional[float] = None,
+        backoff: float = 1.5,
+        max_interval: float = 0.5,
+        description: str = "condición de disponibilidad",
+        action: Optional[str] = None,
+        exhaust_upper_bound: bool = False,
+    ) -> T:
         """
-        Envía una secuencia de teclas a la ventana con foco garantizado.
+        Evalúa `condition` hasta que la GUI esté lista o venza el tiempo límite.
 
-        Delega la interpretación de teclas especiales (ej. {ENTER}, {TAB}, ^c)
-        al módulo `pywinauto.keyboard`, que proporciona una implementación
-        robusta y multiplataforma.
+        A diferencia de una espera fija, retorna en cuanto la condición se cumple.
+        Entre evaluaciones espera `poll_interval` segundos, multiplicando el
+        intervalo por `backoff` en cada intento (hasta `max_interval`) para no
+        saturar la GUI en esperas largas. Ver `probes` para las condiciones
+        disponibles.
 
         Args:
-            keys: La cadena de texto y secuencias a enviar.
+            condition: Sonda sin argumentos. `None`/`False` significa "aún no";
+                       cualquier otro valor se devuelve. Los `AutomationError`
+                       reintentables que lance se tratan como "aún no".
+            timeout: Tiempo máximo de espera, en segundos.
+            poll_interval: Intervalo inicial; por defecto, `self.poll_interval`.
+            backoff: Factor de crecimiento del intervalo entre sondeos.
+            max_interval: Intervalo máximo entre sondeos.
+            description: Texto para los logs y el mensaje de error.
+            action: Tipo de acción (ver `LatencyActions`). Si hay un modelo de
+                    latencia, la espera se registra en él y el tiempo límite
+                    efectivo se deriva de la latencia observada, sin superar
+                    `timeout`.
+            exhaust_upper_bound: Si es True, la espera solo vence al agotar
+                    `timeout`, aunque haya un tiempo aprendido menor. Para las
+                    esperas cuyo vencimiento es un veredicto (ej. la validación
+                    del paciente), donde una carga lenta no debe confundirse
+                    con una discrepancia.
+
+        Returns:
+            El valor devuelto por la condición.
+
+        Raises:
+            ReadinessTimeoutError: Si la condición no se cumple a tiempo.
+        """
+        self.flush()
+        schedule = self._wait_schedule(
+            timeout, poll_interval, backoff, max_interval, description, action, exhaust_upper_bound
+        )
+        if schedule.first_delay > 0:
+            time.sleep(schedule.first_delay)
+        while True:
+            try:
+                result = condition()
+            except AutomationError as e:
+                if not e.is_retryable:
+                    raise
+                schedule.failed(e)
+            else:
+                if schedule.satisfied(result):
+                    return result
+            time.sleep(schedule.next_delay())
+
+    def flush(self) -> None:
+        """
+        Envía las teclas encoladas con foco garantizado. Las secuencias con la
+        misma pausa se envían en una única llamada a `send_keys`.
         """
+        if not self._pending_keys:
+            return
+        pending, self._pending_keys = self._pending_keys, []
         self._ensure_focus()
-        self.logger.info(f"Enviando teclas: '{keys}'")
-        # send_keys se encarga de la lógica de backend y traduce las secuencias
-        # especiales al comando correcto, solucionando el error original.
-        send_keys(keys, with_spaces=True, pause=0.05)
+        for keys, pause in pending:
+            self.logger.info(f"Enviando teclas: '{keys}'")
+            with self._timed('send_keys'):
+                if self.backend is not None:
+                    self.backend.send_keys(keys, pause)
+                else:
+                    # send_keys se encarga de la lógica de backend y traduce las secuencias
+                    # especiales al comando correcto, solucionando el error original.
+                    _send_keys(keys, pause=pause)
+
+    def paste_clipboard(self) -> str:
+        """Lee el contenido actual del portapapeles, sin enviar teclas."""
+        clipboard = self._native_clipboard()
+        if clipboard is not None:
+            content = clipboard.read(timeout=1.0)
+            if content is None:
+                raise ClipboardError("El propietario del portapapeles no entregó su contenido.")
+            return content
+        pyperclip = _pyperclip()
+        try:
+            return pyperclip.paste()
+        except pyperclip.PyperclipException as e:
+            raise ClipboardError("Fallo técnico al leer el contenido del portapapeles.") from e
+
+    def copy_to_clipboard(self, text: str, timeout: float = 1.0) -> None:
+        """
+        Deja `text` en el portapapeles y verifica que quedó publicado antes de
+        retornar (el propio texto actúa como centinela).
+
+        Raises:
+            ClipboardError: Si el portapapeles no refleja el texto a tiempo.
+        """
+        clipboard = self._native_clipboard()
+        if clipboard is not None:
+            # La conexión nativa es la propietaria de CLIPBOARD y sirve el texto directamente.
+            clipboard.write(text)
+            return
 
-    def read_clipboard_with_sentinel(self, delay_sec: float = 0.2) -> str:
+        pyperclip = _pyperclip()
+        try:
+            pyperclip.copy(text)
+        except pyperclip.PyperclipException as e:
+            raise ClipboardError("Fallo técnico al copiar texto al portapapeles.") from e
+        try:
+            self.wait_until(
+                lambda: self.paste_clipboard() == text, timeout=timeout, description="texto publicado en el portapapeles"
+            )
+        except ReadinessTimeoutError as e:
+            raise ClipboardError("El portapapeles no refleja el texto copiado.") from e
+
+    def paste_text(self, text: str, timeout: float = 1.0) -> None:
+        """
+        Introduce `text` en el control con el foco pegándolo con Ctrl+V, en un
+        tiempo independiente de su longitud.
+
+        Raises:
+            ClipboardError: Si no se pudo publicar el texto en el portapapeles.
+        """
+        # Las teclas pendientes se envían antes de tocar el portapapeles, y el
+        # Ctrl+V se envía de inmediato para que ninguna lectura posterior
+        # reemplace el contenido antes de pegarlo.
+        self.flush()
+        self.copy_to_clipboard(text, timeout)
+        self.type_keys('^v')
+        self.flush()
+
+    def read_clipboard_with_sentinel(self, timeout: float = 1.0) -> str:
         """
         Lee el portapapeles de forma fiable utilizando un valor centinela.
 
+        Copia el campo con el foco (Ctrl+C) y sondea el portapapeles hasta que el
+        centinela es reemplazado, retornando en cuanto la GUI completa la copia.
+        Con el portapapeles nativo de X11 no hace falta centinela: se espera la
+        notificación de cambio de propietario y se lee el contenido una vez.
+
         Args:
-            delay_sec: Pequeña pausa para permitir que la GUI procese la copia.
+            timeout: Tiempo máximo para que la GUI procese la copia, en segundos.
 
         Returns:
             El contenido del portapapeles.
@@ -152,7 +599,11 @@ class RemoteControlFacade:
         Raises:
             ClipboardError: Si la operación de copia/lectura falla.
         """
-        self._ensure_focus()
+        clipboard = self._native_clipboard()
+        if clipboard is not None:
+            return self._read_clipboard_native(clipboard, timeout)
+
+        pyperclip = _pyperclip()
         sentinel = f"__SENTINEL_{time.monotonic()}__"
         
         try:
@@ -160,20 +611,34 @@ class RemoteControlFacade:
         except pyperclip.PyperclipException as e:
             raise ClipboardError("Fallo técnico al copiar el centinela al portapapeles.") from e
 
+        # El centinela se copia localmente; las teclas pendientes y el Ctrl+C
+        # se envían juntos, con una sola verificación de foco.
         self.type_keys('^c')
-        self.wait(delay_sec)
-
+        self.flush()
         try:
-            content = pyperclip.paste()
-        except pyperclip.PyperclipException as e:
-            raise ClipboardError("Fallo técnico al leer el contenido del portapapeles.") from e
+            content = self.wait_until(
+                probes.clipboard_changed(self, sentinel), timeout=timeout,
+                description="copia al portapapeles", action=LatencyActions.CLIPBOARD_COPY
+            )
+        except ReadinessTimeoutError as e:
+            raise ClipboardError("La operación de copia no tuvo efecto (el centinela persiste).") from e
 
-        if content == sentinel:
-            raise ClipboardError("La operación de copia no tuvo efecto (el centinela persiste).")
-            
         self.logger.debug(f"Lectura de portapapeles exitosa. Contenido: '{content[:50]}...'")
         return content
 
+    def _read_clipboard_native(self, clipboard: X11Clipboard, timeout: float) -> str:
+        # Las teclas pendientes se envían antes de medir: la latencia registrada
+        # es la de la copia, no la de escribir lo que hubiera en el búfer.
+        self.flush()
+        start = time.monotonic()
+        since = clipboard.owner_changes
+        self.type_keys('^c')
+        self.flush()
+        if not clipboard.wait_for_owner_change(since, timeout):
+            raise ClipboardError("La operación de copia no tuvo efecto (el portapapeles no cambió de propietario).")
+        content = clipboard.read(timeout=max(0.0, start + timeout - time.monotonic()))
+        return self._native_read_result(content, start)
+
     def take_screenshot(self, file_path: Path) -> None:
         """
         Toma una captura de pantalla del escritorio completo y la guarda.
@@ -182,23 +647,4 @@ class RemoteControlFacade:
         Args:
             file_path: La ruta completa donde se guardará la imagen.
         """
-        self.logger.info(f"Intentando tomar captura de pantalla de diagnóstico. Destino: {file_path}")
-
-        if sys.platform == 'win32':
-            if not ImageGrab:
-                self.logger.error("La librería Pillow (PIL) no está disponible. No se puede tomar la captura.")
-                raise ImportError("Pillow no está instalado, imposible tomar captura de pantalla.")
-            
-            try:
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                image = ImageGrab.grab(all_screens=True)
-                image.save(file_path)
-                self.logger.info("Captura de pantalla guardada exitosamente en Windows.")
-            except Exception as e:
-                self.logger.error(f"Falló la operación de tomar/guardar la captura de pantalla: {e}")
-                raise
-        else:
-            self.logger.warning(
-                f"La toma de capturas de pantalla no está implementada para el sistema operativo '{sys.platform}'. "
-                "Se omite la acción."
-            )
\ No newline at end of file
+        self._capture_screenshot(file_path)
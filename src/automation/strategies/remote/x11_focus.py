@@ -0,0 +1,131 @@
+# src/automation/strategies/remote/x11_focus.py
+"""
+Seguimiento del foco en X11 por eventos, sin lanzar procesos.
+
+`X11FocusTracker` mantiene una conexión persistente con el servidor X,
+se suscribe a los cambios de la propiedad `_NET_ACTIVE_WINDOW` de la ventana
+raíz (la publica cualquier gestor de ventanas compatible con EWMH) y guarda en
+memoria la ventana activa. Así `RemoteControlFacade._ensure_focus` se reduce a
+una comparación local y solo vuelve a tocar X cuando el foco cambió de verdad.
+
+Requiere python-xlib (instalado junto a pywinauto en Linux) y un gestor de
+ventanas EWMH. Si falta cualquiera de los dos, `start` retorna False y la
+fachada sigue usando `xdotool`.
+"""
+
+import logging
+import select
+import threading
+from typing import Optional
+
+
+class X11FocusTracker:
+    """Mantiene en memoria la ventana activa del display, actualizada por eventos."""
+
+    def __init__(self, display_name: Optional[str] = None, poll_timeout: float = 0.5):
+        """
+        Args:
+            display_name: Display de X (ej. ':1'); por defecto, el de `$DISPLAY`.
+            poll_timeout: Cada cuánto el hilo de eventos comprueba si debe detenerse.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.display_name = display_name
+        self.poll_timeout = poll_timeout
+        self._display = None
+        self._root = None
+        self._atom = None
+        self._active: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Número de cambios de foco recibidos; útil para diagnóstico y pruebas.
+        self.changes = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def active_window(self) -> Optional[int]:
+        """ID de la ventana activa según el último evento recibido."""
+        return self._active
+
+    def start(self) -> bool:
+        """
+        Abre la conexión y lanza el hilo de eventos.
+
+        Returns:
+            True si el seguimiento quedó activo; False si no es posible en este
+            entorno (sin python-xlib, sin servidor X o sin gestor EWMH).
+        """
+        try:
+            from Xlib import X, display
+            from Xlib.error import DisplayError
+        except ImportError:
+            self.logger.info("python-xlib no está disponible; el foco se verificará con xdotool.")
+            return False
+
+        try:
+            self._display = display.Display(self.display_name)
+        except (DisplayError, OSError) as e:
+            self.logger.info(f"No se pudo conectar al servidor X ({e}); el foco se verificará con xdotool.")
+            return False
+
+        self._root = self._display.screen().root
+        self._atom = self._display.intern_atom('_NET_ACTIVE_WINDOW')
+        self._active = self._read_active_window()
+        if self._active is None:
+            self.logger.info("El gestor de ventanas no publica _NET_ACTIVE_WINDOW; el foco se verificará con xdotool.")
+            self._display.close()
+            self._display = None
+            return False
+
+        self._root.change_attributes(event_mask=X.PropertyChangeMask)
+        self._display.flush()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="X11FocusTracker", daemon=True)
+        self._thread.start()
+        self.logger.info(f"Seguimiento de foco por eventos activo (ventana activa: {self._active}).")
+        return True
+
+    def stop(self) -> None:
+        """Detiene el hilo de eventos y cierra la conexión."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_timeout * 2)
+            self._thread = None
+        if self._display is not None:
+            self._display.close()
+            self._display = None
+
+    def is_active(self, window_id: int) -> bool:
+        return self._active == window_id
+
+    def _read_active_window(self) -> Optional[int]:
+        from Xlib import X
+        prop = self._root.get_full_property(self._atom, X.AnyPropertyType)
+        if prop is None or not prop.value:
+            return None
+        return int(prop.value[0])
+
+    def _run(self) -> None:
+        # Solo este hilo usa la conexión a partir de aquí; el resto del proceso
+        # únicamente lee `_active`.
+        try:
+            while not self._stop.is_set():
+                if not self._display.pending_events():
+                    select.select([self._display.fileno()], [], [], self.poll_timeout)
+                    continue
+                self._handle_event(self._display.next_event())
+        except Exception as e:
+            self.logger.warning(f"El seguimiento de foco se detuvo por un error de X: {e}")
+            self._active = None
+
+    def _handle_event(self, event) -> None:
+        from Xlib import X
+        if event.type != X.PropertyNotify or event.atom != self._atom:
+            return
+        active = self._read_active_window()
+        if active != self._active:
+            self.logger.debug(f"Foco cambiado: {self._active} -> {active}")
+            self._active = active
+            self.changes += 1
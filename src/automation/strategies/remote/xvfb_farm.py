@@ -0,0 +1,234 @@
+# src/automation/strategies/remote/xvfb_farm.py
+"""
+Granja de displays virtuales: K procesos de automatización contra K copias del
+SAF, cada una en su propio Xvfb.
+
+Para cada worker, `XvfbFarmAutomator.initialize` levanta:
+1. Un `Xvfb` con `-displayfd`, de modo que el servidor elige un display libre y
+   lo comunica por una tubería (sin carreras entre granjas simultáneas).
+2. Un gestor de ventanas ligero (por defecto `openbox`): los backends de la
+   fachada necesitan EWMH para encontrar y activar ventanas.
+3. Una instancia del SAF (`python -m saf.app`) en ese display.
+
+`process_billing_tasks` reparte las tareas en K fragmentos contiguos
+(`TaskBatch.shard`) y ejecuta cada uno en un proceso independiente
+(`run_shard`), que corre un `RemoteAutomator` normal con `DISPLAY` apuntando a
+su Xvfb. Los `TaskResult` se reúnen en el orden de entrada.
+
+Cada llamada a `process_billing_tasks` lanza workers nuevos, que inicializan
+(y, si el perfil lo pide, calibran) su sesión desde cero; por eso la granja no
+admite la carga en streaming (`chunk_size`), que la llamaría una vez por bloque.
+
+Es una herramienta de desarrollo y benchmark (ver `scripts/run_xvfb_farm.py`);
+requiere Linux con Xvfb y el gestor de ventanas elegido instalados.
+"""
+
+import logging
+import multiprocessing
+import os
+import select
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from src.automation.abc.automator_interface import AutomatorInterface
+from src.automation.common.results import TaskResult, TaskResultStatus
+from src.core.models import FacturacionData, TaskBatch
+from src.core.profile import ProfileSpec
+
+PROJECT_ROOT = Path(__file__).resolve().parents[4]
+
+
+def run_shard(profile_name: str, display: str, tasks: TaskBatch, profiles_dir: str) -> List[TaskResult]:
+    """
+    Punto de entrada de cada proceso worker: automatiza `tasks` en `display`.
+    Se ejecuta en un proceso nuevo (`spawn`), por lo que carga el perfil por su
+    nombre en lugar de recibir el `ProfileSpec` compilado.
+    """
+    os.environ['DISPLAY'] = display
+    from src.automation.strategies.remote.automator import RemoteAutomator
+    from src.config_loader import ConfigLoader
+    from src.logger_setup import setup_logging
+
+    setup_logging()
+    profile = ConfigLoader(profiles_dir).load_profile(profile_name)
+    automator = RemoteAutomator(session_name=f"xvfb{display.lstrip(':')}", display_name=display)
+    try:
+        automator.initialize(profile)
+        return automator.process_billing_tasks(tasks)
+    finally:
+        automator.shutdown()
+
+
+class XvfbFarmAutomator(AutomatorInterface):
+    """Automator que reparte las tareas entre K displays virtuales (ver módulo)."""
+
+    def __init__(
+        self,
+        workers: int,
+        window_manager: Optional[str] = "openbox",
+        screen: str = "1280x800x24",
+        startup_timeout: float = 15.0,
+        profiles_dir: str | Path = "config/profiles",
+    ):
+        """
+        Args:
+            workers: Número de displays (y de procesos worker).
+            window_manager: Ejecutable del gestor de ventanas; None para no lanzar ninguno.
+            screen: Geometría y profundidad de cada Xvfb.
+            startup_timeout: Máximo para que cada Xvfb y su SAF estén listos.
+            profiles_dir: Directorio de perfiles que leen los workers.
+        """
+        if workers <= 0:
+            raise ValueError(f"El número de workers debe ser positivo (recibido: {workers}).")
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.workers = workers
+        self.window_manager = window_manager
+        self.screen = screen
+        self.startup_timeout = startup_timeout
+        self.profiles_dir = str(profiles_dir)
+        self.displays: List[str] = []
+        self._processes: List[subprocess.Popen] = []
+        self._profile_name: Optional[str] = None
+
+    def initialize(self, profile: ProfileSpec) -> None:
+        """
+        Raises:
+            RuntimeError: Si el perfil usa carga en streaming, si falta Xvfb o
+                          el gestor de ventanas, o si algún display o SAF no
+                          arranca a tiempo.
+        """
+        if not sys.platform.startswith('linux'):
+            raise RuntimeError("La granja de displays virtuales solo está disponible en Linux.")
+        if profile.data_source is not None and profile.data_source.chunk_size > 0:
+            raise RuntimeError(
+                "La granja Xvfb no admite la carga en streaming ('chunk_size' en [DataSource]): cada bloque "
+                "lanzaría y reinicializaría todos los workers. Elimina 'chunk_size' del perfil."
+            )
+        for executable in filter(None, ("Xvfb", self.window_manager)):
+            if shutil.which(executable) is None:
+                raise RuntimeError(f"No se encontró '{executable}' en el PATH; es necesario para la granja Xvfb.")
+        if not profile.automation.window_title:
+            raise RuntimeError("El perfil debe declarar el título de la ventana del SAF en 'window_title'.")
+
+        self._profile_name = profile.name
+        self.logger.info(f"Levantando {self.workers} displays virtuales con SAF...")
+        try:
+            for _ in range(self.workers):
+                display = self._start_display()
+                env = dict(os.environ, DISPLAY=display)
+                if self.window_manager:
+                    self._spawn([self.window_manager], env)
+                self._spawn([sys.executable, "-m", "saf.app"], env)
+                self._wait_for_window(display, profile.automation.window_title)
+                self.displays.append(display)
+                self.logger.info(f"Display {display} listo con SAF.")
+        except Exception:
+            self.shutdown()
+            raise
+
+    def _start_display(self) -> str:
+        """Lanza un Xvfb que elige su propio display libre y lo retorna (ej. ':93')."""
+        read_fd, write_fd = os.pipe()
+        try:
+            process = subprocess.Popen(
+                ["Xvfb", "-displayfd", str(write_fd), "-screen", "0", self.screen, "-nolisten", "tcp"],
+                pass_fds=(write_fd,), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            self._processes.append(process)
+            os.close(write_fd)
+            write_fd = None
+            ready, _, _ = select.select([read_fd], [], [], self.startup_timeout)
+            number = os.read(read_fd, 16).decode().strip() if ready else ""
+        finally:
+            os.close(read_fd)
+            if write_fd is not None:
+                os.close(write_fd)
+        if not number:
+            raise RuntimeError(f"Xvfb no informó su display en {self.startup_timeout:.0f} s.")
+        return f":{number}"
+
+    def _spawn(self, command: List[str], env: dict) -> None:
+        self._processes.append(subprocess.Popen(
+            command, env=env, cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        ))
+
+    def _wait_for_window(self, display: str, title: str) -> None:
+        """Espera a que el gestor de ventanas publique la ventana del SAF en `display`."""
+        from src.automation.strategies.remote.backends.xlib_backend import XlibBackend
+        from src.core.exceptions import FocusError
+
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            backend = XlibBackend.create(display)
+            if backend is not None:
+                try:
+                    backend.find_window(title)
+                    return
+                except FocusError:
+                    pass
+                finally:
+                    backend.close()
+            time.sleep(0.2)
+        raise RuntimeError(f"La ventana '{title}' no apareció en el display {display} en {self.startup_timeout:.0f} s.")
+
+    def process_billing_tasks(self, tasks: Sequence[FacturacionData]) -> List[TaskResult]:
+        if not self.displays:
+            raise RuntimeError("La granja no puede procesar tareas porque no tiene displays inicializados.")
+
+        batch = tasks if isinstance(tasks, TaskBatch) else TaskBatch.from_tasks(tasks)
+        # Con menos tareas que displays, los fragmentos vacíos no lanzan worker.
+        assignments = [
+            (display, shard) for display, shard in zip(self.displays, batch.shard(len(self.displays))) if len(shard)
+        ]
+        self.logger.info(
+            f"Repartiendo {len(batch)} tareas en {len(assignments)} workers: "
+            f"{', '.join(str(len(shard)) for _, shard in assignments)}."
+        )
+
+        start = time.perf_counter()
+        results: List[TaskResult] = []
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=max(len(assignments), 1), mp_context=context) as pool:
+            futures = [
+                pool.submit(run_shard, self._profile_name, display, shard, self.profiles_dir)
+                for display, shard in assignments
+            ]
+            for (display, shard), future in zip(assignments, futures):
+                try:
+                    results.extend(future.result())
+                except Exception as e:
+                    self.logger.error(f"El worker del display {display} falló: {e}")
+                    results.extend(
+                        TaskResult(
+                            status=TaskResultStatus.FAILED_UNEXPECTED_ERROR,
+                            task_identifier=task_id,
+                            message=f"El worker del display {display} falló: {e}",
+                        )
+                        for task_id in shard.column("numero_historia")
+                    )
+
+        elapsed = time.perf_counter() - start
+        self.logger.info(
+            f"Granja finalizada: {len(results)} tareas en {elapsed:.1f} s "
+            f"({len(results) / elapsed if elapsed else 0:.2f} tareas/s con {len(assignments)} workers)."
+        )
+        return results
+
+    def shutdown(self) -> None:
+        self.logger.info("Deteniendo la granja de displays virtuales.")
+        # En orden inverso: primero los SAF y gestores de ventanas, luego su Xvfb.
+        for process in reversed(self._processes):
+            if process.poll() is None:
+                process.terminate()
+        for process in reversed(self._processes):
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        self._processes = []
+        self.displays = []
@@ -1,37 +1,74 @@
 import configparser
+import json
 import logging
 from pathlib import Path
 
+from src.core.profile import ProfileSpec
+
 class ConfigLoader:
     """
-    Responsable de leer y parsear archivos de perfil .ini usando pathlib.
+    Responsable de leer y compilar archivos de perfil .ini usando pathlib.
     Abstrae la interacción con el sistema de archivos y la librería configparser.
+
+    Los perfiles compilados se guardan en memoria indexados por ruta y fecha de
+    modificación: cargar de nuevo un perfil sin cambios no vuelve a leer ni a
+    compilar el archivo, y editarlo invalida la entrada automáticamente.
+
+    Si junto al .ini existe `<perfil>.mission.json`, se compila como manifiesto
+    de misión del perfil (ver `src.automation.common.mission`); sus cambios
+    también invalidan la caché.
     """
     def __init__(self, profiles_dir: str | Path = 'config/profiles'):
         self.profiles_dir = Path(profiles_dir)
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._cache: dict[Path, tuple[tuple[int, int | None], ProfileSpec]] = {}
 
-    def load_profile(self, profile_name: str) -> configparser.ConfigParser:
+    def load_profile(self, profile_name: str) -> ProfileSpec:
         """
-        Carga un perfil de configuración específico por su nombre.
+        Carga y compila un perfil de configuración específico por su nombre.
 
         Args:
             profile_name: El nombre del perfil sin la extensión .ini.
 
         Returns:
-            Un objeto ConfigParser con los datos del perfil cargado.
+            El ProfileSpec inmutable del perfil.
 
         Raises:
             FileNotFoundError: Si el archivo de perfil no se encuentra.
+            configparser.Error, ValueError: Si el perfil o su manifiesto son inválidos.
         """
-        profile_path = self.profiles_dir / f"{profile_name}.ini"
-        self.logger.info(f"Cargando perfil de configuración desde: {profile_path}")
+        profile_path = (self.profiles_dir / f"{profile_name}.ini").resolve()
+        mission_path = profile_path.with_name(f"{profile_name}.mission.json")
 
-        if not profile_path.exists():
+        try:
+            mtime_ns = profile_path.stat().st_mtime_ns
+        except FileNotFoundError:
             self.logger.error(f"El archivo de perfil '{profile_path}' no fue encontrado.")
             raise FileNotFoundError(f"El archivo de perfil '{profile_path}' no fue encontrado.")
 
+        try:
+            mission_mtime_ns = mission_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mission_mtime_ns = None
+
+        version = (mtime_ns, mission_mtime_ns)
+        cached = self._cache.get(profile_path)
+        if cached is not None and cached[0] == version:
+            self.logger.debug(f"Perfil '{profile_name}' servido desde la caché.")
+            return cached[1]
+
+        self.logger.info(f"Cargando perfil de configuración desde: {profile_path}")
         parser = configparser.ConfigParser()
         parser.read(profile_path, encoding='utf-8')
+        mission_manifest = None
+        if mission_mtime_ns is not None:
+            self.logger.info(f"Cargando manifiesto de misión desde: {mission_path}")
+            try:
+                mission_manifest = json.loads(mission_path.read_text(encoding='utf-8'))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"El manifiesto de misión '{mission_path}' no es un JSON válido: {e}")
+        spec = ProfileSpec.from_config(parser, profile_name, mission_manifest)
+
+        self._cache[profile_path] = (version, spec)
         self.logger.info(f"Perfil '{profile_name}' cargado exitosamente.")
-        return parser
\ No newline at end of file
+        return spec
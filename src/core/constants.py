@@ -6,11 +6,57 @@ class ConfigSections:
     COLUMN_MAPPING = 'ColumnMapping'
     FILTER_CRITERIA = 'FilterCriteria'
     AUTOMATION = 'AutomationSettings'
+    AUTOMATION_TIMEOUTS = 'AutomationTimeouts'
+    AUTOMATION_SEQUENCES = 'AutomationSequences'
+    AUTOMATION_RETRIES = 'AutomationRetries'
+    VALIDATION_RULES = 'ValidationRules'
+    AUTOMATION_READBACK = 'AutomationReadback'
+    AUTOMATION_INPUT = 'AutomationInput'
+    AUTOMATION_SESSIONS = 'AutomationSessions'
 
 class ConfigKeys:
     """Nombres de las claves dentro de las secciones del .ini."""
     SHEET_NAME = 'sheet_name'
     HEADER_ROW = 'header_row'
+    CHUNK_SIZE = 'chunk_size'
+    PREFETCH_CHUNKS = 'prefetch_chunks'
+    DATE_FORMAT = 'date_format'
+    WINDOW_TITLE = 'window_title'
+    CALIBRATE_SESSION = 'calibrate_session'
+    LINUX_BACKEND = 'linux_backend'
+    OPTIMISTIC_MODE = 'optimistic_mode'
+    GENERIC_ACTION_DELAY_MS = 'generic_action_delay_ms'
+    KEY_PAUSE_MS = 'key_pause_ms'
+    PATIENT_LOAD_WAIT_MS = 'patient_load_wait_ms'
+    INITIAL_STATE_TIMEOUT_MS = 'initial_state_timeout_ms'
+    NEW_BILLING_TIMEOUT_MS = 'new_billing_timeout_ms'
+    CLIPBOARD_TIMEOUT_MS = 'clipboard_timeout_ms'
+    POLL_INTERVAL_MS = 'poll_interval_ms'
+    SESSION_TASK_TIMEOUT_MS = 'session_task_timeout_ms'
+    ADAPTIVE_TIMEOUTS = 'adaptive_timeouts'
+    MAX_RETRIES = 'max_retries'
+    NAV_TO_ID_FIELD = 'nav_to_id_field'
+    # [AutomationReadback]
+    READBACK_SEQUENCE = 'sequence'
+    READBACK_PARSER = 'parser'
+    READBACK_DELIMITER = 'delimiter'
+    READBACK_FIELDS = 'fields'
+    READBACK_PATTERN = 'pattern'
+    READBACK_DATE_FORMAT = 'date_format'
+    # [AutomationInput]
+    PASTE_MIN_LENGTH = 'paste_min_length'
+
+class LinuxBackends:
+    """Valores admitidos para `linux_backend` en [AutomationSettings]."""
+    AUTO = 'auto'
+    XLIB = 'xlib'
+    XDOTOOL = 'xdotool'
+    ALL = (AUTO, XLIB, XDOTOOL)
+
+class LatencyActions:
+    """Tipos de acción de la GUI cuya latencia se mide (ver `LatencyModel`)."""
+    PATIENT_LOAD = 'patient_load'
+    CLIPBOARD_COPY = 'clipboard_copy'
 
 class LogicalFields:
     """
@@ -19,6 +65,7 @@ class LogicalFields:
     """
     # --- Campos Obligatorios ---
     NUMERO_HISTORIA = 'numero_historia'
+    IDENTIFICACION = 'identificacion'
     DIAGNOSTICO_PRINCIPAL = 'diagnostico_principal'
     FECHA_INGRESO = 'fecha_ingreso'
     MEDICO_TRATANTE = 'medico_tratante'
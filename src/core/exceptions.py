@@ -44,6 +44,26 @@ class ApplicationStateNotReadyError(AutomationError):
     error_code: str = "E1001_INVALID_STATE"
 
 
+class ReadinessTimeoutError(ApplicationStateNotReadyError):
+    """
+    Lanzada cuando la GUI no alcanza un estado esperado dentro del tiempo límite
+    (ver `RemoteControlFacade.wait_until`). Hereda de `ApplicationStateNotReadyError`
+    y es reintentable por el mismo motivo: la aplicación puede estar lenta.
+    """
+    is_retryable: bool = True
+    error_code: str = "E1002_READINESS_TIMEOUT"
+
+    def __init__(self, condition: str, timeout: float, last_error: Exception | None = None):
+        message = f"La condición '{condition}' no se cumplió en {timeout:.2f} s."
+        if last_error is not None:
+            message += f" Último error: {last_error}"
+        super().__init__(message)
+        self.payload = {
+            'condition': condition,
+            'timeout': timeout,
+        }
+
+
 class PatientIDMismatchError(AutomationError):
     """
     Lanzada cuando la identificación en la GUI no coincide con los datos de entrada.
@@ -79,6 +99,27 @@ class UnexpectedPopupError(AutomationError):
         self.payload = {'popup_text': popup_text}
 
 
+class PatientDataMismatchError(AutomationError):
+    """
+    Lanzada cuando la identificación coincide pero otros datos del paciente
+    leídos de la GUI (ej. aseguradora, contrato) no coinciden con los de entrada.
+    No es reintentable por la misma razón que `PatientIDMismatchError`.
+    """
+    is_retryable: bool = False
+    error_code: str = "E2003_DATA_MISMATCH"
+
+    def __init__(self, mismatches: dict[str, tuple[str, str]]):
+        detail = "; ".join(
+            f"{field}: esperado '{expected}', encontrado '{found}'"
+            for field, (expected, found) in mismatches.items()
+        )
+        super().__init__(f"Incongruencia en los datos del paciente. {detail}.")
+        self.payload = {
+            field: {'expected': expected, 'found': found}
+            for field, (expected, found) in mismatches.items()
+        }
+
+
 # --- Excepciones de Interacción Técnica (Potencialmente reintentables) ---
 
 class ClipboardError(AutomationError):
@@ -96,4 +137,4 @@ class FocusError(AutomationError):
     Es reintentable, ya que otra ventana podría haber robado el foco temporalmente.
     """
     is_retryable: bool = True
-    error_code: str = "E3002_FOCUS_FAILURE"
\ No newline at end of file
+    error_code: str = "E3002_FOCUS_FAILURE"
@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, fields
 from datetime import date
 from typing import Optional
 
@@ -23,4 +25,140 @@ class FacturacionData:
     # --- Diagnósticos opcionales ---
     diagnostico_adicional_1: Optional[str]
     diagnostico_adicional_2: Optional[str]
-    diagnostico_adicional_3: Optional[str]
\ No newline at end of file
+    diagnostico_adicional_3: Optional[str]
+
+class TaskBatch(Sequence):
+    """
+    Contenedor columnar y compacto de tareas de facturación, alternativo a
+    `List[FacturacionData]` para ejecuciones grandes.
+
+    En lugar de un objeto con su propio `__dict__` por fila, guarda una columna
+    por campo:
+    - Identificadores únicos por fila (historia, identificación): tuplas de `str`.
+    - Campos repetitivos (aseguradora, contrato, médico, estrato, diagnósticos):
+      codificación por diccionario, es decir, un `array` de códigos enteros más
+      una tupla con los valores distintos (cadenas internadas por lote).
+    - Fecha de ingreso: `array` de ordinales.
+
+    Se comporta como una secuencia inmutable de `FacturacionData`: el acceso por
+    índice construye la fila bajo demanda (vista perezosa), por lo que los
+    handlers no distinguen un lote de una lista. El corte (`batch[a:b]`) y el
+    reparto (`shard`) devuelven nuevos lotes que comparten los diccionarios, y
+    el lote se serializa con pickle de forma barata para enviarlo a otros procesos.
+    """
+
+    __slots__ = ('_plain', '_encoded', '_dates', '_length')
+
+    _PLAIN_FIELDS = ('numero_historia', 'identificacion')
+    _ENCODED_FIELDS = (
+        'diagnostico_principal',
+        'medico_tratante',
+        'empresa_aseguradora',
+        'contrato_empresa',
+        'estrato',
+        'diagnostico_adicional_1',
+        'diagnostico_adicional_2',
+        'diagnostico_adicional_3',
+    )
+    _DATE_FIELD = 'fecha_ingreso'
+    _FIELD_ORDER = tuple(f.name for f in fields(FacturacionData))
+
+    def __init__(self, plain: dict, encoded: dict, dates: array, length: int):
+        """Uso interno. Para construir un lote utilice `from_columns` o `from_tasks`."""
+        self._plain = plain
+        self._encoded = encoded
+        self._dates = dates
+        self._length = length
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Iterable]) -> "TaskBatch":
+        """
+        Construye un lote a partir de columnas alineadas, indexadas por el nombre
+        del campo de `FacturacionData`.
+        """
+        values_by_field = {name: tuple(columns[name]) for name in cls._FIELD_ORDER}
+        lengths = {len(values) for values in values_by_field.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Las columnas del lote no están alineadas (longitudes: {sorted(lengths)}).")
+        length = lengths.pop()
+
+        plain = {name: values_by_field[name] for name in cls._PLAIN_FIELDS}
+
+        encoded = {}
+        for name in cls._ENCODED_FIELDS:
+            dictionary: dict = {}
+            codes = array('I', [dictionary.setdefault(value, len(dictionary)) for value in values_by_field[name]])
+            encoded[name] = (codes, tuple(dictionary))
+
+        dates = array('i', [value.toordinal() for value in values_by_field[cls._DATE_FIELD]])
+
+        return cls(plain, encoded, dates, length)
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[FacturacionData]) -> "TaskBatch":
+        """Construye un lote a partir de objetos `FacturacionData` ya existentes."""
+        tasks = list(tasks)
+        return cls.from_columns({
+            name: [getattr(task, name) for task in tasks] for name in cls._FIELD_ORDER
+        })
+
+    @classmethod
+    def concat(cls, batches: Iterable["TaskBatch"]) -> "TaskBatch":
+        """Une varios lotes en uno solo, recodificando los diccionarios."""
+        batches = list(batches)
+        return cls.from_columns({
+            name: [value for batch in batches for value in batch.column(name)]
+            for name in cls._FIELD_ORDER
+        })
+
+    def column(self, name: str) -> tuple:
+        """Devuelve los valores decodificados de un campo, en orden de fila."""
+        if name in self._plain:
+            return self._plain[name]
+        if name in self._encoded:
+            codes, dictionary = self._encoded[name]
+            return tuple(dictionary[code] for code in codes)
+        if name == self._DATE_FIELD:
+            return tuple(date.fromordinal(ordinal) for ordinal in self._dates)
+        raise KeyError(name)
+
+    def shard(self, count: int) -> list["TaskBatch"]:
+        """
+        Reparte el lote en `count` lotes contiguos de tamaño casi idéntico
+        (los primeros reciben una tarea extra si la división no es exacta).
+        """
+        if count <= 0:
+            raise ValueError(f"El número de fragmentos debe ser positivo (recibido: {count}).")
+        size, extra = divmod(self._length, count)
+        shards, start = [], 0
+        for i in range(count):
+            stop = start + size + (1 if i < extra else 0)
+            shards.append(self[start:stop])
+            start = stop
+        return shards
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TaskBatch(
+                {name: values[index] for name, values in self._plain.items()},
+                {name: (codes[index], dictionary) for name, (codes, dictionary) in self._encoded.items()},
+                self._dates[index],
+                len(range(*index.indices(self._length))),
+            )
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Índice de tarea fuera de rango.")
+
+        row = {name: values[index] for name, values in self._plain.items()}
+        for name, (codes, dictionary) in self._encoded.items():
+            row[name] = dictionary[codes[index]]
+        row[self._DATE_FIELD] = date.fromordinal(self._dates[index])
+        return FacturacionData(**row)
+
+    def __repr__(self) -> str:
+        return f"TaskBatch(len={self._length})"
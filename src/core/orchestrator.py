@@ -1,22 +1,29 @@
 # src/core/orchestrator.py
 
 import logging
-from configparser import ConfigParser, NoOptionError, NoSectionError
+import queue
+import threading
+import time
+from configparser import NoOptionError, NoSectionError
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Mapping, Optional
 
+import numpy as np
 import pandas as pd
 
 from src.automation.abc.automator_interface import AutomatorInterface
 from src.automation.common.results import TaskResult, TaskResultStatus
 from src.config_loader import ConfigLoader
-from src.core.constants import ConfigKeys, ConfigSections
-from src.core.models import FacturacionData
+from src.core.models import TaskBatch
+from src.core.profile import ProfileSpec
 from src.data_handler.filter import DataFilterer
 from src.data_handler.loader import ExcelLoader
-from src.data_handler.validator import DataValidator
-from src.utils.dataframe_helpers import sanitize_column_name
+from src.data_handler.validator import REJECTION_MASK_COLUMN, DataValidator
+from src.utils.dataframe_helpers import to_datetime_tolerant, to_text
+
+# Marca de fin del productor en la cola del pipeline en streaming.
+_END_OF_DATA = object()
 
 
 class Orchestrator:
@@ -31,6 +38,23 @@ class Orchestrator:
     4. Manejar errores de alto nivel y el flujo general de la aplicación.
     """
 
+    # Campos de FacturacionData, agrupados según cómo se convierten desde el DataFrame.
+    _REQUIRED_TASK_FIELDS = (
+        "numero_historia",
+        "identificacion",
+        "diagnostico_principal",
+        "fecha_ingreso",
+        "medico_tratante",
+        "empresa_aseguradora",
+        "contrato_empresa",
+        "estrato",
+    )
+    _OPTIONAL_TASK_FIELDS = (
+        "diagnostico_adicional_1",
+        "diagnostico_adicional_2",
+        "diagnostico_adicional_3",
+    )
+
     def __init__(
         self,
         config_loader: ConfigLoader,
@@ -71,43 +95,36 @@ class Orchestrator:
 
         try:
             # --- Fase de Datos ---
-            profile_config = self.config_loader.load_profile(profile_name)
-            self._validate_profile_config(profile_config, profile_name)
-
-            raw_df = self.data_loader.load_data(
-                file_path=input_file_path,
-                sheet_name=profile_config.get(
-                    ConfigSections.DATA_SOURCE, ConfigKeys.SHEET_NAME
-                ),
-                header_row=profile_config.getint(
-                    ConfigSections.DATA_SOURCE, ConfigKeys.HEADER_ROW
-                ),
-            )
-            filtered_df = self.data_filterer.apply_criteria(raw_df, profile_config)
-            valid_df, invalid_df = self.data_validator.validate_data(
-                filtered_df, profile_config
-            )
+            profile = self.config_loader.load_profile(profile_name)
 
-            if not invalid_df.empty:
-                self.logger.warning(
-                    f"{len(invalid_df)} filas fueron descartadas por datos inválidos/faltantes."
+            if profile.data_source.chunk_size > 0 and self.automator:
+                # Datos y automatización solapados: el automator empieza con el primer bloque.
+                self._run_streaming_pipeline(input_file_path, profile)
+                self.logger.info("Orquestación finalizada exitosamente.")
+                return
+
+            if profile.data_source.chunk_size > 0:
+                facturacion_tasks, raw_count, valid_count = self._run_streaming_data_phase(
+                    input_file_path, profile
+                )
+            else:
+                facturacion_tasks, raw_count, valid_count = self._run_data_phase(
+                    input_file_path, profile
                 )
-                self._export_error_report(invalid_df, profile_config)
 
-            if valid_df.empty:
+            if valid_count == 0:
                 self.logger.warning(
                     "El pipeline de datos descartó todos los registros. "
                     "Revisa los criterios de filtro y validación en el perfil."
                 )
                 self._generate_summary_report(
-                    raw_df=raw_df,
-                    valid_df=valid_df,
+                    raw_count=raw_count,
+                    valid_count=valid_count,
                     results=[]
                 )
                 self.logger.info("No se encontraron registros válidos para procesar. Finalizando.")
                 return
 
-            facturacion_tasks = self._transform_to_dataclasses(valid_df, profile_config)
             self.logger.info(
                 f"Se han preparado {len(facturacion_tasks)} tareas de facturación listas para automatizar."
             )
@@ -117,7 +134,7 @@ class Orchestrator:
                 self.logger.info("Iniciando la fase de automatización...")
                 task_results = []
                 try:
-                    self.automator.initialize(profile_config)
+                    self.automator.initialize(profile)
                     task_results = self.automator.process_billing_tasks(facturacion_tasks)
 
                 except Exception as e:
@@ -127,8 +144,8 @@ class Orchestrator:
                 finally:
                     self.logger.info("Generando reporte de resumen final...")
                     self._generate_summary_report(
-                        raw_df=raw_df,
-                        valid_df=valid_df,
+                        raw_count=raw_count,
+                        valid_count=valid_count,
                         results=task_results
                     )
                     self.automator.shutdown()
@@ -139,8 +156,8 @@ class Orchestrator:
                     "Omitiendo fase de automatización: no hay tareas válidas o no se configuró un automator."
                 )
                 self._generate_summary_report(
-                    raw_df=raw_df,
-                    valid_df=valid_df,
+                    raw_count=raw_count,
+                    valid_count=valid_count,
                     results=[]
                 )
 
@@ -155,8 +172,194 @@ class Orchestrator:
             )
             raise
 
+    def _run_data_phase(
+        self, input_file_path: Path, profile: ProfileSpec
+    ) -> tuple[TaskBatch, int, int]:
+        """
+        Ejecuta el pipeline de datos cargando la hoja completa en memoria.
+
+        Returns:
+            Una tupla (tareas, filas_leídas, filas_válidas).
+        """
+        raw_df = self.data_loader.load_data(
+            file_path=input_file_path,
+            sheet_name=profile.data_source.sheet_name,
+            header_row=profile.data_source.header_row,
+            schema=profile.load_schema,
+        )
+        filtered_df = self.data_filterer.apply_criteria(raw_df, profile)
+        valid_df, invalid_df = self.data_validator.validate_data(
+            filtered_df, profile
+        )
+
+        if not invalid_df.empty:
+            self.logger.warning(
+                f"{len(invalid_df)} filas fueron descartadas por datos inválidos/faltantes."
+            )
+            self._export_error_report(invalid_df, profile)
+
+        if valid_df.empty:
+            return TaskBatch.from_tasks([]), len(raw_df), 0
+
+        tasks = self._transform_to_tasks(valid_df, profile)
+        return tasks, len(raw_df), len(valid_df)
+
+    def _run_streaming_data_phase(
+        self, input_file_path: Path, profile: ProfileSpec
+    ) -> tuple[TaskBatch, int, int]:
+        """
+        Ejecuta el pipeline de datos como una cadena de generadores sobre bloques
+        de `chunk_size` filas, de modo que ningún DataFrame supera ese tamaño.
+        Solo se acumulan las tareas resultantes y las filas rechazadas (para el
+        reporte de errores).
+
+        Returns:
+            Una tupla (tareas, filas_leídas, filas_válidas).
+        """
+        counters = {"raw": 0, "valid": 0}
+        invalid_chunks = []
+        task_batches = list(self._iter_task_batches(input_file_path, profile, counters, invalid_chunks))
+        self._export_invalid_chunks(invalid_chunks, profile)
+        return TaskBatch.concat(task_batches), counters["raw"], counters["valid"]
+
+    def _iter_task_batches(
+        self, input_file_path: Path, profile: ProfileSpec, counters: dict, invalid_chunks: list
+    ) -> Iterator[TaskBatch]:
+        """
+        Cadena de generadores del pipeline de datos: entrega un `TaskBatch` por
+        cada bloque con filas válidas. Acumula los conteos en `counters` ('raw' y
+        'valid') y los bloques rechazados en `invalid_chunks`.
+        """
+        def count_raw(chunks):
+            for chunk in chunks:
+                counters["raw"] += len(chunk)
+                yield chunk
+
+        raw_chunks = self.data_loader.iter_chunks(
+            file_path=input_file_path,
+            sheet_name=profile.data_source.sheet_name,
+            header_row=profile.data_source.header_row,
+            chunk_size=profile.data_source.chunk_size,
+            schema=profile.load_schema,
+        )
+        filtered_chunks = self.data_filterer.apply_criteria_stream(
+            count_raw(raw_chunks), profile
+        )
+
+        for valid_chunk, invalid_chunk in self.data_validator.validate_stream(
+            filtered_chunks, profile
+        ):
+            if not invalid_chunk.empty:
+                invalid_chunks.append(invalid_chunk)
+            if not valid_chunk.empty:
+                counters["valid"] += len(valid_chunk)
+                yield self._transform_to_tasks(valid_chunk, profile)
+
+    def _export_invalid_chunks(self, invalid_chunks: list, profile: ProfileSpec) -> None:
+        if invalid_chunks:
+            invalid_df = pd.concat(invalid_chunks)
+            self.logger.warning(
+                f"{len(invalid_df)} filas fueron descartadas por datos inválidos/faltantes."
+            )
+            self._export_error_report(invalid_df, profile)
+
+    def _run_streaming_pipeline(self, input_file_path: Path, profile: ProfileSpec) -> None:
+        """
+        Ejecuta datos y automatización como productor/consumidor.
+
+        Un hilo productor recorre `_iter_task_batches` y deja cada bloque de
+        tareas en una cola acotada (`prefetch_chunks`); si el automator va más
+        lento, la cola se llena y la lectura del Excel se pausa. Mientras tanto,
+        este hilo procesa cada bloque en cuanto llega, de modo que la primera
+        tarea empieza tras parsear el primer bloque y no el libro completo. El
+        automator se inicializa con el primer bloque que trae tareas: si los datos
+        no producen ninguna (o fallan antes), no se toca la GUI, igual que en el
+        modo por lotes. Genera los mismos reportes que el modo por lotes.
+
+        Raises:
+            Exception: Los errores del pipeline de datos se propagan como en `run`.
+        """
+        counters = {"raw": 0, "valid": 0}
+        invalid_chunks = []
+        chunks: queue.Queue = queue.Queue(maxsize=profile.data_source.prefetch_chunks)
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            # Con timeout para notar `stop` si el consumidor terminó antes de tiempo.
+            while not stop.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for batch in self._iter_task_batches(input_file_path, profile, counters, invalid_chunks):
+                    if not put(batch):
+                        return
+            except Exception as e:
+                put(e)
+                return
+            put(_END_OF_DATA)
+
+        start = time.perf_counter()
+        producer = threading.Thread(target=produce, name="DataProducer", daemon=True)
+        producer.start()
+
+        task_results: List[TaskResult] = []
+        data_error = None
+        initialized = False
+        self.logger.info("Iniciando la fase de automatización en paralelo a la lectura de datos...")
+        try:
+            while True:
+                item = chunks.get()
+                if item is _END_OF_DATA:
+                    break
+                if isinstance(item, Exception):
+                    data_error = item
+                    break
+                if not len(item):
+                    continue
+                if not initialized:
+                    self.logger.info(
+                        f"Primer bloque de {len(item)} tareas listo a los {time.perf_counter() - start:.2f} s."
+                    )
+                    initialized = True
+                    self.automator.initialize(profile)
+                task_results.extend(self.automator.process_billing_tasks(item))
+        except Exception as e:
+            self.logger.critical(
+                f"Error fatal durante la fase de automatización: {e}", exc_info=True
+            )
+        finally:
+            stop.set()
+            producer.join()
+            self._export_invalid_chunks(invalid_chunks, profile)
+            if data_error is None and counters["valid"] == 0:
+                self.logger.warning(
+                    "El pipeline de datos descartó todos los registros. "
+                    "Revisa los criterios de filtro y validación en el perfil."
+                )
+            self.logger.info("Generando reporte de resumen final...")
+            self._generate_summary_report(
+                raw_count=counters["raw"],
+                valid_count=counters["valid"],
+                results=task_results
+            )
+            if initialized:
+                self.automator.shutdown()
+
+        if data_error is not None:
+            raise data_error
+        self.logger.info(
+            f"Fase de automatización finalizada: {len(task_results)} tareas en "
+            f"{time.perf_counter() - start:.1f} s."
+        )
+
     def _generate_summary_report(
-        self, raw_df: pd.DataFrame, valid_df: pd.DataFrame, results: List[TaskResult]
+        self, raw_count: int, valid_count: int, results: List[TaskResult]
     ):
         self.logger.info("Generando reporte de resumen de ejecución...")
 
@@ -168,15 +371,15 @@ class Orchestrator:
             "==================================================",
             f"  Reporte de Ejecución - {timestamp}",
             "==================================================",
-            f"Tareas iniciales en Excel: {len(raw_df)}",
-            f"Tareas tras filtro/validación: {len(valid_df)}",
+            f"Tareas iniciales en Excel: {raw_count}",
+            f"Tareas tras filtro/validación: {valid_count}",
             f"Tareas procesadas por el automator: {len(results)}",
             f"  - Exitosas: {success_count}",
             f"  - Fallidas: {len(failed_tasks)}",
             "--------------------------------------------------",
         ]
 
-        if not valid_df.empty and len(results) == 0 and self.automator:
+        if valid_count > 0 and len(results) == 0 and self.automator:
             report_lines.append("ADVERTENCIA: Ninguna tarea fue procesada por el automator, aunque había tareas válidas.")
             report_lines.append("Esto puede indicar una interrupción temprana del proceso o un fallo en la inicialización.")
             report_lines.append("--------------------------------------------------")
@@ -209,32 +412,8 @@ class Orchestrator:
         except IOError as e:
             self.logger.error(f"No se pudo escribir el archivo de reporte: {e}")
 
-    def _validate_profile_config(self, config: ConfigParser, profile_name: str):
-        """Valida que el perfil de configuración contenga las secciones y claves necesarias."""
-        self.logger.info(f"Validando la estructura del perfil '{profile_name}'.")
-
-        required_sections = [
-            ConfigSections.DATA_SOURCE,
-            ConfigSections.COLUMN_MAPPING,
-        ]
-        for section in required_sections:
-            if not config.has_section(section):
-                raise NoSectionError(
-                    f"La sección requerida '[{section}]' falta en el perfil."
-                )
-
-        required_keys_in_datasource = [ConfigKeys.SHEET_NAME, ConfigKeys.HEADER_ROW]
-        for key in required_keys_in_datasource:
-            if not config.has_option(ConfigSections.DATA_SOURCE, key):
-                raise NoOptionError(
-                    f"La clave requerida '{key}' falta en la sección '[{ConfigSections.DATA_SOURCE}]'.",
-                    ConfigSections.DATA_SOURCE,
-                )
-
-        self.logger.info("La estructura del perfil es válida.")
-
     def _export_error_report(
-        self, invalid_df: pd.DataFrame, profile_config: ConfigParser
+        self, invalid_df: pd.DataFrame, profile: ProfileSpec
     ):
         """Genera un archivo Excel con las filas inválidas y el motivo del rechazo."""
         error_dir = self.output_dir / "errors"
@@ -246,14 +425,15 @@ class Orchestrator:
         self.logger.info(f"Generando reporte de errores en: {report_path}")
 
         report_df = invalid_df.copy()
-        report_df["Motivo_Rechazo"] = "Faltan datos en una o más columnas requeridas."
+        if REJECTION_MASK_COLUMN in report_df.columns:
+            report_df["Motivo_Rechazo"] = self.data_validator.describe_rejections(
+                report_df.pop(REJECTION_MASK_COLUMN), profile
+            )
+        else:
+            report_df["Motivo_Rechazo"] = "Faltan datos en una o más columnas requeridas."
 
-        mapping = profile_config[ConfigSections.COLUMN_MAPPING]
-        reverse_rename_map = {
-            sanitize_column_name(v): v for k, v in mapping.items()
-        }
         cols_to_rename = {
-            k: v for k, v in reverse_rename_map.items() if k in report_df.columns
+            k: v for k, v in profile.original_column_names.items() if k in report_df.columns
         }
         report_df.rename(columns=cols_to_rename, inplace=True)
 
@@ -263,72 +443,85 @@ class Orchestrator:
         except Exception as e:
             self.logger.error(f"No se pudo guardar el reporte de errores: {e}")
 
-    def _transform_to_dataclasses(
-        self, dataframe: pd.DataFrame, profile_config: ConfigParser
-    ) -> List[FacturacionData]:
-        """Transforma un DataFrame validado en una lista de objetos FacturacionData."""
+    def _transform_to_tasks(
+        self, dataframe: pd.DataFrame, profile: ProfileSpec
+    ) -> TaskBatch:
+        """
+        Transforma un DataFrame validado en un TaskBatch de tareas de facturación.
+
+        La conversión se hace por columnas completas (ver `_prepare_task_columns`);
+        después, el lote columnar se construye en una única pasada sobre los arreglos
+        ya preparados. Las filas que no superan la conversión se reportan en bloque.
+        """
         self.logger.info(
-            f"Iniciando transformación de {len(dataframe)} filas de DataFrame a Dataclasses."
+            f"Iniciando transformación de {len(dataframe)} filas de DataFrame a un TaskBatch."
         )
-        tasks = []
-        mapping = profile_config[ConfigSections.COLUMN_MAPPING]
-        sane_mapping = {key: sanitize_column_name(val) for key, val in mapping.items()}
+        sane_mapping = profile.columns
 
-        for row in dataframe.itertuples(index=False):
-            try:
-                task_data = {
-                    "numero_historia": str(
-                        getattr(row, sane_mapping["numero_historia"])
-                    ),
-                    "identificacion": str(
-                        getattr(row, sane_mapping["identificacion"])
-                    ),
-                    "diagnostico_principal": str(
-                        getattr(row, sane_mapping["diagnostico_principal"])
-                    ),
-                    "fecha_ingreso": pd.to_datetime(
-                        getattr(row, sane_mapping["fecha_ingreso"])
-                    ).date(),
-                    "medico_tratante": str(
-                        getattr(row, sane_mapping["medico_tratante"])
-                    ),
-                    "empresa_aseguradora": str(
-                        getattr(row, sane_mapping["empresa_aseguradora"])
-                    ),
-                    "contrato_empresa": str(
-                        getattr(row, sane_mapping["contrato_empresa"])
-                    ),
-                    "estrato": str(getattr(row, sane_mapping["estrato"])),
-                    "diagnostico_adicional_1": self._get_optional_field(
-                        row, sane_mapping.get("diagnostico_adicional_1")
-                    ),
-                    "diagnostico_adicional_2": self._get_optional_field(
-                        row, sane_mapping.get("diagnostico_adicional_2")
-                    ),
-                    "diagnostico_adicional_3": self._get_optional_field(
-                        row, sane_mapping.get("diagnostico_adicional_3")
-                    ),
-                }
-                tasks.append(FacturacionData(**task_data))
-            except AttributeError as e:
-                self.logger.error(
-                    f"Error de atributo al transformar fila. Es probable que falte un mapeo en [ColumnMapping] del perfil. Error: {e}"
-                )
-            except Exception as e:
-                self.logger.error(
-                    f"Error inesperado al transformar una fila. Fila: {row._asdict()}. Error: {e}"
-                )
+        missing = [
+            name for name in self._REQUIRED_TASK_FIELDS
+            if sane_mapping.get(name) not in dataframe.columns
+        ]
+        if missing:
+            self.logger.error(
+                f"No se pueden construir las tareas: faltan columnas o mapeos en [ColumnMapping] "
+                f"para los campos {missing}."
+            )
+            return TaskBatch.from_tasks([])
+
+        columns, rejected = self._prepare_task_columns(dataframe, sane_mapping, profile.data_source.date_format)
+
+        if rejected.any():
+            rejected_ids = columns["numero_historia"][rejected]
+            preview = ", ".join(rejected_ids[:10])
+            self.logger.error(
+                f"{len(rejected_ids)} filas no pudieron transformarse (fecha de ingreso no interpretable). "
+                f"Historias afectadas: {preview}{' ...' if len(rejected_ids) > 10 else ''}"
+            )
+            columns = {name: values[~rejected] for name, values in columns.items()}
+
+        tasks = TaskBatch.from_columns(columns)
 
         self.logger.info(
-            f"Transformación completada. Se crearon {len(tasks)} objetos FacturacionData."
+            f"Transformación completada. Se prepararon {len(tasks)} tareas de facturación."
         )
         return tasks
 
-    def _get_optional_field(
-        self, row: tuple, sane_col_name: str | None
-    ) -> str | None:
-        """Obtiene el valor de un campo opcional de una fila, manejando valores nulos."""
-        if not sane_col_name:
-            return None
-        value = getattr(row, sane_col_name, None)
-        return None if pd.isna(value) else str(value)
\ No newline at end of file
+    def _prepare_task_columns(
+        self, dataframe: pd.DataFrame, sane_mapping: Mapping[str, str], date_format: Optional[str] = None
+    ) -> tuple[dict[str, np.ndarray], np.ndarray]:
+        """
+        Convierte columna a columna los datos necesarios para FacturacionData.
+
+        - Campos de texto obligatorios: texto (ver `to_text`); los nulos quedan
+          como cadena vacía para que todos los valores sean `str`.
+        - Fecha de ingreso: la misma regla para todas las celdas (`date_format`
+          de [DataSource] o, sin él, mes primero; ver `to_datetime_tolerant`).
+        - Diagnósticos opcionales: nulos a None, el resto a `str`.
+
+        Returns:
+            Una tupla (columnas, rechazadas): un diccionario campo -> arreglo de
+            objetos alineado con las filas, y una máscara booleana con las filas
+            cuya conversión falló.
+        """
+        columns: dict[str, np.ndarray] = {}
+        for name in self._REQUIRED_TASK_FIELDS:
+            if name == "fecha_ingreso":
+                continue
+            columns[name] = to_text(dataframe[sane_mapping[name]]).fillna('').to_numpy(dtype=object)
+
+        parsed_dates = to_datetime_tolerant(dataframe[sane_mapping["fecha_ingreso"]], date_format)
+        rejected = parsed_dates.isna().to_numpy()
+        columns["fecha_ingreso"] = parsed_dates.dt.date.to_numpy(dtype=object)
+
+        for name in self._OPTIONAL_TASK_FIELDS:
+            col = sane_mapping.get(name)
+            if col is None or col not in dataframe.columns:
+                columns[name] = np.full(len(dataframe), None, dtype=object)
+                continue
+            series = dataframe[col]
+            columns[name] = np.where(
+                series.isna().to_numpy(), None, series.astype(str).to_numpy(dtype=object)
+            )
+
+        return columns, rejected
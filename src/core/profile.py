@@ -0,0 +1,287 @@
+# src/core/profile.py
+
+"""
+Representación compilada e inmutable de un perfil .ini.
+
+El perfil se interpreta una sola vez (ver `ConfigLoader.load_profile`): las
+columnas se sanean, los tiempos se convierten a segundos y los criterios de
+filtro y reglas de validación se compilan. Los errores de configuración
+aparecen en ese momento y no a mitad de la ejecución.
+"""
+
+from configparser import ConfigParser, NoOptionError, NoSectionError
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+from src.automation.common.input_policy import InputPolicy, compile_input_policy
+from src.automation.common.mission import DEFAULT_MISSION, MissionSpec, compile_mission
+from src.automation.common.readback import ReadbackSpec, compile_readback
+from src.core.constants import ConfigKeys, ConfigSections, LinuxBackends, LogicalFields
+from src.data_handler.filter import DataFilterer, FilterPlan
+from src.data_handler.loader import ColumnSchema
+from src.data_handler.validator import DataValidator, ValidationRuleSet
+from src.utils.dataframe_helpers import sanitize_column_name
+
+# Tipo de carga de cada campo lógico (ver `ColumnSchema`). Los campos mapeados que
+# no aparecen aquí se cargan con el tipo que infiera pandas.
+_TEXT_FIELDS = frozenset({
+    LogicalFields.NUMERO_HISTORIA,
+    LogicalFields.IDENTIFICACION,
+    LogicalFields.DIAGNOSTICO_PRINCIPAL,
+    LogicalFields.DIAGNOSTICO_ADICIONAL_1,
+    LogicalFields.DIAGNOSTICO_ADICIONAL_2,
+    LogicalFields.DIAGNOSTICO_ADICIONAL_3,
+    LogicalFields.CUPS_FOR_FILTER,
+})
+_DATE_FIELDS = frozenset({LogicalFields.FECHA_INGRESO})
+_CATEGORICAL_FIELDS = frozenset({
+    LogicalFields.MEDICO_TRATANTE,
+    LogicalFields.EMPRESA_ASEGURADORA,
+    LogicalFields.CONTRATO_EMPRESA,
+    LogicalFields.ESTRATO,
+    LogicalFields.USER_FOR_FILTER,
+    LogicalFields.PYP_FOR_FILTER,
+    LogicalFields.SPECIALTY_FOR_FILTER,
+})
+
+
+@dataclass(frozen=True)
+class DataSourceSpec:
+    """Ubicación de los datos dentro del libro Excel ([DataSource])."""
+    sheet_name: str
+    header_row: int
+    chunk_size: int = 0
+    # En streaming, bloques de tareas que pueden esperar al automator antes de
+    # que la lectura del Excel se detenga (contrapresión).
+    prefetch_chunks: int = 2
+    # Formato de las fechas del Excel (ej. '%d/%m/%Y'). Sin él, cada celda se
+    # interpreta por separado con el mes primero (ver `to_datetime_tolerant`).
+    date_format: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class SessionSpec:
+    """
+    Una sesión de escritorio remoto declarada en [AutomationSessions].
+
+    Atributos:
+        name: Nombre de la sesión (la clave en el .ini), para logs y archivos.
+        window_title: Título de la ventana de la aplicación en esa sesión.
+        display: Display de X donde vive la ventana (ej. ':2'); None usa `$DISPLAY`.
+    """
+    name: str
+    window_title: str
+    display: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class AutomationSpec:
+    """
+    Ajustes de automatización ([AutomationSettings], [AutomationTimeouts],
+    [AutomationSequences], [AutomationRetries], [AutomationReadback] y
+    [AutomationInput] y [AutomationSessions]) y el manifiesto de misión. Los
+    tiempos están en segundos.
+    """
+    window_title: Optional[str] = None
+    # Si es True, `initialize` mide la sesión antes de la primera tarea (ver
+    # `calibration`). Escribe en el campo con el foco, así que es opcional.
+    calibrate_session: bool = False
+    # Si es True, cada tarea se intenta primero sin esperas de cortesía y solo se
+    # repite con los tiempos completos si la verificación del paciente falla.
+    optimistic_mode: bool = False
+    # Backend de ventanas y teclado en Linux (ver `LinuxBackends`).
+    linux_backend: str = LinuxBackends.AUTO
+    generic_action_delay: float = 0.1
+    # Pausa MÁXIMA entre teclas; la calibración puede elegir una menor.
+    key_pause: float = 0.05
+    # Tiempos MÁXIMOS de espera: cada paso retorna en cuanto la GUI está lista.
+    patient_load_wait: float = 3.0
+    clipboard_timeout: float = 1.0
+    # Esperas FIJAS tras cerrar diálogos y abrir una factura: no hay una señal
+    # observable de que la aplicación terminó (ver `MainWindowHandler._settle`).
+    initial_state_timeout: float = 0.5
+    new_billing_timeout: float = 1.5
+    poll_interval: float = 0.05
+    # Tiempo máximo de una tarea en una sesión paralela antes de darla por perdida.
+    session_task_timeout: float = 120.0
+    # Si es True, las esperas sondeadas se ajustan a la latencia observada (ver
+    # `LatencyModel`); la validación del paciente conserva `patient_load_wait`.
+    adaptive_timeouts: bool = True
+    max_retries: int = 1
+    nav_to_id_sequence: str = '{TAB}'
+    # Lectura en bloque de varios campos ([AutomationReadback]); None si no se declara.
+    readback: Optional[ReadbackSpec] = None
+    # Escribir o pegar cada campo ([AutomationInput]).
+    input_policy: InputPolicy = InputPolicy()
+    # Sesiones para `ParallelAutomator`; vacío si el perfil no las declara.
+    sessions: Tuple[SessionSpec, ...] = ()
+    # Estados y acciones de cada tarea (`<perfil>.mission.json`, o el flujo por defecto).
+    mission: MissionSpec = DEFAULT_MISSION
+
+
+@dataclass(frozen=True)
+class ProfileSpec:
+    """
+    Perfil compilado. Se comparte entre todas las etapas del pipeline y puede
+    reutilizarse entre ejecuciones, por lo que ninguna etapa debe modificarlo.
+
+    Atributos:
+        name: Nombre del perfil (sin extensión).
+        data_source: Ubicación de los datos en el Excel.
+        column_mapping: Campo lógico -> nombre de columna original del Excel.
+        columns: Campo lógico -> nombre de columna saneado (como en el DataFrame).
+        load_schema: Columnas a leer del Excel y sus tipos de carga.
+        filter_plan: Plan de filtrado compilado, o None si no hay [FilterCriteria].
+        validation_rules: Reglas de validación compiladas.
+        automation: Ajustes de la capa de automatización.
+    """
+    name: str
+    data_source: DataSourceSpec
+    column_mapping: Mapping[str, str]
+    columns: Mapping[str, str]
+    load_schema: ColumnSchema
+    filter_plan: Optional[FilterPlan]
+    validation_rules: ValidationRuleSet
+    automation: AutomationSpec
+
+    @property
+    def original_column_names(self) -> dict[str, str]:
+        """Nombre saneado -> nombre original del Excel, para los reportes."""
+        return {self.columns[key]: excel_col for key, excel_col in self.column_mapping.items()}
+
+    @classmethod
+    def from_config(
+        cls, config: ConfigParser, name: str, mission_manifest: Optional[Mapping] = None
+    ) -> 'ProfileSpec':
+        """
+        Compila un ConfigParser ya leído y, si se proporciona, el manifiesto de
+        misión del perfil (ver `compile_mission`).
+
+        Raises:
+            NoSectionError, NoOptionError: Si falta una sección o clave requerida.
+            ValueError: Si algún valor no es interpretable.
+        """
+        for section in (ConfigSections.DATA_SOURCE, ConfigSections.COLUMN_MAPPING):
+            if not config.has_section(section):
+                raise NoSectionError(section)
+        for key in (ConfigKeys.SHEET_NAME, ConfigKeys.HEADER_ROW):
+            if not config.has_option(ConfigSections.DATA_SOURCE, key):
+                raise NoOptionError(key, ConfigSections.DATA_SOURCE)
+
+        data_source = DataSourceSpec(
+            sheet_name=config.get(ConfigSections.DATA_SOURCE, ConfigKeys.SHEET_NAME),
+            header_row=config.getint(ConfigSections.DATA_SOURCE, ConfigKeys.HEADER_ROW),
+            chunk_size=config.getint(ConfigSections.DATA_SOURCE, ConfigKeys.CHUNK_SIZE, fallback=0),
+            prefetch_chunks=config.getint(
+                ConfigSections.DATA_SOURCE, ConfigKeys.PREFETCH_CHUNKS, fallback=DataSourceSpec.prefetch_chunks
+            ),
+            date_format=config.get(ConfigSections.DATA_SOURCE, ConfigKeys.DATE_FORMAT, raw=True, fallback=None),
+        )
+        if data_source.prefetch_chunks <= 0:
+            raise ValueError(f"'{ConfigKeys.PREFETCH_CHUNKS}' debe ser positivo (recibido: {data_source.prefetch_chunks}).")
+
+        column_mapping = dict(config[ConfigSections.COLUMN_MAPPING])
+        columns = {key: sanitize_column_name(value) for key, value in column_mapping.items()}
+
+        filter_plan = None
+        if config.has_section(ConfigSections.FILTER_CRITERIA):
+            filter_plan = DataFilterer().compile_plan(config)
+
+        return cls(
+            name=name,
+            data_source=data_source,
+            column_mapping=MappingProxyType(column_mapping),
+            columns=MappingProxyType(columns),
+            load_schema=ColumnSchema(
+                columns=frozenset(columns.values()),
+                text=frozenset(columns[key] for key in _TEXT_FIELDS if key in columns),
+                dates=frozenset(columns[key] for key in _DATE_FIELDS if key in columns),
+                categorical=frozenset(columns[key] for key in _CATEGORICAL_FIELDS if key in columns),
+                date_format=data_source.date_format,
+            ),
+            filter_plan=filter_plan,
+            validation_rules=DataValidator().compile_rules(config),
+            automation=cls._compile_automation(config, mission_manifest),
+        )
+
+    @staticmethod
+    def _compile_automation(config: ConfigParser, mission_manifest: Optional[Mapping] = None) -> AutomationSpec:
+        defaults = AutomationSpec()
+
+        linux_backend = config.get(
+            ConfigSections.AUTOMATION, ConfigKeys.LINUX_BACKEND, fallback=defaults.linux_backend
+        ).strip().lower()
+        if linux_backend not in LinuxBackends.ALL:
+            raise ValueError(
+                f"Valor inválido para '{ConfigKeys.LINUX_BACKEND}': '{linux_backend}'. "
+                f"Opciones: {', '.join(LinuxBackends.ALL)}."
+            )
+
+        def seconds(key: str, default: float) -> float:
+            return config.getfloat(ConfigSections.AUTOMATION_TIMEOUTS, key, fallback=default * 1000) / 1000.0
+
+        return AutomationSpec(
+            window_title=config.get(ConfigSections.AUTOMATION, ConfigKeys.WINDOW_TITLE, fallback=None),
+            calibrate_session=config.getboolean(
+                ConfigSections.AUTOMATION, ConfigKeys.CALIBRATE_SESSION, fallback=defaults.calibrate_session
+            ),
+            optimistic_mode=config.getboolean(
+                ConfigSections.AUTOMATION, ConfigKeys.OPTIMISTIC_MODE, fallback=defaults.optimistic_mode
+            ),
+            linux_backend=linux_backend,
+            key_pause=seconds(ConfigKeys.KEY_PAUSE_MS, defaults.key_pause),
+            generic_action_delay=seconds(ConfigKeys.GENERIC_ACTION_DELAY_MS, defaults.generic_action_delay),
+            patient_load_wait=seconds(ConfigKeys.PATIENT_LOAD_WAIT_MS, defaults.patient_load_wait),
+            initial_state_timeout=seconds(ConfigKeys.INITIAL_STATE_TIMEOUT_MS, defaults.initial_state_timeout),
+            new_billing_timeout=seconds(ConfigKeys.NEW_BILLING_TIMEOUT_MS, defaults.new_billing_timeout),
+            clipboard_timeout=seconds(ConfigKeys.CLIPBOARD_TIMEOUT_MS, defaults.clipboard_timeout),
+            poll_interval=seconds(ConfigKeys.POLL_INTERVAL_MS, defaults.poll_interval),
+            session_task_timeout=seconds(ConfigKeys.SESSION_TASK_TIMEOUT_MS, defaults.session_task_timeout),
+            adaptive_timeouts=config.getboolean(
+                ConfigSections.AUTOMATION_TIMEOUTS, ConfigKeys.ADAPTIVE_TIMEOUTS,
+                fallback=defaults.adaptive_timeouts
+            ),
+            max_retries=config.getint(
+                ConfigSections.AUTOMATION_RETRIES, ConfigKeys.MAX_RETRIES, fallback=defaults.max_retries
+            ),
+            nav_to_id_sequence=config.get(
+                ConfigSections.AUTOMATION_SEQUENCES, ConfigKeys.NAV_TO_ID_FIELD,
+                fallback=defaults.nav_to_id_sequence
+            ),
+            readback=compile_readback(config),
+            input_policy=compile_input_policy(config),
+            sessions=ProfileSpec._compile_sessions(config),
+            mission=compile_mission(mission_manifest) if mission_manifest is not None else defaults.mission,
+        )
+
+    @staticmethod
+    def _compile_sessions(config: ConfigParser) -> Tuple[SessionSpec, ...]:
+        """
+        Compila [AutomationSessions]: cada clave es el nombre de una sesión y su
+        valor, el título de la ventana, opcionalmente seguido de ' @ <display>'.
+
+        Raises:
+            ValueError: Si una sesión no tiene título o dos comparten display (las
+                        sesiones de un mismo display se disputarían el teclado).
+        """
+        if not config.has_section(ConfigSections.AUTOMATION_SESSIONS):
+            return ()
+        sessions = []
+        for name, value in config[ConfigSections.AUTOMATION_SESSIONS].items():
+            title, separator, display = value.rpartition(' @ ')
+            if not separator:
+                title, display = value, ''
+            title, display = title.strip(), display.strip()
+            if not title:
+                raise ValueError(f"La sesión '{name}' de [{ConfigSections.AUTOMATION_SESSIONS}] no declara un título de ventana.")
+            sessions.append(SessionSpec(name=name, window_title=title, display=display or None))
+
+        displays = [s.display for s in sessions]
+        shared = sorted({str(d) for d in displays if displays.count(d) > 1})
+        if shared:
+            raise ValueError(
+                f"Varias sesiones de [{ConfigSections.AUTOMATION_SESSIONS}] comparten display ({', '.join(shared)}). "
+                "Cada sesión necesita su propio display para no disputarse el teclado."
+            )
+        return tuple(sessions)
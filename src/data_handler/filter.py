@@ -1,8 +1,340 @@
 import logging
+import re
+from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
 from configparser import ConfigParser
-from src.utils.dataframe_helpers import sanitize_column_name
-from src.core.constants import ConfigSections
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+from src.utils.dataframe_helpers import sanitize_column_name, to_datetime_tolerant
+from src.core.constants import ConfigKeys, ConfigSections
+
+if TYPE_CHECKING:
+    from src.core.profile import ProfileSpec
+
+# Tamaño de la muestra usada para estimar la selectividad de cada predicado
+# la primera vez que el plan se evalúa.
+_SELECTIVITY_SAMPLE_SIZE = 1000
+
+
+class PredicateKind:
+    """Forma en que se normaliza una columna antes de evaluar un predicado sobre ella."""
+    TEXT = 'text'      # Texto en mayúsculas y sin espacios circundantes.
+    NUMBER = 'number'  # Numérico (float); los valores no numéricos quedan como NaN.
+    DATE = 'date'      # Fecha con resolución de día; los valores no interpretables quedan como NaT.
+
+
+@dataclass(frozen=True)
+class FilterPredicate(ABC):
+    """
+    Un criterio de filtro ya resuelto contra [ColumnMapping]. Las subclases
+    implementan `_matches` como una operación vectorizada de pandas/NumPy sobre la
+    columna ya normalizada según `kind`; la negación se aplica sobre la máscara.
+    """
+    label: str    # Nombre original de la columna en el Excel (para los logs).
+    column: str   # Nombre saneado de la columna en el DataFrame.
+    negate: bool = False
+
+    kind = PredicateKind.TEXT
+
+    def evaluate(self, normalized: np.ndarray) -> np.ndarray:
+        """Devuelve la máscara booleana de las filas que cumplen el criterio."""
+        mask = self._matches(normalized)
+        return ~mask if self.negate else mask
+
+    def describe(self) -> str:
+        return f"'{self.label}' {'NOT ' if self.negate else ''}{self._describe_operation()}"
+
+    @abstractmethod
+    def _matches(self, normalized: np.ndarray) -> np.ndarray:
+        """Máscara de las filas que cumplen la operación, sin aplicar la negación."""
+
+    @abstractmethod
+    def _describe_operation(self) -> str:
+        """Texto de la operación para los logs (ej. "== 'NANCY'")."""
+
+
+@dataclass(frozen=True)
+class EqualsPredicate(FilterPredicate):
+    """Igualdad insensible a mayúsculas y espacios (operador por defecto)."""
+    value: str = ''
+
+    def _matches(self, normalized: np.ndarray) -> np.ndarray:
+        return normalized == self.value
+
+    def _describe_operation(self) -> str:
+        return f"== '{self.value}'"
+
+
+@dataclass(frozen=True)
+class InSetPredicate(FilterPredicate):
+    """Pertenencia a un conjunto de valores, resuelta con una tabla hash."""
+    values: frozenset = frozenset()
+
+    def _matches(self, normalized: np.ndarray) -> np.ndarray:
+        return pd.Series(normalized, copy=False).isin(self.values).to_numpy()
+
+    def _describe_operation(self) -> str:
+        return f"IN {sorted(self.values)}"
+
+
+@dataclass(frozen=True)
+class PrefixPredicate(FilterPredicate):
+    """Coincidencia por prefijo (uno o varios prefijos alternativos)."""
+    prefixes: tuple = ()
+
+    def _matches(self, normalized: np.ndarray) -> np.ndarray:
+        return pd.Series(normalized, copy=False).str.startswith(self.prefixes).to_numpy(dtype=bool)
+
+    def _describe_operation(self) -> str:
+        return f"PREFIX {list(self.prefixes)}"
+
+
+@dataclass(frozen=True)
+class RangePredicate(FilterPredicate):
+    """
+    Rango cerrado [lower, upper] numérico o de fechas. Un límite None deja ese
+    extremo abierto. Las celdas no interpretables nunca cumplen el rango, ni
+    tampoco su negación.
+    """
+    lower: object = None
+    upper: object = None
+    range_kind: str = PredicateKind.NUMBER
+
+    @property
+    def kind(self) -> str:
+        return self.range_kind
+
+    def evaluate(self, normalized: np.ndarray) -> np.ndarray:
+        mask = self._matches(normalized)
+        if not self.negate:
+            return mask
+        return ~mask & ~pd.isna(normalized)
+
+    def _matches(self, normalized: np.ndarray) -> np.ndarray:
+        mask = np.ones(len(normalized), dtype=bool)
+        if self.lower is not None:
+            mask &= normalized >= self.lower
+        if self.upper is not None:
+            mask &= normalized <= self.upper
+        return mask
+
+    def _describe_operation(self) -> str:
+        def fmt(bound):
+            if bound is None:
+                return '*'
+            return str(bound)[:10] if self.range_kind == PredicateKind.DATE else f"{bound:g}"
+        return f"BETWEEN [{fmt(self.lower)}, {fmt(self.upper)}]"
+
+
+# Sintaxis de un valor en [FilterCriteria]: "[not] operador: argumentos".
+# Sin operador, el valor completo se compara por igualdad (comportamiento histórico).
+_CRITERION_PATTERN = re.compile(r'^\s*(?P<not>not\b)?\s*(?P<op>eq|in|prefix|between)?\s*:(?P<args>.*)$', re.IGNORECASE | re.DOTALL)
+
+
+def parse_criterion(label: str, column: str, raw_value: str) -> FilterPredicate:
+    """
+    Compila el valor de un criterio de [FilterCriteria] en un predicado.
+
+    Operadores soportados (todos admiten el prefijo `not`):
+        VALOR                       Igualdad (insensible a mayúsculas/espacios).
+        eq: VALOR                   Igualdad explícita (útil si VALOR contiene ':').
+        in: A, B, C                 Pertenencia a un conjunto.
+        prefix: 890, 891            Comienza por alguno de los prefijos.
+        between: 10, 20             Rango numérico cerrado.
+        between: 2025-01-01, 2025-06-30
+                                    Rango de fechas cerrado. Un límite vacío deja
+                                    ese extremo abierto (ej. 'between: , 2025-06-30').
+        not: VALOR                  Desigualdad.
+
+    Raises:
+        ValueError: Si los argumentos del operador son inválidos.
+    """
+    match = _CRITERION_PATTERN.match(raw_value)
+    if match is None or (match.group('not') is None and match.group('op') is None):
+        return EqualsPredicate(label=label, column=column, value=_normalize_text(raw_value))
+
+    negate = match.group('not') is not None
+    operator = (match.group('op') or 'eq').lower()
+    args = match.group('args')
+    items = [_normalize_text(item) for item in args.split(',')]
+
+    if operator == 'eq':
+        return EqualsPredicate(label=label, column=column, negate=negate, value=_normalize_text(args))
+    if operator == 'in':
+        values = frozenset(item for item in items if item)
+        if not values:
+            raise ValueError(f"El criterio 'in' sobre '{label}' no tiene valores.")
+        return InSetPredicate(label=label, column=column, negate=negate, values=values)
+    if operator == 'prefix':
+        prefixes = tuple(item for item in items if item)
+        if not prefixes:
+            raise ValueError(f"El criterio 'prefix' sobre '{label}' no tiene prefijos.")
+        return PrefixPredicate(label=label, column=column, negate=negate, prefixes=prefixes)
+
+    # between
+    bounds = [item.strip() for item in args.split(',')]
+    if len(bounds) != 2 or not any(bounds):
+        raise ValueError(f"El criterio 'between' sobre '{label}' requiere dos límites separados por coma: '{args.strip()}'.")
+    range_kind, lower, upper = _parse_range_bounds(label, *bounds)
+    return RangePredicate(
+        label=label, column=column, negate=negate, lower=lower, upper=upper, range_kind=range_kind
+    )
+
+
+def _normalize_text(value: str) -> str:
+    return str(value).upper().strip()
+
+
+def _parse_range_bounds(label: str, lower: str, upper: str) -> tuple[str, object, object]:
+    """Interpreta los límites como números si es posible; si no, como fechas."""
+    present = [bound for bound in (lower, upper) if bound]
+    try:
+        numbers = [float(bound) if bound else None for bound in (lower, upper)]
+        return PredicateKind.NUMBER, numbers[0], numbers[1]
+    except ValueError:
+        pass
+
+    try:
+        dates = [np.datetime64(pd.Timestamp(bound).date(), 'D') if bound else None for bound in (lower, upper)]
+    except (ValueError, TypeError) as e:
+        raise ValueError(
+            f"Los límites {present} del criterio 'between' sobre '{label}' no son números ni fechas válidas."
+        ) from e
+    return PredicateKind.DATE, dates[0], dates[1]
+
+
+@dataclass
+class FilterRunState:
+    """
+    Estado adaptativo de una ejecución de un `FilterPlan` (una carga completa o
+    un recorrido en streaming). Vive fuera del plan, que forma parte del
+    `ProfileSpec` inmutable y cacheado, para que no se filtre entre ejecuciones
+    ni entre hilos.
+    """
+    # Fracción estimada de filas que supera cada predicado (índice -> fracción).
+    pass_ratio: dict[int, float] = field(default_factory=dict)
+    # Columnas ausentes ya advertidas.
+    warned_missing: set[str] = field(default_factory=set)
+
+
+class FilterPlan:
+    """
+    Plan de filtrado compilado a partir de [FilterCriteria].
+
+    En lugar de copiar el DataFrame y construir un DataFrame intermedio por cada
+    criterio, el plan evalúa los predicados como máscaras de NumPy sobre el
+    conjunto de posiciones que siguen vivas, de modo que:
+    - Cada columna referenciada se normaliza una única vez, y solo en las filas
+      que aún no han sido descartadas.
+    - Los predicados se evalúan del más al menos selectivo (estimado con una
+      muestra la primera vez y con lo observado en evaluaciones anteriores de
+      la misma ejecución), por lo que los más restrictivos reducen el trabajo de
+      los siguientes.
+    - El resultado es una única selección posicional de filas.
+
+    El plan no guarda estado: lo aprendido se acumula en un `FilterRunState`.
+    Las columnas de fecha se interpretan con `date_format` (ver `to_datetime_tolerant`).
+    """
+
+    def __init__(self, predicates: Iterable[FilterPredicate], date_format: Optional[str] = None):
+        self.predicates = tuple(predicates)
+        self.date_format = date_format
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def __len__(self) -> int:
+        return len(self.predicates)
+
+    def evaluate(
+        self, data: pd.DataFrame, state: Optional[FilterRunState] = None
+    ) -> tuple[np.ndarray, list[tuple[FilterPredicate, int, int]]]:
+        """
+        Evalúa el plan sobre un DataFrame.
+
+        Args:
+            data: El DataFrame (o bloque) a filtrar.
+            state: Estado de la ejecución en curso, compartido entre los bloques
+                   de un mismo recorrido. Sin él, la evaluación es independiente.
+
+        Returns:
+            Una tupla (posiciones, conteos): las posiciones (enteras) de las filas
+            que cumplen todos los predicados, y por cada predicado aplicado, en
+            orden de evaluación, la tupla (predicado, filas_antes, filas_después).
+        """
+        if state is None:
+            state = FilterRunState()
+        active = []
+        for i, predicate in enumerate(self.predicates):
+            if predicate.column in data.columns:
+                active.append(i)
+            elif predicate.column not in state.warned_missing:
+                state.warned_missing.add(predicate.column)
+                self.logger.warning(
+                    f"La columna '{predicate.column}' (de '{predicate.label}') no existe en el DataFrame. "
+                    "Se omitirá este filtro."
+                )
+
+        alive = np.arange(len(data))
+        if not active or len(data) == 0:
+            return alive, []
+
+        normalized_cache: dict[tuple[str, str], tuple[np.ndarray, np.ndarray]] = {}
+        self._estimate_selectivity(data, active, state)
+        order = sorted(active, key=lambda i: state.pass_ratio[i])
+
+        counts = []
+        for i in order:
+            predicate = self.predicates[i]
+            rows_before = len(alive)
+            if rows_before:
+                values = self._normalized_at(data, predicate, alive, normalized_cache)
+                alive = alive[predicate.evaluate(values)]
+                state.pass_ratio[i] = len(alive) / rows_before
+            counts.append((predicate, rows_before, len(alive)))
+
+        return alive, counts
+
+    def _estimate_selectivity(self, data: pd.DataFrame, active: list[int], state: FilterRunState) -> None:
+        """Estima con una muestra uniforme la fracción de filas que supera cada predicado nuevo."""
+        pending = [i for i in active if i not in state.pass_ratio]
+        if not pending:
+            return
+
+        sample = np.unique(np.linspace(0, len(data) - 1, num=min(len(data), _SELECTIVITY_SAMPLE_SIZE), dtype=np.int64))
+        sample_cache: dict[tuple[str, str], tuple[np.ndarray, np.ndarray]] = {}
+        for i in pending:
+            predicate = self.predicates[i]
+            values = self._normalized_at(data, predicate, sample, sample_cache)
+            state.pass_ratio[i] = float(np.count_nonzero(predicate.evaluate(values))) / len(sample)
+
+    def _normalized_at(
+        self,
+        data: pd.DataFrame,
+        predicate: FilterPredicate,
+        positions: np.ndarray,
+        cache: dict[tuple[str, str], tuple[np.ndarray, np.ndarray]],
+    ) -> np.ndarray:
+        """
+        Devuelve la columna del predicado, normalizada según su tipo, en las
+        posiciones pedidas. La normalización se calcula una sola vez por par
+        (columna, tipo); como las posiciones vivas solo pueden reducirse, los usos
+        posteriores se resuelven indexando la versión cacheada.
+        """
+        key = (predicate.column, predicate.kind)
+        if key in cache:
+            cached_positions, cached_values = cache[key]
+            return cached_values[np.searchsorted(cached_positions, positions)]
+
+        raw = pd.Series(data[predicate.column].to_numpy()[positions], copy=False)
+        if predicate.kind == PredicateKind.NUMBER:
+            normalized = pd.to_numeric(raw, errors='coerce').to_numpy(dtype=float)
+        elif predicate.kind == PredicateKind.DATE:
+            normalized = to_datetime_tolerant(raw, self.date_format).to_numpy(dtype='datetime64[D]')
+        else:
+            normalized = raw.astype(str).str.upper().str.strip().to_numpy()
+        cache[key] = (positions, normalized)
+        return normalized
+
 
 class DataFilterer:
     """
@@ -13,38 +345,78 @@ class DataFilterer:
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    def apply_criteria(self, data: pd.DataFrame, profile_config: ConfigParser) -> pd.DataFrame:
-        if ConfigSections.FILTER_CRITERIA not in profile_config:
-            self.logger.warning(f"No se encontró la sección [{ConfigSections.FILTER_CRITERIA}] en el perfil. Devolviendo datos sin filtrar.")
-            return data
+    def compile_plan(self, profile_config: ConfigParser) -> FilterPlan:
+        """
+        Traduce [FilterCriteria] a un FilterPlan, omitiendo con una advertencia las
+        claves sin mapeo en [ColumnMapping]. Ver `parse_criterion` para la sintaxis
+        de operadores admitida.
 
-        self.logger.info("Iniciando aplicación de criterios de filtro.")
-        filtered_df = data.copy()
-        
+        Raises:
+            ValueError: Si algún criterio tiene una sintaxis de operador inválida.
+        """
         criteria = profile_config[ConfigSections.FILTER_CRITERIA]
         mapping = profile_config[ConfigSections.COLUMN_MAPPING]
 
+        predicates = []
         for key, value in criteria.items():
             if key not in mapping:
                 self.logger.warning(f"La clave de filtro '{key}' no tiene un mapeo de columna en [{ConfigSections.COLUMN_MAPPING}]. Se omitirá.")
                 continue
 
             original_excel_col = mapping[key]
-            sanitized_col = sanitize_column_name(original_excel_col)
+            predicates.append(parse_criterion(
+                label=original_excel_col,
+                column=sanitize_column_name(original_excel_col),
+                raw_value=value,
+            ))
+        date_format = profile_config.get(ConfigSections.DATA_SOURCE, ConfigKeys.DATE_FORMAT, raw=True, fallback=None)
+        return FilterPlan(predicates, date_format=date_format)
 
-            if sanitized_col not in filtered_df.columns:
-                self.logger.warning(f"La columna '{sanitized_col}' (de '{original_excel_col}') no existe en el DataFrame. Se omitirá este filtro.")
-                continue
-            
-            initial_rows = len(filtered_df)
-            column_series = filtered_df[sanitized_col].astype(str).str.upper().str.strip()
-            criterion_value = str(value).upper().strip()
-            
-            filtered_df = filtered_df[column_series == criterion_value]
-            
-            self.logger.info(
-                f"Filtro '{original_excel_col}' == '{criterion_value}': {initial_rows} -> {len(filtered_df)} filas."
-            )
+    def apply_criteria(self, data: pd.DataFrame, profile: 'ProfileSpec') -> pd.DataFrame:
+        if profile.filter_plan is None:
+            self.logger.warning(f"No se encontró la sección [{ConfigSections.FILTER_CRITERIA}] en el perfil. Devolviendo datos sin filtrar.")
+            return data
+
+        self.logger.info("Iniciando aplicación de criterios de filtro.")
+        filtered_df = self._apply_plan(data, profile.filter_plan, FilterRunState(), self.logger.info)
 
         self.logger.info(f"Filtrado completado. {len(filtered_df)} filas cumplen todos los criterios.")
-        return filtered_df
\ No newline at end of file
+        return filtered_df
+
+    def apply_criteria_stream(
+        self, chunks: Iterable[pd.DataFrame], profile: 'ProfileSpec'
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Versión en streaming de `apply_criteria`: filtra cada bloque a medida que
+        llega con el plan compilado del perfil, conservando la selectividad
+        aprendida entre los bloques de este recorrido; el detalle por bloque se
+        registra a nivel DEBUG.
+        """
+        if profile.filter_plan is None:
+            self.logger.warning(f"No se encontró la sección [{ConfigSections.FILTER_CRITERIA}] en el perfil. Devolviendo datos sin filtrar.")
+            yield from chunks
+            return
+
+        self.logger.info("Iniciando aplicación de criterios de filtro en streaming.")
+        state = FilterRunState()
+        rows_in = rows_out = 0
+        for chunk in chunks:
+            rows_in += len(chunk)
+            filtered_chunk = self._apply_plan(chunk, profile.filter_plan, state, self.logger.debug)
+            rows_out += len(filtered_chunk)
+            yield filtered_chunk
+
+        self.logger.info(f"Filtrado completado. {rows_in} -> {rows_out} filas cumplen todos los criterios.")
+
+    def _apply_plan(self, data: pd.DataFrame, plan: FilterPlan, state: FilterRunState, log) -> pd.DataFrame:
+        """Evalúa el plan y materializa la selección resultante con una única indexación."""
+        if not len(plan):
+            return data
+
+        selection, counts = plan.evaluate(data, state)
+        for predicate, rows_before, rows_after in counts:
+            log(f"Filtro {predicate.describe()}: {rows_before} -> {rows_after} filas.")
+
+        if len(selection) == len(data):
+            return data
+        return data.iloc[selection]
@@ -1,16 +1,106 @@
+import hashlib
+import importlib.util
 import logging
-import pandas as pd
+import os
+from dataclasses import dataclass
 from pathlib import Path
-from src.utils.dataframe_helpers import sanitize_column_name
+from typing import Iterator, Optional
+
+import pandas as pd
+
+from src.utils.dataframe_helpers import sanitize_column_name, to_datetime_tolerant, to_text
+
+
+def _pyarrow():
+    """
+    Importa pyarrow bajo demanda: solo lo necesita la caché, y su importación es
+    costosa. Sin pyarrow el cargador funciona igual, pero sin caché en disco.
+    """
+    import pyarrow
+    import pyarrow.ipc
+    return pyarrow
+
+
+# Se incrementa cuando cambia la forma en que se sanean o serializan los datos,
+# invalidando así todas las entradas de caché existentes.
+_CACHE_FORMAT_VERSION = 3
+
+# Valores de texto que `pd.read_excel` interpreta como nulos por defecto. El modo
+# streaming los replica para que ambos modos de carga entreguen los mismos nulos
+# al validador.
+_DEFAULT_NA_STRINGS = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+    'nan', 'null',
+})
+
+
+def _text_columns(df: pd.DataFrame) -> list:
+    """Columnas de texto: `object` y, en pandas 3, también el dtype `str`."""
+    return [
+        col for col, dtype in df.dtypes.items()
+        if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+    ]
+
+
+@dataclass(frozen=True)
+class ColumnSchema:
+    """
+    Columnas a cargar y el tipo con el que deben llegar al resto del pipeline.
+    Todos los nombres están YA SANEADOS.
+
+    Atributos:
+        columns: Columnas a conservar; el resto de la hoja no se materializa.
+        text: Columnas de texto/identificadores (ej. '1234567', nunca '1234567.0').
+        dates: Columnas de fecha, parseadas una sola vez en la carga.
+        categorical: Columnas de texto con pocos valores distintos, almacenadas
+                     como `category` para reducir memoria.
+        date_format: Formato de las columnas de fecha (ver `to_datetime_tolerant`).
+    """
+    columns: frozenset[str]
+    text: frozenset[str] = frozenset()
+    dates: frozenset[str] = frozenset()
+    categorical: frozenset[str] = frozenset()
+    date_format: Optional[str] = None
+
+    def fingerprint(self) -> str:
+        """Representación estable del esquema, usada en la clave de la caché."""
+        groups = "|".join(
+            ",".join(sorted(group))
+            for group in (self.columns, self.text, self.dates, self.categorical)
+        )
+        return f"{groups}|{self.date_format or ''}"
+
 
 class ExcelLoader:
     """
     Responsable única de cargar datos desde un archivo Excel a un DataFrame.
     Sanea los nombres de las columnas inmediatamente después de la carga para
     garantizar un estado interno limpio y predecible.
+
+    Si recibe un `ColumnSchema`, solo lee las columnas del esquema y les aplica
+    sus tipos durante la carga (identificadores como texto, fechas parseadas y
+    columnas categóricas), de modo que las etapas siguientes no necesitan
+    corregir tipos fila a fila.
+
+    Opcionalmente mantiene una caché en disco (formato Arrow IPC) del DataFrame
+    ya saneado, indexada por el hash del contenido del archivo, la hoja, la fila
+    de encabezado y el esquema. Una ejecución "en caliente" evita por completo el
+    parseo con openpyxl, que es el paso más lento del pipeline.
     """
-    def __init__(self):
+    def __init__(self, cache_dir: str | Path | None = None):
+        """
+        Args:
+            cache_dir: [Opcional] Directorio de la caché de libros parseados
+                       (ej. 'data/cache'). Si es None, la caché se desactiva.
+        """
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None and importlib.util.find_spec('pyarrow') is None:
+            self.logger.warning(
+                "La librería 'pyarrow' no está instalada. La caché de libros parseados queda desactivada."
+            )
+            self.cache_dir = None
 
     def _sanitize_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -22,20 +112,44 @@ class ExcelLoader:
         self.logger.debug(f"Nuevas columnas: {df.columns.tolist()}")
         return df
 
-    def load_data(self, file_path: Path, sheet_name: str, header_row: int) -> pd.DataFrame:
+    def load_data(
+        self, file_path: Path, sheet_name: str, header_row: int, schema: Optional[ColumnSchema] = None
+    ) -> pd.DataFrame:
         """
         Carga los datos de una hoja de cálculo y sanea sus columnas.
+        Si la caché está activa y contiene una entrada vigente, la usa en lugar de
+        volver a parsear el archivo.
+
+        Args:
+            schema: [Opcional] Columnas a cargar y sus tipos. Si se omite, se cargan
+                    todas las columnas con los tipos que infiera pandas.
         """
         self.logger.info(f"Iniciando carga de datos desde '{file_path}', hoja '{sheet_name}'.")
         try:
+            cache_path = self._cache_path(file_path, sheet_name, header_row, schema)
+            if cache_path is not None and cache_path.exists():
+                cached_df = self._read_cache(cache_path)
+                if cached_df is not None:
+                    return cached_df
+
+            read_options = {}
+            if schema is not None:
+                # El encabezado llega sin sanear: se compara por su forma saneada.
+                read_options['usecols'] = lambda name: sanitize_column_name(name) in schema.columns
+                read_options['dtype'] = object
             df = pd.read_excel(
                 file_path,
                 sheet_name=sheet_name,
                 header=header_row - 1,
-                engine='openpyxl'
+                engine='openpyxl',
+                **read_options
             )
             self.logger.info(f"Carga exitosa. Se leyeron {len(df)} filas en total.")
             df = self._sanitize_columns(df)
+            if schema is not None:
+                df = self._apply_schema(df, schema)
+            if cache_path is not None:
+                self._write_cache(df, cache_path)
             return df
         except FileNotFoundError:
             self.logger.error(f"Error: El archivo '{file_path}' no fue encontrado.")
@@ -45,4 +159,256 @@ class ExcelLoader:
                 self.logger.error(f"Error: La hoja '{sheet_name}' no existe en '{file_path}'.")
             else:
                 self.logger.error(f"Error de valor al leer el Excel: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    def iter_chunks(
+        self,
+        file_path: Path,
+        sheet_name: str,
+        header_row: int,
+        chunk_size: int,
+        schema: Optional[ColumnSchema] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Carga la hoja en modo streaming, entregando bloques de como máximo
+        `chunk_size` filas con las columnas ya saneadas.
+
+        Usa el modo de solo lectura de openpyxl (`iter_rows`), por lo que la
+        memoria máxima depende del tamaño del bloque y no del tamaño del archivo.
+        Las filas completamente vacías se omiten. El índice de cada bloque
+        continúa la numeración del anterior, de modo que las filas conservan un
+        identificador único a lo largo de todo el flujo.
+
+        Args:
+            file_path: Ruta al archivo Excel.
+            sheet_name: Nombre de la hoja a leer.
+            header_row: Fila del encabezado (1-indexed, como en Excel).
+            chunk_size: Número máximo de filas por bloque.
+            schema: [Opcional] Columnas a conservar y sus tipos. Si se omite, se
+                    conservan todas las columnas de la hoja sin conversión.
+
+        Yields:
+            DataFrames con columnas saneadas, proyectadas y tipadas.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"El tamaño de bloque debe ser positivo (recibido: {chunk_size}).")
+
+        self.logger.info(
+            f"Iniciando carga en streaming desde '{file_path}', hoja '{sheet_name}' "
+            f"(bloques de {chunk_size} filas)."
+        )
+        if not Path(file_path).exists():
+            self.logger.error(f"Error: El archivo '{file_path}' no fue encontrado.")
+            raise FileNotFoundError(f"El archivo '{file_path}' no fue encontrado.")
+
+        cache_path = self._cache_path(file_path, sheet_name, header_row, schema)
+        if cache_path is not None and cache_path.exists():
+            yield from self._iter_cache(cache_path, chunk_size)
+            return
+
+        import openpyxl  # Solo el modo streaming lo usa directamente.
+
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            if sheet_name not in workbook.sheetnames:
+                self.logger.error(f"Error: La hoja '{sheet_name}' no existe en '{file_path}'.")
+                raise ValueError(f"Worksheet named '{sheet_name}' not found")
+
+            rows = workbook[sheet_name].iter_rows(min_row=header_row, values_only=True)
+            header = next(rows, None)
+            if header is None:
+                self.logger.warning("La hoja no contiene encabezado. No hay datos que cargar.")
+                return
+
+            names = self._sanitize_header(header)
+            wanted = schema.columns if schema is not None else None
+            positions = [i for i, name in enumerate(names) if wanted is None or name in wanted]
+            projected_names = [names[i] for i in positions]
+            if wanted is not None:
+                missing = wanted.difference(projected_names)
+                if missing:
+                    self.logger.warning(f"Columnas solicitadas ausentes en la hoja: {sorted(missing)}")
+            self.logger.debug(f"Columnas proyectadas: {projected_names}")
+
+            buffer = []
+            offset = 0
+            for row in rows:
+                if not any(value is not None for value in row):
+                    continue
+                buffer.append(tuple(row[i] if i < len(row) else None for i in positions))
+                if len(buffer) == chunk_size:
+                    yield self._build_chunk(buffer, projected_names, offset, schema)
+                    offset += len(buffer)
+                    buffer = []
+
+            if buffer:
+                yield self._build_chunk(buffer, projected_names, offset, schema)
+                offset += len(buffer)
+
+            self.logger.info(f"Carga en streaming finalizada. Se leyeron {offset} filas en total.")
+        finally:
+            workbook.close()
+
+    def _sanitize_header(self, header: tuple) -> list[str]:
+        """
+        Sanea la fila de encabezado imitando las convenciones de `pd.read_excel`:
+        celdas vacías como 'Unnamed: N' y sufijos '.N' para nombres duplicados.
+        """
+        names = []
+        seen: dict[str, int] = {}
+        for i, value in enumerate(header):
+            raw = f"Unnamed: {i}" if value is None else str(value)
+            if raw in seen:
+                seen[raw] += 1
+                raw = f"{raw}.{seen[raw]}"
+            else:
+                seen[raw] = 0
+            names.append(sanitize_column_name(raw))
+        return names
+
+    def _build_chunk(
+        self, records: list[tuple], names: list[str], offset: int, schema: Optional[ColumnSchema]
+    ) -> pd.DataFrame:
+        """
+        Construye un bloque, normaliza los nulos textuales como lo hace `read_excel`
+        y aplica el esquema si se proporcionó.
+        """
+        chunk = pd.DataFrame.from_records(
+            records,
+            columns=names,
+            index=pd.RangeIndex(offset, offset + len(records)),
+        )
+        for col in _text_columns(chunk):
+            na_mask = chunk[col].isin(_DEFAULT_NA_STRINGS)
+            if na_mask.any():
+                chunk[col] = chunk[col].mask(na_mask)
+        if schema is not None:
+            chunk = self._apply_schema(chunk, schema)
+        return chunk
+
+    def _apply_schema(self, df: pd.DataFrame, schema: ColumnSchema) -> pd.DataFrame:
+        """
+        Convierte las columnas presentes a los tipos del esquema. Las conversiones
+        son vectorizadas o se hacen una vez por valor distinto (ver `to_text`).
+
+        Una columna de fecha con celdas no interpretables conserva esas celdas con
+        su valor original, para que el validador pueda reportarlas como tales en
+        lugar de confundirlas con celdas vacías.
+        """
+        for col in df.columns:
+            if col in schema.dates:
+                parsed = to_datetime_tolerant(df[col], schema.date_format)
+                unparsed = parsed.isna() & df[col].notna()
+                if unparsed.any():
+                    self.logger.debug(f"La columna '{col}' tiene {int(unparsed.sum())} fechas no interpretables.")
+                    parsed = parsed.astype(object).mask(unparsed, df[col])
+                df[col] = parsed
+            elif col in schema.categorical:
+                df[col] = to_text(df[col]).astype('category')
+            elif col in schema.text:
+                df[col] = to_text(df[col])
+        return df
+
+    # --- Caché en disco (Arrow IPC) ---
+
+    def _cache_path(
+        self, file_path: Path, sheet_name: str, header_row: int, schema: Optional[ColumnSchema]
+    ) -> Optional[Path]:
+        """
+        Calcula la ruta de la entrada de caché para la combinación archivo/hoja/encabezado/esquema.
+
+        El nombre es `{stem}-{ranura}-{contenido}.arrow`: la ranura identifica la ruta
+        resuelta del archivo, la hoja, el encabezado y el esquema; el contenido es el
+        hash SHA-256 del archivo, por lo que cualquier cambio en él produce una
+        entrada nueva (invalidación implícita) que reemplaza a la de su misma ranura.
+        """
+        if self.cache_dir is None:
+            return None
+
+        content_hash = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                content_hash.update(block)
+
+        slot = hashlib.sha256(
+            f"{_CACHE_FORMAT_VERSION}|{Path(file_path).resolve()}|{sheet_name}|{header_row}|"
+            f"{schema.fingerprint() if schema is not None else '*'}".encode('utf-8')
+        ).hexdigest()[:16]
+        stem = sanitize_column_name(Path(file_path).stem)
+        return self.cache_dir / f"{stem}-{slot}-{content_hash.hexdigest()[:24]}.arrow"
+
+    @staticmethod
+    def _cache_slot_pattern(cache_path: Path) -> str:
+        """Patrón de las entradas de la misma ranura (mismo archivo, hoja, encabezado y esquema)."""
+        prefix, _, _ = cache_path.stem.rpartition('-')
+        return f"{prefix}-*.arrow"
+
+    def _read_cache(self, cache_path: Path) -> Optional[pd.DataFrame]:
+        """Lee una entrada de caché mapeándola en memoria. Devuelve None si está corrupta."""
+        pa = _pyarrow()
+        try:
+            # Se cierra al terminar para no retener el archivo (en Windows impediría reemplazarlo o borrarlo).
+            with pa.memory_map(str(cache_path), 'r') as source:
+                df = pa.ipc.open_file(source).read_all().to_pandas()
+        except (OSError, pa.ArrowException) as e:
+            self.logger.warning(f"La entrada de caché '{cache_path}' es ilegible y será ignorada: {e}")
+            return None
+
+        self.logger.info(f"Carga desde caché exitosa ('{cache_path.name}'). Se leyeron {len(df)} filas en total.")
+        return df
+
+    def _iter_cache(self, cache_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Entrega una entrada de caché por bloques, sin materializar la tabla completa
+        en pandas. La entrada ya está proyectada y tipada según el esquema de su clave.
+        """
+        pa = _pyarrow()
+        with pa.memory_map(str(cache_path), 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+
+            self.logger.info(f"Carga en streaming desde caché ('{cache_path.name}'), {table.num_rows} filas.")
+            for offset in range(0, table.num_rows, chunk_size):
+                chunk = table.slice(offset, chunk_size).to_pandas()
+                chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                yield chunk
+
+    def _write_cache(self, df: pd.DataFrame, cache_path: Path) -> None:
+        """
+        Persiste el DataFrame saneado y elimina las entradas obsoletas de su misma
+        ranura (versiones anteriores del contenido). Las entradas de otras hojas,
+        esquemas o archivos se conservan.
+        Un fallo al escribir nunca interrumpe la carga: solo se registra.
+        """
+        pa = _pyarrow()
+        try:
+            table = self._to_arrow(df)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            with pa.OSFile(str(tmp_path), 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, cache_path)
+        except (OSError, pa.ArrowException) as e:
+            self.logger.warning(f"No se pudo escribir la caché '{cache_path}': {e}")
+            return
+
+        for stale in cache_path.parent.glob(self._cache_slot_pattern(cache_path)):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+        self.logger.info(f"DataFrame saneado guardado en caché: '{cache_path}'.")
+
+    def _to_arrow(self, df: pd.DataFrame) -> "pyarrow.Table":
+        """
+        Convierte a Arrow. Las columnas de tipo mixto (habituales en Excel, ej. números
+        y texto en la misma columna) se guardan como texto conservando los nulos; el
+        resto del pipeline ya compara y transforma esos valores como cadenas.
+        """
+        pa = _pyarrow()
+        df = df.copy(deep=False)
+        for col in _text_columns(df):
+            try:
+                pa.array(df[col], from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                self.logger.debug(f"La columna '{col}' tiene tipos mixtos; se almacenará como texto en caché.")
+                df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+        return pa.Table.from_pandas(df, preserve_index=True)
@@ -1,12 +1,133 @@
 import logging
+import re
+import numpy as np
 import pandas as pd
 from configparser import ConfigParser
-from src.utils.dataframe_helpers import sanitize_column_name
-from src.core.constants import ConfigSections, LogicalFields
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+from src.utils.dataframe_helpers import sanitize_column_name, to_datetime_tolerant
+from src.core.constants import ConfigKeys, ConfigSections, LogicalFields
+
+if TYPE_CHECKING:
+    from src.core.profile import ProfileSpec
+
+# Columna auxiliar que viaja en el DataFrame de filas inválidas con la máscara de
+# bits de las reglas incumplidas. Se traduce a texto solo al escribir el reporte.
+REJECTION_MASK_COLUMN = '_rechazo_mask'
+
+# Sufijo de las claves de [ValidationRules] que declaran un patrón de formato.
+_PATTERN_KEY_SUFFIX = '_pattern'
+_DUPLICATE_KEY = 'duplicate_key'
+
+
+@dataclass(frozen=True)
+class ValidationRule:
+    """
+    Una regla de validación con su bit asignado en la máscara de rechazo.
+
+    Atributos:
+        bit: Posición del bit (0-63) en la máscara de cada fila.
+        kind: Tipo de regla ('missing_columns', 'null', 'date', 'pattern', 'duplicate').
+        columns: Columnas saneadas sobre las que actúa la regla.
+        reason: Texto legible que aparecerá en el reporte de errores.
+        pattern: Expresión regular (solo para reglas de tipo 'pattern').
+        date_format: Formato de fecha de [DataSource] (solo para reglas de tipo 'date').
+    """
+    bit: int
+    kind: str
+    columns: tuple[str, ...]
+    reason: str
+    pattern: Optional[str] = None
+    date_format: Optional[str] = None
+
+
+class ValidationRuleSet:
+    """
+    Conjunto de reglas compilado a partir del perfil.
+
+    Evalúa todas las reglas como máscaras vectorizadas (un paso por columna, no
+    por fila) y acumula en un entero de 64 bits por fila qué reglas falló. El
+    texto de los motivos solo se construye bajo demanda, una vez por combinación
+    distinta de fallos, al generar el reporte de errores.
+    """
+
+    MAX_RULES = 64
+
+    def __init__(self, rules: Iterable[ValidationRule]):
+        self.rules = tuple(rules)
+        if len(self.rules) > self.MAX_RULES:
+            raise ValueError(f"Se definieron {len(self.rules)} reglas de validación; el máximo es {self.MAX_RULES}.")
+
+    def evaluate(self, data: pd.DataFrame, seen_keys: Optional[set] = None) -> tuple[np.ndarray, list[ValidationRule]]:
+        """
+        Calcula la máscara de reglas incumplidas de cada fila.
+
+        Args:
+            data: El DataFrame a validar.
+            seen_keys: [Opcional] Hashes de claves ya vistas en bloques anteriores.
+                       Si se proporciona, la detección de duplicados abarca todos
+                       los bloques y el conjunto se actualiza con las claves nuevas.
+
+        Returns:
+            Una tupla (máscaras, omitidas): un arreglo uint64 con una máscara por
+            fila, y las reglas que no pudieron aplicarse porque sus columnas no
+            existen en el DataFrame.
+        """
+        masks = np.zeros(len(data), dtype=np.uint64)
+        skipped = []
+        for rule in self.rules:
+            if rule.kind == 'missing_columns':
+                # Se asigna fuera del motor: descarta el bloque completo (ver `DataValidator`).
+                continue
+            if any(col not in data.columns for col in rule.columns):
+                skipped.append(rule)
+                continue
+            failed = self._failed_rows(rule, data, seen_keys)
+            masks[failed] |= np.uint64(1) << np.uint64(rule.bit)
+        return masks, skipped
+
+    def required_columns(self) -> list[str]:
+        """Columnas cuya ausencia invalida el archivo completo (las de las reglas de nulos)."""
+        return [rule.columns[0] for rule in self.rules if rule.kind == 'null']
+
+    def describe(self, masks: pd.Series) -> pd.Series:
+        """Traduce las máscaras a motivos legibles, separados por '; '."""
+        reasons = {
+            mask: "; ".join(rule.reason for rule in self.rules if int(mask) >> rule.bit & 1)
+            for mask in pd.unique(masks)
+        }
+        return masks.map(reasons)
+
+    def _failed_rows(self, rule: ValidationRule, data: pd.DataFrame, seen_keys: Optional[set]) -> np.ndarray:
+        if rule.kind == 'null':
+            return data[rule.columns[0]].isnull().to_numpy()
+
+        column = data[rule.columns[0]]
+        if rule.kind == 'date':
+            return (to_datetime_tolerant(column, rule.date_format).isna() & column.notna()).to_numpy()
+
+        if rule.kind == 'pattern':
+            matches = column.astype(str).str.strip().str.fullmatch(rule.pattern)
+            return (column.notna() & ~matches.fillna(False).astype(bool)).to_numpy()
+
+        # duplicate
+        key_hashes = pd.util.hash_pandas_object(data[list(rule.columns)], index=False)
+        duplicated = key_hashes.duplicated(keep='first').to_numpy()
+        if seen_keys is not None:
+            # Sin `|=`: en pandas 3 `to_numpy()` puede devolver una vista de solo lectura.
+            duplicated = np.logical_or(duplicated, key_hashes.isin(seen_keys).to_numpy())
+            seen_keys.update(key_hashes.to_numpy().tolist())
+        return duplicated
+
 
 class DataValidator:
     """
-    Valida la integridad de los datos, asegurando que las columnas esenciales no sean nulas.
+    Valida la integridad de los datos mediante un motor de reglas vectorizado.
+
+    Reglas incorporadas: columnas esenciales presentes, valores no nulos en las
+    columnas requeridas y fecha de ingreso interpretable. La sección opcional
+    [ValidationRules] del perfil añade reglas de formato (`<campo>_pattern`) y de
+    clave duplicada (`duplicate_key`).
     """
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -20,26 +141,105 @@ class DataValidator:
             LogicalFields.ESTRATO
         ]
 
-    def validate_data(self, data: pd.DataFrame, profile_config: ConfigParser) -> tuple[pd.DataFrame, pd.DataFrame]:
-        self.logger.info("Iniciando validación de datos para columnas requeridas.")
+    def compile_rules(self, profile_config: ConfigParser) -> ValidationRuleSet:
+        """
+        Construye el conjunto de reglas del perfil. La asignación de bits es
+        determinista, por lo que la misma configuración produce siempre las mismas
+        máscaras.
+
+        Raises:
+            ValueError: Si una regla de [ValidationRules] es inválida.
+        """
+        mapping = profile_config[ConfigSections.COLUMN_MAPPING]
+        rules = [ValidationRule(
+            bit=0,
+            kind='missing_columns',
+            columns=(),
+            reason="Faltan columnas esenciales en el archivo de entrada.",
+        )]
+
+        def add(kind, columns, reason, pattern=None, date_format=None):
+            rules.append(ValidationRule(
+                bit=len(rules), kind=kind, columns=tuple(columns), reason=reason, pattern=pattern, date_format=date_format
+            ))
+
+        for key in self.required_logical_fields:
+            if key in mapping:
+                add('null', [sanitize_column_name(mapping[key])], f"Falta el valor de '{mapping[key]}'.")
+
+        if LogicalFields.FECHA_INGRESO in mapping:
+            excel_col = mapping[LogicalFields.FECHA_INGRESO]
+            date_format = profile_config.get(ConfigSections.DATA_SOURCE, ConfigKeys.DATE_FORMAT, raw=True, fallback=None)
+            add('date', [sanitize_column_name(excel_col)], f"La fecha de '{excel_col}' no es interpretable.",
+                date_format=date_format)
+
+        if profile_config.has_section(ConfigSections.VALIDATION_RULES):
+            section = profile_config[ConfigSections.VALIDATION_RULES]
+            for key, value in section.items():
+                if key.endswith(_PATTERN_KEY_SUFFIX):
+                    field = key[:-len(_PATTERN_KEY_SUFFIX)]
+                    if field not in mapping:
+                        raise ValueError(f"La regla '{key}' hace referencia a '{field}', que no está en [{ConfigSections.COLUMN_MAPPING}].")
+                    try:
+                        re.compile(value)
+                    except re.error as e:
+                        raise ValueError(f"La expresión regular de '{key}' es inválida: {e}") from e
+                    add('pattern', [sanitize_column_name(mapping[field])],
+                        f"El valor de '{mapping[field]}' no cumple el formato esperado.", pattern=value)
+
+                elif key == _DUPLICATE_KEY:
+                    fields = [f.strip() for f in value.split(',') if f.strip()]
+                    unknown = [f for f in fields if f not in mapping]
+                    if not fields or unknown:
+                        raise ValueError(f"La clave duplicada '{value}' contiene campos sin mapeo: {unknown}.")
+                    add('duplicate', [sanitize_column_name(mapping[f]) for f in fields],
+                        f"Registro duplicado para la clave ({', '.join(mapping[f] for f in fields)}).")
+
+        return ValidationRuleSet(rules)
+
+    def validate_data(self, data: pd.DataFrame, profile: 'ProfileSpec') -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Separa las filas válidas de las inválidas. El DataFrame de inválidas incluye
+        la columna `REJECTION_MASK_COLUMN` con las reglas incumplidas por cada fila
+        (ver `describe_rejections`).
+        """
+        return self._validate(data, profile.validation_rules, seen_keys=None)
+
+    def validate_stream(
+        self, chunks: Iterable[pd.DataFrame], profile: 'ProfileSpec'
+    ) -> Iterator[tuple[pd.DataFrame, pd.DataFrame]]:
+        """
+        Versión en streaming de `validate_data`: entrega una tupla (válidas, inválidas)
+        por cada bloque recibido. La detección de duplicados abarca todos los bloques.
+        """
+        seen_keys: set = set()
+        for chunk in chunks:
+            yield self._validate(chunk, profile.validation_rules, seen_keys)
+
+    def describe_rejections(self, masks: pd.Series, profile: 'ProfileSpec') -> pd.Series:
+        """Traduce la columna de máscaras de rechazo a motivos legibles."""
+        return profile.validation_rules.describe(masks)
+
+    def _validate(
+        self, data: pd.DataFrame, rule_set: ValidationRuleSet, seen_keys: Optional[set]
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        self.logger.info("Iniciando validación de datos.")
         if data.empty:
             self.logger.info("El DataFrame de entrada está vacío, no hay nada que validar.")
-            return data, data.copy()
-            
-        mapping = profile_config[ConfigSections.COLUMN_MAPPING]
-        
-        required_sanitized_cols = [
-            sanitize_column_name(mapping[key]) for key in self.required_logical_fields if key in mapping
-        ]
-        
-        missing_cols = [col for col in required_sanitized_cols if col not in data.columns]
+            return data, data.assign(**{REJECTION_MASK_COLUMN: np.zeros(0, dtype=np.uint64)})
+
+        missing_cols = [col for col in rule_set.required_columns() if col not in data.columns]
         if missing_cols:
             self.logger.error(f"Faltan columnas esenciales para la validación en el DataFrame: {missing_cols}")
-            return pd.DataFrame(columns=data.columns), data
+            masks = np.ones(len(data), dtype=np.uint64)  # Bit 0: 'missing_columns'.
+            return pd.DataFrame(columns=data.columns), data.assign(**{REJECTION_MASK_COLUMN: masks})
 
-        invalid_mask = data[required_sanitized_cols].isnull().any(axis=1)
+        masks, skipped = rule_set.evaluate(data, seen_keys)
+        for rule in skipped:
+            self.logger.warning(f"Se omite la regla '{rule.reason}': sus columnas {list(rule.columns)} no existen en el DataFrame.")
+        invalid_mask = masks != 0
         valid_df = data[~invalid_mask]
-        invalid_df = data[invalid_mask]
+        invalid_df = data[invalid_mask].assign(**{REJECTION_MASK_COLUMN: masks[invalid_mask]})
 
         self.logger.info(f"Validación completada. Filas válidas: {len(valid_df)}. Filas inválidas: {len(invalid_df)}.")
-        return valid_df, invalid_df
\ No newline at end of file
+        return valid_df, invalid_df
@@ -4,17 +4,14 @@ import sys
 from pathlib import Path
 
 from src.logger_setup import setup_logging
-from src.config_loader import ConfigLoader
-from src.data_handler.loader import ExcelLoader
-from src.data_handler.filter import DataFilterer
-from src.data_handler.validator import DataValidator
-from src.core.orchestrator import Orchestrator
-from src.automation.strategies.remote.automator import RemoteAutomator
 
-def main():
-    setup_logging()
-    logger = logging.getLogger(__name__)
+# Las dependencias pesadas (pandas, openpyxl, pywinauto, pyperclip...) se importan
+# dentro de `main()`, después de interpretar los argumentos y solo si el modo de
+# ejecución las necesita. Así `--help`, `--validate-profile` y `--data-only` no
+# pagan el coste de la capa de automatización. `scripts/benchmark_startup.py`
+# vigila que esto no se degrade.
 
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Bot de Automatización de Facturación Médica.")
     parser.add_argument(
         "--profile",
@@ -25,20 +22,81 @@ def main():
     parser.add_argument(
         "--input-file",
         type=Path,
-        required=True,
-        help="Ruta al archivo Excel de entrada."
+        help="Ruta al archivo Excel de entrada (obligatorio salvo con --validate-profile)."
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Desactiva la caché de libros parseados en 'data/cache' y fuerza la relectura del Excel."
+    )
+    parser.add_argument(
+        "--validate-profile",
+        action="store_true",
+        help="Solo compila y valida el perfil; no lee datos ni automatiza."
+    )
+    parser.add_argument(
+        "--data-only",
+        action="store_true",
+        help="Ejecuta el pipeline de datos y los reportes sin la fase de automatización."
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Reparte las tareas entre las sesiones declaradas en [AutomationSessions] del perfil."
     )
+    parser.add_argument(
+        "--async-sessions",
+        action="store_true",
+        help="Coordina las sesiones de [AutomationSessions] (o la ventana del perfil) desde un único bucle de asyncio."
+    )
+    return parser
+
+def main():
+    parser = build_parser()
     args = parser.parse_args()
+    if args.input_file is None and not args.validate_profile:
+        parser.error("el argumento --input-file es obligatorio salvo con --validate-profile.")
+
+    setup_logging()
+    logger = logging.getLogger(__name__)
+
+    if args.validate_profile:
+        logger.info(f"Validando el perfil '{args.profile}'.")
+        from src.config_loader import ConfigLoader
+        try:
+            ConfigLoader().load_profile(args.profile)
+        except Exception as e:
+            logger.critical(f"El perfil '{args.profile}' no es válido: {e}")
+            sys.exit(1)
+        logger.info(f"El perfil '{args.profile}' es válido.")
+        return
 
     logger.info(f"Aplicación iniciada con perfil '{args.profile}' y archivo '{args.input_file}'.")
 
     try:
+        from src.config_loader import ConfigLoader
+        from src.core.orchestrator import Orchestrator
+        from src.data_handler.filter import DataFilterer
+        from src.data_handler.loader import ExcelLoader
+        from src.data_handler.validator import DataValidator
+
         config_loader = ConfigLoader()
-        excel_loader = ExcelLoader()
+        excel_loader = ExcelLoader(cache_dir=None if args.no_cache else Path("data/cache"))
         data_filterer = DataFilterer()
         data_validator = DataValidator()
-        automator = RemoteAutomator()
-        
+
+        automator = None
+        if args.async_sessions and not args.data_only:
+            from src.automation.common.async_adapter import SyncAutomatorAdapter
+            from src.automation.strategies.remote.async_automator import AsyncRemoteAutomator
+            automator = SyncAutomatorAdapter(AsyncRemoteAutomator())
+        elif args.parallel and not args.data_only:
+            from src.automation.strategies.remote.parallel_automator import ParallelAutomator
+            automator = ParallelAutomator()
+        elif not args.data_only:
+            from src.automation.strategies.remote.automator import RemoteAutomator
+            automator = RemoteAutomator()
+
         orchestrator = Orchestrator(
             config_loader=config_loader,
             data_loader=excel_loader,
@@ -59,4 +117,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
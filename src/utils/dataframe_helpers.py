@@ -1,4 +1,8 @@
 import re
+from typing import Optional
+
+import numpy as np
+import pandas as pd
 
 def sanitize_column_name(col_name: str) -> str:
     """
@@ -29,4 +33,55 @@ def sanitize_column_name(col_name: str) -> str:
     sanitized = re.sub(r'_+', '_', sanitized)
     
     # PASO 4: Eliminar guiones bajos del final
-    return sanitized.rstrip('_')
\ No newline at end of file
+    return sanitized.rstrip('_')
+
+def to_datetime_tolerant(series: pd.Series, date_format: Optional[str] = None) -> pd.Series:
+    """
+    Convierte una columna a fechas aplicando la misma regla a todas las celdas.
+
+    Con `date_format` (ej. '%d/%m/%Y') el parseo es vectorizado con ese formato y
+    solo las celdas que no lo cumplen se re-interpretan individualmente
+    (`format='mixed'`). Sin formato, cada celda se interpreta por separado. En
+    ambos casos el orden día/mes de las fechas ambiguas es fijo (el del formato
+    o, sin él, mes primero), así que el resultado de una celda no depende de las
+    demás filas ni del bloque en que llegue. Los valores que siguen sin poder
+    interpretarse quedan como NaT.
+    """
+    dayfirst = _is_dayfirst(date_format)
+    if date_format is None:
+        return pd.to_datetime(series, errors='coerce', format='mixed', dayfirst=dayfirst)
+
+    parsed = pd.to_datetime(series, errors='coerce', format=date_format)
+    retry_mask = parsed.isna() & series.notna()
+    if retry_mask.any():
+        parsed[retry_mask] = pd.to_datetime(series[retry_mask], errors='coerce', format='mixed', dayfirst=dayfirst)
+    return parsed
+
+
+def _is_dayfirst(date_format: Optional[str]) -> bool:
+    if date_format is None or '%d' not in date_format or '%m' not in date_format:
+        return False
+    return date_format.index('%d') < date_format.index('%m')
+
+
+def to_text(series: pd.Series) -> pd.Series:
+    """
+    Convierte una columna a texto conservando los nulos.
+
+    Los números enteros almacenados como float (ej. una cédula que Excel entrega
+    como 1234567.0) se escriben sin parte decimal. La conversión se hace una sola
+    vez por valor distinto de la columna, no una vez por celda.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    texts = np.array([_cell_to_text(value) for value in uniques], dtype=object)
+
+    result = np.full(len(series), None, dtype=object)
+    present = codes >= 0
+    result[present] = texts[codes[present]]
+    return pd.Series(result, index=series.index, name=series.name)
+
+
+def _cell_to_text(value) -> str:
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    return str(value)
@@ -0,0 +1,29 @@
+# tests/automation/common/test_input_policy.py
+
+from configparser import ConfigParser
+
+import pytest
+
+from src.automation.common.input_policy import compile_input_policy
+
+
+def _config(body: str) -> ConfigParser:
+    config = ConfigParser()
+    config.read_string(body)
+    return config
+
+
+def test_policy_applies_per_field_modes_and_length_threshold():
+    policy = compile_input_policy(_config(
+        "[AutomationInput]\npaste_min_length = 10\nnumero_historia = type\nestrato = paste\n"
+    ))
+
+    assert not policy.should_paste("numero_historia", "X" * 50)
+    assert policy.should_paste("estrato", "2")
+    assert policy.should_paste("medico_tratante", "X" * 10)
+    assert not policy.should_paste("medico_tratante", "X" * 9)
+
+
+def test_policy_rejects_unknown_modes():
+    with pytest.raises(ValueError):
+        compile_input_policy(_config("[AutomationInput]\nestrato = dictar\n"))
@@ -0,0 +1,36 @@
+# tests/automation/common/test_keyboard_map.py
+
+import pytest
+
+from src.automation.common.keyboard_map import KeyStroke, escape_text, parse_key_sequence
+
+
+def test_parses_named_keys_repetitions_and_modifiers():
+    assert parse_key_sequence('{ESC 2}^nA1') == [
+        KeyStroke('Escape'),
+        KeyStroke('Escape'),
+        KeyStroke('n', ('Control_L',)),
+        KeyStroke('A'),
+        KeyStroke('1'),
+    ]
+
+
+def test_parses_groups_literals_and_enter_shortcut():
+    assert parse_key_sequence('+(ab){+}~') == [
+        KeyStroke('a', ('Shift_L',)),
+        KeyStroke('b', ('Shift_L',)),
+        KeyStroke('+'),
+        KeyStroke('Return'),
+    ]
+
+
+@pytest.mark.parametrize("keys", ['{ENTER', '{NOEXISTE}', '(ab', 'a)'])
+def test_rejects_malformed_sequences(keys):
+    with pytest.raises(ValueError):
+        parse_key_sequence(keys)
+
+
+def test_escape_text_round_trips_special_characters():
+    text = "CAP (PRO) 50% +1"
+
+    assert "".join(stroke.key for stroke in parse_key_sequence(escape_text(text))) == text
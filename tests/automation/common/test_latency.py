@@ -0,0 +1,43 @@
+# tests/automation/common/test_latency.py
+
+import pytest
+
+from src.automation.common.latency import LatencyModel
+
+
+def test_timeout_uses_profile_bound_until_enough_samples():
+    model = LatencyModel(min_samples=3)
+    model.record("patient_load", 0.2)
+    model.record("patient_load", 0.2)
+
+    assert model.timeout_for("patient_load", 3.0) == 3.0
+    assert model.first_poll_delay("patient_load") == 0.0
+
+
+def test_timeout_follows_observed_percentile_bounded_by_profile():
+    model = LatencyModel(min_samples=3, percentile=0.95, margin=2.0)
+    for seconds in (0.1, 0.2, 0.3, 0.4):
+        model.record("patient_load", seconds)
+
+    assert model.timeout_for("patient_load", 3.0) == pytest.approx(0.8)
+    assert model.timeout_for("patient_load", 0.5) == 0.5
+    assert 0 < model.first_poll_delay("patient_load") < 0.4
+
+
+def test_model_round_trips_through_disk(tmp_path):
+    path = tmp_path / "latency" / "perfil.json"
+    model = LatencyModel(min_samples=1)
+    model.record("new_billing", 0.7)
+    model.save(path)
+
+    restored = LatencyModel.load(path, min_samples=1)
+    assert restored.sample_count("new_billing") == 1
+    assert restored.mean("new_billing") == pytest.approx(0.7)
+    assert not restored.dirty
+
+
+def test_corrupt_model_is_discarded(tmp_path):
+    path = tmp_path / "perfil.json"
+    path.write_text("{no es json", encoding="utf-8")
+
+    assert LatencyModel.load(path).sample_count("new_billing") == 0
@@ -0,0 +1,52 @@
+import copy
+
+import pytest
+
+from src.automation.common.mission import DEFAULT_MISSION_MANIFEST, MissionOps, compile_mission
+from src.automation.common.states import TaskState
+from src.core.exceptions import ClipboardError, PatientIDMismatchError
+
+
+def _manifest(**changes):
+    manifest = copy.deepcopy(DEFAULT_MISSION_MANIFEST)
+    manifest.update(changes)
+    return manifest
+
+
+def test_compile_mission_builds_flow_and_error_classes():
+    manifest = _manifest()
+    manifest['states'][2]['next'] = 'NAVIGATING_TO_INGRESO'
+    manifest['states'].append({
+        'name': 'NAVIGATING_TO_INGRESO',
+        'steps': [{'keys': '%i'}, {'enter': 'fecha_ingreso', 'date_format': '%Y-%m-%d'}, {'pause_ms': 200}],
+        'next': 'TASK_SUCCESSFUL',
+    })
+
+    mission = compile_mission(manifest)
+
+    assert mission.initial == TaskState.ENSURING_INITIAL_STATE
+    assert mission.states[TaskState.FINDING_PATIENT].verifies
+    assert not mission.states[TaskState.ENSURING_INITIAL_STATE].verifies
+    ingreso = mission.states[TaskState.NAVIGATING_TO_INGRESO]
+    assert [step.op for step in ingreso.steps] == [MissionOps.KEYS, MissionOps.ENTER, MissionOps.PAUSE]
+    assert ingreso.steps[2].seconds == 0.2
+    assert ClipboardError in mission.retryable and PatientIDMismatchError in mission.fatal
+
+
+@pytest.mark.parametrize("mutate", [
+    lambda m: m['states'][0].update(name='NO_EXISTE'),
+    lambda m: m['states'][0].update(steps=[{'call': 'borrar_todo'}]),
+    lambda m: m['states'][0].update(steps=[{'keys': '{ESC'}]),
+    lambda m: m['states'][0].update(steps=[{'keys': '^n', 'call': 'find_patient'}]),
+    lambda m: m['states'][0].update(steps=[{'wait': 'main_window'}]),
+    lambda m: m['states'][0].update(steps=[{'wait': 'main_window', 'timeout_ms': 500, 'latency': 'patient_load'}]),
+    lambda m: m['states'][2].update(next='FINDING_PATIENT'),
+    lambda m: m['states'][1].update(next='TASK_SUCCESSFUL'),
+    lambda m: m['errors'].update(retry=['ValueError']),
+    lambda m: m['errors'].update(retry=['ClipboardError'], fail=['ClipboardError']),
+])
+def test_compile_mission_rejects_invalid_manifests(mutate):
+    manifest = _manifest()
+    mutate(manifest)
+    with pytest.raises(ValueError):
+        compile_mission(manifest)
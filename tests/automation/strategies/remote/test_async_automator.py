@@ -0,0 +1,154 @@
+import asyncio
+import threading
+from datetime import date
+
+import pytest
+
+from src.automation.common.async_adapter import SyncAutomatorAdapter
+from src.automation.common.mission import MissionOps, MissionStep, compile_mission
+from src.automation.common.results import TaskResultStatus
+from src.automation.strategies.remote.async_automator import AsyncRemoteAutomator
+from src.automation.strategies.remote.async_remote_control import AsyncRemoteControlFacade
+from src.automation.strategies.remote.handlers.async_main_window_handler import AsyncMainWindowHandler
+from src.core.exceptions import PatientIDMismatchError, ReadinessTimeoutError
+from src.core.models import FacturacionData
+from src.core.profile import AutomationSpec, ProfileSpec, SessionSpec
+
+MISSION = compile_mission({
+    "states": [
+        {"name": "ENSURING_INITIAL_STATE", "steps": [{"keys": "{ESC}"}, {"pause_ms": 20}], "next": "TASK_SUCCESSFUL"},
+    ],
+})
+
+
+class FakeAsyncFacade:
+    """Fachada asíncrona simulada: registra teclas y pausas; una sesión puede colgarse."""
+
+    in_flight = 0
+    max_in_flight = 0
+
+    def __init__(self, hang_display=None):
+        self.hang_display = hang_display
+        self.display_name = None
+        self.latency_model = None
+        self.action_costs = {}
+        self.window_title = None
+        self.keys = []
+        self.threads = set()
+        self.closed = False
+
+    async def find_and_focus_window(self, title):
+        self.window_title = title
+
+    def type_keys(self, keys, pause=None):
+        self.keys.append(keys)
+        self.threads.add(threading.get_ident())
+
+    async def wait(self, seconds):
+        if self.display_name == self.hang_display:
+            await asyncio.sleep(5)
+        FakeAsyncFacade.in_flight += 1
+        FakeAsyncFacade.max_in_flight = max(FakeAsyncFacade.max_in_flight, FakeAsyncFacade.in_flight)
+        await asyncio.sleep(seconds)
+        FakeAsyncFacade.in_flight -= 1
+
+    async def flush(self):
+        pass
+
+    def discard_pending_keys(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def _task(numero_historia):
+    return FacturacionData(
+        numero_historia=numero_historia, identificacion="CC-1", diagnostico_principal="A00",
+        fecha_ingreso=date(2024, 1, 1), medico_tratante="Dr. X", empresa_aseguradora="EPS",
+        contrato_empresa="C1", estrato="1", diagnostico_adicional_1=None,
+        diagnostico_adicional_2=None, diagnostico_adicional_3=None,
+    )
+
+
+@pytest.fixture
+def build():
+    def _build(hang_display=None, timeout=120.0):
+        FakeAsyncFacade.in_flight = FakeAsyncFacade.max_in_flight = 0
+        profile = ProfileSpec(
+            name="demo", data_source=None, column_mapping={}, columns={}, load_schema=None,
+            filter_plan=None, validation_rules=None,
+            automation=AutomationSpec(
+                sessions=(SessionSpec("a", "Ventana A", ":2"), SessionSpec("b", "Ventana B", ":3")),
+                session_task_timeout=timeout, adaptive_timeouts=False, calibrate_session=False, mission=MISSION,
+            ),
+        )
+        inner = AsyncRemoteAutomator(latency_dir=None, facade_factory=lambda: FakeAsyncFacade(hang_display))
+        adapter = SyncAutomatorAdapter(inner)
+        adapter.initialize(profile)
+        return adapter, inner
+    return _build
+
+
+def test_sessions_run_concurrently_in_a_single_thread(build):
+    adapter, inner = build()
+    facades = [session.facade for session in inner.sessions]
+    tasks = [_task(f"HC-{i}") for i in range(6)]
+
+    results = adapter.process_billing_tasks(tasks)
+    adapter.shutdown()
+
+    assert [r.task_identifier for r in results] == [t.numero_historia for t in tasks]
+    assert all(r.status == TaskResultStatus.SUCCESS for r in results)
+    assert [f.window_title for f in facades] == ["Ventana A", "Ventana B"]
+    assert sum(len(f.keys) for f in facades) == 6 and all(f.keys for f in facades)
+    assert FakeAsyncFacade.max_in_flight == 2
+    assert facades[0].threads | facades[1].threads == {threading.get_ident()}
+    assert all(f.closed for f in facades)
+
+
+def test_stuck_session_is_cancelled_without_blocking_the_others(build):
+    adapter, inner = build(hang_display=":2", timeout=0.2)
+    tasks = [_task(f"HC-{i}") for i in range(4)]
+
+    results = adapter.process_billing_tasks(tasks)
+    adapter.shutdown()
+
+    failed = [r for r in results if r.status != TaskResultStatus.SUCCESS]
+    assert len(failed) == 1 and "no respondió" in failed[0].message
+    assert sum(r.status == TaskResultStatus.SUCCESS for r in results) == 3
+
+
+def test_async_facade_wait_until_awaits_coroutine_probes():
+    facade = AsyncRemoteControlFacade()
+    facade.poll_interval = 0.001
+    answers = iter([None, False, "listo"])
+
+    async def probe():
+        return next(answers)
+
+    async def never():
+        return None
+
+    assert asyncio.run(facade.wait_until(probe, timeout=1)) == "listo"
+    with pytest.raises(ReadinessTimeoutError):
+        asyncio.run(facade.wait_until(never, timeout=0.02))
+
+
+def test_async_handler_shares_mission_binding_and_verdict():
+    facade = AsyncRemoteControlFacade()
+    facade.poll_interval = 0.001
+    typed = []
+    facade.type_keys = lambda keys, pause=None: typed.append(keys)
+
+    async def read_clipboard_with_sentinel(timeout):
+        return "999"
+    facade.read_clipboard_with_sentinel = read_clipboard_with_sentinel
+    handler = AsyncMainWindowHandler(facade, AutomationSpec(window_title="SAF", patient_load_wait=0.02))
+    enter = handler.bind_step(MissionStep(op=MissionOps.ENTER, target="estrato"))
+    verify = handler.bind_step(MissionStep(op=MissionOps.VERIFY))
+
+    asyncio.run(enter(_task("HC-1")))
+    assert typed == ["1"]
+    with pytest.raises(PatientIDMismatchError):
+        asyncio.run(verify(_task("HC-1")))
@@ -7,18 +7,18 @@ from datetime import date
 
 # Importaciones de nuestro código fuente
 from src.automation.strategies.remote.automator import RemoteAutomator
+from src.automation.strategies.remote.handlers.main_window_handler import MainWindowHandler
 from src.automation.common.results import TaskResult, TaskResultStatus
 from src.automation.common.states import TaskState
 from src.core.models import FacturacionData
+from src.core.profile import AutomationSpec
 
-# Este fixture simula un objeto ConfigParser para no depender de archivos .ini reales.
+# Este fixture simula un perfil compilado para no depender de archivos .ini reales.
 @pytest.fixture
 def mock_config(mocker):
-    """Crea un mock de ConfigParser con los valores necesarios para inicializar el automator."""
+    """Crea un mock de ProfileSpec con los valores necesarios para inicializar el automator."""
     config = mocker.MagicMock()
-    # Simulamos la llamada a config.get(...) y config.getint(...)
-    config.get.return_value = "Mocked Window Title"
-    config.getint.return_value = 2  # max_retries
+    config.automation = AutomationSpec(window_title="Mocked Window Title", max_retries=2, calibrate_session=False)
     return config
 
 # Este fixture crea el "doble de prueba" para la fachada de control remoto.
@@ -30,8 +30,17 @@ def mock_facade(mocker):
 # Este fixture crea el "doble de prueba" para el manejador de la ventana principal.
 @pytest.fixture
 def mock_handler(mocker):
-    """Crea un mock para MainWindowHandler."""
-    return mocker.MagicMock()
+    """
+    Crea un mock para MainWindowHandler. `bind_step` y los pasos de la misión
+    conservan su implementación real para que la tabla de transiciones llame a
+    los métodos mockeados.
+    """
+    handler = mocker.MagicMock()
+    handler.bind_step.side_effect = lambda step: MainWindowHandler.bind_step(handler, step)
+    handler._type_keys.side_effect = lambda keys: MainWindowHandler._type_keys(handler, keys)
+    handler._enter_field.side_effect = lambda *args: MainWindowHandler._enter_field(handler, *args)
+    handler._pause.side_effect = lambda seconds: MainWindowHandler._pause(handler, seconds)
+    return handler
 
 # Este es el fixture más importante. Prepara nuestro "System Under Test" (SUT),
 # el RemoteAutomator, inyectándole todos los mocks para aislarlo.
@@ -154,4 +163,89 @@ def test_screenshot_failure_is_handled_gracefully(automator_sut, mock_facade, mo
     task_result = results[0]
     assert task_result.status == TaskResultStatus.FAILED_UNEXPECTED_ERROR
     assert original_error_msg in task_result.message
-    assert screenshot_error_msg not in task_result.message # No debe estar contaminado.
\ No newline at end of file
+    assert screenshot_error_msg not in task_result.message # No debe estar contaminado.
+
+def test_optimistic_task_rewinds_and_replays_conservatively(automator_sut, mock_handler, sample_task):
+    """
+    ESCENARIO 3: Vía rápida fallida.
+    Si la verificación del paciente falla en modo optimista, la tarea se repite
+    desde el inicio con tiempos completos y sin consumir reintentos.
+    """
+    from src.core.exceptions import PatientIDMismatchError
+
+    automator_sut.optimistic_enabled = True
+    modes = []
+    def find_patient(task):
+        modes.append(mock_handler.optimistic)
+        if len(modes) == 1:
+            raise PatientIDMismatchError("CC-98765", "CC-9876")
+    mock_handler.find_patient.side_effect = find_patient
+
+    results = automator_sut.process_billing_tasks([sample_task])
+
+    assert results[0].status == TaskResultStatus.SUCCESS
+    assert modes == [True, False]
+    assert mock_handler.ensure_initial_state.call_count == 2
+    assert automator_sut.optimistic_stats == {'fast': 0, 'fallback': 1}
+
+
+def test_mission_manifest_drives_the_task_flow(mocker, mock_config, mock_facade, mock_handler, sample_task):
+    """
+    ESCENARIO 4: Misión declarativa.
+    Un estado añadido en el manifiesto se ejecuta sin tocar el automator.
+    """
+    from dataclasses import replace
+    from src.automation.common.mission import DEFAULT_MISSION_MANIFEST, compile_mission
+
+    manifest = {**DEFAULT_MISSION_MANIFEST, 'states': [dict(s) for s in DEFAULT_MISSION_MANIFEST['states']]}
+    manifest['states'][2]['next'] = 'NAVIGATING_TO_INGRESO'
+    manifest['states'].append(
+        {'name': 'NAVIGATING_TO_INGRESO', 'steps': [{'keys': '%i'}, {'enter': 'estrato'}], 'next': 'TASK_SUCCESSFUL'}
+    )
+    mock_config.automation = replace(mock_config.automation, mission=compile_mission(manifest))
+    mocker.patch('src.automation.strategies.remote.automator.RemoteControlFacade', return_value=mock_facade)
+    mocker.patch('src.automation.strategies.remote.automator.MainWindowHandler', return_value=mock_handler)
+    sut = RemoteAutomator(latency_dir=None)
+    sut.initialize(mock_config)
+
+    results = sut.process_billing_tasks([sample_task])
+
+    assert results[0].status == TaskResultStatus.SUCCESS
+    mock_handler.initiate_new_billing.assert_called_once()
+    mock_handler.remote_control.type_keys.assert_any_call('%i')
+    mock_handler._enter_value.assert_called_once_with('estrato', '2')
+
+
+def test_pending_keys_are_flushed_on_success_and_discarded_on_failure(automator_sut, mock_facade, mock_handler, sample_task):
+    """
+    ESCENARIO 5: Búfer de teclas.
+    Las teclas del último estado se envían antes de dar la tarea por completada;
+    las de una tarea fallida se descartan y no llegan a la siguiente.
+    """
+    results = automator_sut.process_billing_tasks([sample_task])
+
+    assert results[0].status == TaskResultStatus.SUCCESS
+    mock_facade.flush.assert_called_once()
+    mock_facade.discard_pending_keys.assert_not_called()
+
+    mock_handler.initiate_new_billing.side_effect = ValueError("fallo")
+    automator_sut.process_billing_tasks([sample_task])
+
+    mock_facade.discard_pending_keys.assert_called_once()
+    assert mock_facade.flush.call_count == 1
+
+    automator_sut.shutdown()
+    assert mock_facade.flush.call_count == 2
+
+
+def test_session_is_not_calibrated_unless_the_profile_asks(mocker, mock_config, mock_facade, mock_handler):
+    """La calibración escribe en el campo con el foco: por defecto no se ejecuta."""
+    mock_config.automation = AutomationSpec(window_title="Mocked Window Title")
+    mocker.patch('src.automation.strategies.remote.automator.RemoteControlFacade', return_value=mock_facade)
+    mocker.patch('src.automation.strategies.remote.automator.MainWindowHandler', return_value=mock_handler)
+    calibrate = mocker.patch('src.automation.strategies.remote.automator.calibrate')
+
+    RemoteAutomator(latency_dir=None).initialize(mock_config)
+
+    calibrate.assert_not_called()
+    mock_facade.type_keys.assert_not_called()
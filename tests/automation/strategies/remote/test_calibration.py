@@ -0,0 +1,41 @@
+# tests/automation/strategies/remote/test_calibration.py
+
+import pytest
+
+from src.automation.common.latency import LatencyModel
+from src.automation.strategies.remote.calibration import calibrate
+from src.core.exceptions import ClipboardError
+
+
+@pytest.fixture
+def facade(mocker):
+    facade = mocker.MagicMock()
+    facade.latency_model = LatencyModel()
+    return facade
+
+
+def test_calibration_picks_shortest_pause_without_dropped_chars(facade):
+    typed = []
+
+    def type_keys(keys, pause=None):
+        if keys.isdigit():
+            # Con pausa cero el enlace pierde dos caracteres.
+            typed.append(keys[2:] if pause == 0.0 else keys)
+
+    facade.type_keys.side_effect = type_keys
+    facade.read_clipboard_with_sentinel.side_effect = lambda timeout: typed[-1]
+
+    profile = calibrate(facade, max_key_pause=0.05, clipboard_timeout=1.0)
+
+    assert profile.key_pause == 0.01
+    assert profile.dropped_chars[0.0] == 4
+    assert facade.key_pause == 0.01
+    assert facade.latency_model.floor >= profile.wait_floor
+
+
+def test_calibration_failure_keeps_profile_values(facade):
+    facade.key_pause = 0.05
+    facade.read_clipboard_with_sentinel.side_effect = ClipboardError("sin respuesta")
+
+    assert calibrate(facade, max_key_pause=0.05, clipboard_timeout=1.0) is None
+    assert facade.key_pause == 0.05
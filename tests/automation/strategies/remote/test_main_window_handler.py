@@ -0,0 +1,157 @@
+# tests/automation/strategies/remote/test_main_window_handler.py
+
+from configparser import ConfigParser
+from datetime import date
+from types import MappingProxyType
+
+import pytest
+
+from src.automation.common.input_policy import InputPolicy
+from src.automation.common.latency import LatencyModel
+from src.automation.common.readback import compile_readback
+
+from src.automation.strategies.remote.handlers.main_window_handler import MainWindowHandler
+from src.automation.strategies.remote.remote_control import RemoteControlFacade
+from src.core.constants import LatencyActions
+from src.core.exceptions import ClipboardError, PatientDataMismatchError, PatientIDMismatchError, ReadinessTimeoutError
+from src.core.models import FacturacionData
+from src.core.profile import AutomationSpec
+
+
+def _poll_once(condition, timeout, description="", **kwargs):
+    """Simula `wait_until` evaluando la sonda una sola vez."""
+    try:
+        result = condition()
+    except ClipboardError as e:
+        raise ReadinessTimeoutError(description, timeout, e) from e
+    if not result:
+        raise ReadinessTimeoutError(description, timeout)
+    return result
+
+
+@pytest.fixture
+def facade(mocker):
+    facade = mocker.MagicMock()
+    facade.wait_until.side_effect = _poll_once
+    return facade
+
+
+@pytest.fixture
+def handler(facade):
+    return MainWindowHandler(remote_control=facade, settings=AutomationSpec(window_title="SAF"))
+
+
+@pytest.fixture
+def task():
+    return FacturacionData(
+        numero_historia="HC1",
+        identificacion="123",
+        diagnostico_principal="A001",
+        fecha_ingreso=date(2024, 1, 1),
+        medico_tratante="Dr. Mock",
+        empresa_aseguradora="Test Aseguradora",
+        contrato_empresa="Contrato 1",
+        estrato="2",
+        diagnostico_adicional_1=None,
+        diagnostico_adicional_2=None,
+        diagnostico_adicional_3=None,
+    )
+
+
+def test_validate_patient_loaded_polls_the_id_field(handler, facade, task):
+    facade.read_clipboard_with_sentinel.return_value = " 123 "
+
+    handler.validate_patient_loaded(task)
+
+    facade.type_keys.assert_called_once_with("{TAB}")
+    facade.wait.assert_not_called()
+
+
+def test_validate_patient_loaded_reports_mismatch_with_last_value(handler, facade, task):
+    facade.read_clipboard_with_sentinel.return_value = "999"
+
+    with pytest.raises(PatientIDMismatchError) as exc_info:
+        handler.validate_patient_loaded(task)
+
+    assert exc_info.value.payload["found_id"] == "999"
+
+
+def test_validate_patient_loaded_is_retryable_when_field_is_unreadable(handler, facade, task):
+    facade.read_clipboard_with_sentinel.side_effect = ClipboardError("sin copia")
+
+    with pytest.raises(ReadinessTimeoutError):
+        handler.validate_patient_loaded(task)
+
+
+@pytest.fixture
+def readback_handler(facade):
+    config = ConfigParser()
+    config.read_string(
+        "[AutomationReadback]\n"
+        "sequence = {TAB}^a\n"
+        "delimiter = |\n"
+        "fields = identificacion, _, empresa_aseguradora, fecha_ingreso\n"
+    )
+    settings = AutomationSpec(window_title="SAF", readback=compile_readback(config))
+    return MainWindowHandler(remote_control=facade, settings=settings)
+
+
+def test_readback_verifies_all_fields_in_one_copy(readback_handler, facade, task):
+    facade.read_clipboard_with_sentinel.return_value = "123|HC1|test  ASEGURADORA|01/01/2024"
+
+    readback_handler.validate_patient_loaded(task)
+
+    facade.type_keys.assert_called_once_with("{TAB}^a")
+    facade.read_clipboard_with_sentinel.assert_called_once()
+
+
+def test_readback_reports_non_id_mismatches(readback_handler, facade, task):
+    facade.read_clipboard_with_sentinel.return_value = "123|HC1|Otra Aseguradora|01/01/2024"
+
+    with pytest.raises(PatientDataMismatchError) as exc_info:
+        readback_handler.validate_patient_loaded(task)
+
+    assert exc_info.value.payload == {
+        "empresa_aseguradora": {"expected": "Test Aseguradora", "found": "Otra Aseguradora"}
+    }
+
+
+def test_find_patient_pastes_long_values_and_types_short_ones(facade, task):
+    policy = InputPolicy(paste_min_length=5, modes=MappingProxyType({}))
+    handler = MainWindowHandler(remote_control=facade, settings=AutomationSpec(window_title="SAF", input_policy=policy))
+    facade.read_clipboard_with_sentinel.return_value = "123"
+
+    handler._enter_value("numero_historia", "HC1")
+    handler._enter_value("medico_tratante", "DR. NOMBRE MUY LARGO")
+
+    facade.type_keys.assert_called_once_with("HC1")
+    facade.paste_text.assert_called_once_with("DR. NOMBRE MUY LARGO", timeout=1.0)
+
+
+def test_slow_load_within_profile_bound_is_not_a_mismatch(task, mocker):
+    """El modelo aprendió cargas de 0.2 s; una de 0.6 s sigue dentro de `patient_load_wait` (3 s)."""
+    clock = [0.0]
+    module = 'src.automation.strategies.remote.remote_control.time'
+    mocker.patch(f'{module}.monotonic', side_effect=lambda: clock[0])
+    mocker.patch(f'{module}.sleep', side_effect=lambda seconds: clock.__setitem__(0, clock[0] + seconds))
+    facade = RemoteControlFacade()
+    facade.latency_model = LatencyModel()
+    for _ in range(12):
+        facade.latency_model.record(LatencyActions.PATIENT_LOAD, 0.2)
+    mocker.patch.object(facade, 'flush')
+    mocker.patch.object(
+        facade, 'read_clipboard_with_sentinel', side_effect=lambda timeout: "123" if clock[0] >= 0.6 else "000"
+    )
+    handler = MainWindowHandler(remote_control=facade, settings=AutomationSpec(window_title="SAF", patient_load_wait=3.0))
+
+    handler.validate_patient_loaded(task)
+
+    assert 0.6 <= clock[0] < 3.0
+
+
+def test_new_billing_waits_the_profile_delay_as_a_floor(handler, facade):
+    handler.initiate_new_billing()
+
+    facade.type_keys.assert_called_once_with("^n")
+    facade.wait.assert_called_once_with(1.5)
+    facade.wait_until.assert_not_called()
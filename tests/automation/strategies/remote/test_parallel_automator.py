@@ -0,0 +1,101 @@
+import threading
+from datetime import date
+
+import pytest
+
+from src.automation.common.results import TaskResult, TaskResultStatus
+from src.automation.strategies.remote.parallel_automator import ParallelAutomator
+from src.core.models import FacturacionData
+from src.core.profile import AutomationSpec, ProfileSpec, SessionSpec
+
+
+class FakeSessionAutomator:
+    """Sesión simulada: registra sus tareas y puede bloquearse o fallar."""
+
+    def __init__(self, latency_dir, session_name, display_name, behaviour):
+        self.session_name = session_name
+        self.display_name = display_name
+        self.behaviour = behaviour
+        self.window_title = None
+        self.processed = []
+        self.shut_down = False
+
+    def initialize(self, profile):
+        self.window_title = profile.automation.window_title
+
+    def process_billing_tasks(self, tasks):
+        action = self.behaviour.get(self.session_name)
+        if action == "hang":
+            threading.Event().wait(5)
+        if action == "crash":
+            raise RuntimeError("sesión rota")
+        self.processed.extend(task.numero_historia for task in tasks)
+        return [TaskResult(status=TaskResultStatus.SUCCESS, task_identifier=task.numero_historia) for task in tasks]
+
+    def shutdown(self):
+        self.shut_down = True
+
+
+def _task(numero_historia):
+    return FacturacionData(
+        numero_historia=numero_historia, identificacion="CC-1", diagnostico_principal="A00",
+        fecha_ingreso=date(2024, 1, 1), medico_tratante="Dr. X", empresa_aseguradora="EPS",
+        contrato_empresa="C1", estrato="1", diagnostico_adicional_1=None,
+        diagnostico_adicional_2=None, diagnostico_adicional_3=None,
+    )
+
+
+@pytest.fixture
+def build():
+    def _build(behaviour=None, timeout=120.0):
+        sessions = (
+            SessionSpec("a", "Ventana A", ":2"),
+            SessionSpec("b", "Ventana B", ":3"),
+        )
+        profile = ProfileSpec(
+            name="demo", data_source=None, column_mapping={}, columns={}, load_schema=None,
+            filter_plan=None, validation_rules=None,
+            automation=AutomationSpec(sessions=sessions, session_task_timeout=timeout),
+        )
+        automator = ParallelAutomator(
+            latency_dir=None,
+            automator_factory=lambda **kw: FakeSessionAutomator(behaviour=behaviour or {}, **kw),
+        )
+        automator.initialize(profile)
+        return automator
+    return _build
+
+
+def test_results_keep_input_order_across_sessions(build):
+    automator = build()
+    tasks = [_task(f"HC-{i}") for i in range(20)]
+
+    results = automator.process_billing_tasks(tasks)
+
+    assert [r.task_identifier for r in results] == [t.numero_historia for t in tasks]
+    assert all(r.status == TaskResultStatus.SUCCESS for r in results)
+    fakes = {s.spec.name: s.automator for s in automator.sessions}
+    assert fakes["a"].window_title == "Ventana A" and fakes["b"].display_name == ":3"
+    assert len(fakes["a"].processed) + len(fakes["b"].processed) == 20
+
+
+def test_stuck_session_is_abandoned_without_blocking_the_others(build):
+    automator = build(behaviour={"a": "hang"}, timeout=0.2)
+    tasks = [_task(f"HC-{i}") for i in range(5)]
+
+    results = automator.process_billing_tasks(tasks)
+
+    failed = [r for r in results if r.status != TaskResultStatus.SUCCESS]
+    assert len(failed) == 1 and "no respondió" in failed[0].message
+    assert len(automator.sessions[1].automator.processed) == 4
+
+
+def test_crashed_session_returns_its_task_to_the_queue(build):
+    automator = build(behaviour={"a": "crash"})
+    tasks = [_task(f"HC-{i}") for i in range(5)]
+
+    results = automator.process_billing_tasks(tasks)
+
+    assert all(r.status == TaskResultStatus.SUCCESS for r in results)
+    assert sorted(automator.sessions[1].automator.processed) == sorted(t.numero_historia for t in tasks)
+    automator.shutdown()
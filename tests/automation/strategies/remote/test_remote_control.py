@@ -0,0 +1,167 @@
+# tests/automation/strategies/remote/test_remote_control.py
+
+import pytest
+
+from src.automation.common.latency import LatencyModel
+from src.automation.strategies.remote.remote_control import RemoteControlFacade
+from src.core.exceptions import ClipboardError, FocusError, PatientIDMismatchError, ReadinessTimeoutError
+
+
+@pytest.fixture
+def facade(mocker):
+    """Fachada real con `time.sleep` interceptado para que las pruebas no esperen."""
+    mocker.patch('src.automation.strategies.remote.remote_control.time.sleep')
+    return RemoteControlFacade()
+
+
+def test_wait_until_returns_as_soon_as_condition_holds(facade):
+    results = iter([None, False, "listo"])
+
+    assert facade.wait_until(lambda: next(results), timeout=5) == "listo"
+
+
+def test_wait_until_swallows_retryable_errors_until_timeout(facade, mocker):
+    clock = iter(range(100))
+    mocker.patch('src.automation.strategies.remote.remote_control.time.monotonic', side_effect=lambda: next(clock))
+
+    def probe():
+        raise ClipboardError("portapapeles ocupado")
+
+    with pytest.raises(ReadinessTimeoutError) as exc_info:
+        facade.wait_until(probe, timeout=3, description="copia")
+
+    assert exc_info.value.is_retryable
+    assert isinstance(exc_info.value.__cause__, ClipboardError)
+
+
+def test_wait_until_propagates_non_retryable_errors(facade):
+    def probe():
+        raise PatientIDMismatchError("1", "2")
+
+    with pytest.raises(PatientIDMismatchError):
+        facade.wait_until(probe, timeout=5)
+
+
+def test_wait_until_backs_off_between_polls(facade, mocker):
+    sleep = mocker.patch('src.automation.strategies.remote.remote_control.time.sleep')
+    results = iter([None, None, None, True])
+
+    facade.wait_until(lambda: next(results), timeout=60, poll_interval=0.1, backoff=2, max_interval=0.3)
+
+    assert [c.args[0] for c in sleep.call_args_list] == pytest.approx([0.1, 0.2, 0.3])
+
+
+def test_wait_until_records_latency_and_applies_learned_timeout(facade, mocker):
+    model = LatencyModel(min_samples=1, margin=1.0)
+    model.record("new_billing", 0.5)
+    facade.latency_model = model
+    clock = iter(range(100))
+    mocker.patch('src.automation.strategies.remote.remote_control.time.monotonic', side_effect=lambda: next(clock))
+
+    with pytest.raises(ReadinessTimeoutError):
+        facade.wait_until(lambda: None, timeout=30, action="new_billing")
+
+    # El tiempo límite aprendido (0.5 s) vence en el primer sondeo; se registra el máximo del perfil.
+    assert model.sample_count("new_billing") == 2
+    assert model.timeout_for("new_billing", 30) == 30
+
+
+def test_type_keys_are_coalesced_until_a_sync_point(facade, mocker):
+    send_keys = mocker.patch('src.automation.strategies.remote.remote_control._send_keys')
+    ensure_focus = mocker.patch.object(facade, '_ensure_focus')
+
+    facade.type_keys('HC123')
+    facade.type_keys('{ENTER}')
+    facade.type_keys('0123', pause=0.0)
+    send_keys.assert_not_called()
+
+    facade.wait(0.1)
+
+    ensure_focus.assert_called_once()
+    assert [c.args[0] for c in send_keys.call_args_list] == ['HC123{ENTER}', '0123']
+    facade.flush()
+    assert send_keys.call_count == 2
+
+
+def test_linux_backend_falls_back_to_xdotool(facade, mocker):
+    mocker.patch('src.automation.strategies.remote.remote_control.XlibBackend.create', return_value=None)
+
+    assert facade._linux_backend().name == "xdotool"
+
+    facade.backend = None
+    facade.linux_backend = "xlib"
+    with pytest.raises(FocusError):
+        facade._linux_backend()
+
+
+def test_native_clipboard_read_waits_for_owner_change(facade, mocker):
+    mocker.patch.object(facade, '_ensure_focus')
+    send_keys = mocker.patch('src.automation.strategies.remote.remote_control._send_keys')
+    clipboard = mocker.MagicMock(owner_changes=3)
+    clipboard.wait_for_owner_change.return_value = True
+    clipboard.read.return_value = "CC-98765"
+    facade.native_clipboard = clipboard
+    facade._native_clipboard_checked = True
+
+    assert facade.read_clipboard_with_sentinel(timeout=1.0) == "CC-98765"
+    send_keys.assert_called_once_with('^c', pause=facade.key_pause)
+    assert clipboard.wait_for_owner_change.call_args.args[0] == 3
+
+    clipboard.wait_for_owner_change.return_value = False
+    with pytest.raises(ClipboardError):
+        facade.read_clipboard_with_sentinel(timeout=1.0)
+
+
+def test_paste_text_publishes_value_before_sending_ctrl_v(facade, mocker):
+    mocker.patch.object(facade, '_ensure_focus')
+    calls = []
+    mocker.patch(
+        'src.automation.strategies.remote.remote_control._send_keys',
+        side_effect=lambda keys, pause: calls.append(('keys', keys)),
+    )
+    clipboard = mocker.MagicMock()
+    clipboard.write.side_effect = lambda text: calls.append(('write', text))
+    facade.native_clipboard = clipboard
+    facade._native_clipboard_checked = True
+
+    facade.type_keys('{TAB}')
+    facade.paste_text("CAP PRO UNIPA BARBACOAS ACDO-VOLUNTADES")
+
+    assert calls == [
+        ('keys', '{TAB}'),
+        ('write', "CAP PRO UNIPA BARBACOAS ACDO-VOLUNTADES"),
+        ('keys', '^v'),
+    ]
+
+
+def test_native_clipboard_latency_excludes_pending_keys(facade, mocker):
+    clock = [0.0]
+    mocker.patch('src.automation.strategies.remote.remote_control.time.monotonic', side_effect=lambda: clock[0])
+    mocker.patch.object(facade, '_ensure_focus')
+    # Escribir el texto pendiente tarda 2 s; la copia, 0.1 s.
+    mocker.patch(
+        'src.automation.strategies.remote.remote_control._send_keys',
+        side_effect=lambda keys, pause: clock.__setitem__(0, clock[0] + (0.1 if keys == '^c' else 2.0)),
+    )
+    clipboard = mocker.MagicMock(owner_changes=0)
+    clipboard.wait_for_owner_change.return_value = True
+    clipboard.read.return_value = "CC-98765"
+    facade.native_clipboard = clipboard
+    facade._native_clipboard_checked = True
+    facade.latency_model = LatencyModel(min_samples=1)
+
+    facade.type_keys('HC123', pause=0.0)
+    facade.read_clipboard_with_sentinel(timeout=1.0)
+
+    assert facade.latency_model.mean("clipboard_copy") == pytest.approx(0.1)
+
+
+def test_discard_pending_keys_drops_the_buffer(facade, mocker):
+    send_keys = mocker.patch('src.automation.strategies.remote.remote_control._send_keys')
+    mocker.patch.object(facade, '_ensure_focus')
+    facade.type_keys('HC123')
+
+    facade.discard_pending_keys()
+    facade.flush()
+
+    send_keys.assert_not_called()
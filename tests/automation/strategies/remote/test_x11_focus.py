@@ -0,0 +1,37 @@
+# tests/automation/strategies/remote/test_x11_focus.py
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("Xlib")
+from Xlib import X
+
+from src.automation.strategies.remote.remote_control import RemoteControlFacade
+from src.automation.strategies.remote.x11_focus import X11FocusTracker
+
+
+def test_tracker_updates_active_window_on_property_notify(mocker):
+    tracker = X11FocusTracker()
+    tracker._atom = 42
+    tracker._active = 100
+    mocker.patch.object(tracker, '_read_active_window', return_value=200)
+
+    tracker._handle_event(SimpleNamespace(type=X.PropertyNotify, atom=7))
+    assert tracker.active_window == 100
+
+    tracker._handle_event(SimpleNamespace(type=X.PropertyNotify, atom=42))
+    assert tracker.active_window == 200
+    assert tracker.changes == 1
+
+
+def test_facade_uses_tracker_instead_of_xdotool(mocker):
+    mocker.patch('src.automation.strategies.remote.remote_control.sys.platform', 'linux')
+    facade = RemoteControlFacade()
+    linux_backend = mocker.patch.object(facade, '_linux_backend')
+    facade.window_id = "200"
+    facade.focus_tracker = mocker.MagicMock(running=True, active_window=200)
+    facade.focus_tracker.is_active.side_effect = lambda window_id: window_id == 200
+
+    assert facade.is_window_active()
+    linux_backend.assert_not_called()
@@ -0,0 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from src.automation.common.results import TaskResult, TaskResultStatus
+from src.automation.strategies.remote import xvfb_farm
+from src.automation.strategies.remote.xvfb_farm import XvfbFarmAutomator
+from src.core.models import FacturacionData
+from src.core.profile import AutomationSpec, DataSourceSpec, ProfileSpec
+
+
+def _task(numero_historia):
+    return FacturacionData(
+        numero_historia=numero_historia, identificacion="CC-1", diagnostico_principal="A00",
+        fecha_ingreso=date(2024, 1, 1), medico_tratante="Dr. X", empresa_aseguradora="EPS",
+        contrato_empresa="C1", estrato="1", diagnostico_adicional_1=None,
+        diagnostico_adicional_2=None, diagnostico_adicional_3=None,
+    )
+
+
+def test_shards_run_per_display_and_results_keep_input_order(mocker):
+    """Cada display recibe un fragmento contiguo; un worker caído solo afecta a su fragmento."""
+    mocker.patch.object(
+        xvfb_farm, "ProcessPoolExecutor", lambda max_workers, mp_context: ThreadPoolExecutor(max_workers)
+    )
+    calls = {}
+
+    def fake_run_shard(profile_name, display, tasks, profiles_dir):
+        calls[display] = list(tasks.column("numero_historia"))
+        if display == ":3":
+            raise RuntimeError("SAF caído")
+        return [TaskResult(TaskResultStatus.SUCCESS, task_id) for task_id in tasks.column("numero_historia")]
+
+    mocker.patch.object(xvfb_farm, "run_shard", fake_run_shard)
+    farm = XvfbFarmAutomator(workers=3)
+    farm.displays = [":1", ":2", ":3"]
+    farm._profile_name = "dev_saf"
+
+    results = farm.process_billing_tasks([_task(f"HC-{i}") for i in range(7)])
+
+    assert calls == {":1": ["HC-0", "HC-1", "HC-2"], ":2": ["HC-3", "HC-4"], ":3": ["HC-5", "HC-6"]}
+    assert [r.task_identifier for r in results] == [f"HC-{i}" for i in range(7)]
+    assert [r.status for r in results[-2:]] == [TaskResultStatus.FAILED_UNEXPECTED_ERROR] * 2
+    assert all(r.status == TaskResultStatus.SUCCESS for r in results[:5])
+
+
+def test_streaming_profiles_are_rejected_before_starting_displays(mocker):
+    """Con `chunk_size` cada bloque relanzaría los workers: la granja se niega antes de levantar nada."""
+    start_display = mocker.patch.object(XvfbFarmAutomator, "_start_display")
+    profile = ProfileSpec(
+        name="dev_saf", data_source=DataSourceSpec(sheet_name="Sheet1", header_row=1, chunk_size=500),
+        column_mapping={}, columns={}, load_schema=None, filter_plan=None, validation_rules=None,
+        automation=AutomationSpec(window_title="SAF - Stunt Action Facsimile v0.2"),
+    )
+
+    with pytest.raises(RuntimeError, match="streaming"):
+        XvfbFarmAutomator(workers=2).initialize(profile)
+    start_display.assert_not_called()
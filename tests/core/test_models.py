@@ -0,0 +1,60 @@
+import pickle
+from datetime import date
+
+import pytest
+
+from src.core.models import FacturacionData, TaskBatch
+
+
+def make_task(i: int) -> FacturacionData:
+    return FacturacionData(
+        numero_historia=f"HC-{i:04d}",
+        identificacion=f"CC-{i:04d}",
+        diagnostico_principal="Q553",
+        fecha_ingreso=date(2025, 6, 1 + i % 28),
+        medico_tratante="Dr. Mock",
+        empresa_aseguradora="EMSSANAR E.P.S S.A.S.",
+        contrato_empresa="CAP PRO UNIPA BARBACOAS ACDO-VOLUNTADES",
+        estrato=str(i % 3),
+        diagnostico_adicional_1=None if i % 2 else "V884",
+        diagnostico_adicional_2=None,
+        diagnostico_adicional_3=None,
+    )
+
+
+@pytest.fixture
+def tasks():
+    return [make_task(i) for i in range(10)]
+
+
+def test_task_batch_round_trips_rows(tasks):
+    """Cada fila del lote se materializa como el FacturacionData original."""
+    batch = TaskBatch.from_tasks(tasks)
+
+    assert len(batch) == 10
+    assert list(batch) == tasks
+    assert batch[-1] == tasks[-1]
+    with pytest.raises(IndexError):
+        batch[10]
+
+
+def test_task_batch_slicing_and_sharding(tasks):
+    """Los cortes y fragmentos son lotes contiguos que cubren todas las tareas."""
+    batch = TaskBatch.from_tasks(tasks)
+
+    assert isinstance(batch[2:5], TaskBatch)
+    assert list(batch[2:5]) == tasks[2:5]
+
+    shards = batch.shard(3)
+    assert [len(s) for s in shards] == [4, 3, 3]
+    assert [t for s in shards for t in s] == tasks
+    assert list(TaskBatch.concat(shards)) == tasks
+
+
+def test_task_batch_dictionary_encodes_repeated_values(tasks):
+    """Los valores repetidos se guardan una sola vez y el lote sobrevive a pickle."""
+    batch = TaskBatch.from_tasks(tasks)
+
+    _, dictionary = batch._encoded["empresa_aseguradora"]
+    assert dictionary == ("EMSSANAR E.P.S S.A.S.",)
+    assert list(pickle.loads(pickle.dumps(batch))) == tasks
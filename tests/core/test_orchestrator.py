@@ -0,0 +1,141 @@
+from configparser import ConfigParser
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.models import FacturacionData
+from src.core.orchestrator import Orchestrator
+from src.core.profile import ProfileSpec
+
+
+@pytest.fixture
+def profile_config():
+    """Perfil mínimo con el mapeo de columnas usado por la transformación."""
+    config = ConfigParser()
+    config.read_dict({
+        "DataSource": {"sheet_name": "Hoja1", "header_row": "1"},
+        "ColumnMapping": {
+            "numero_historia": "HISTORIA:",
+            "identificacion": "IDENTIFIC:",
+            "diagnostico_principal": "DIAG INGRESO",
+            "fecha_ingreso": "FEC/INGRESO:",
+            "medico_tratante": "MEDICO:",
+            "empresa_aseguradora": "EMPRESA:",
+            "contrato_empresa": "CONTRATO EMP:",
+            "estrato": "ESTRATO:",
+            "diagnostico_adicional_1": "DX ADICIONAL1:",
+            "diagnostico_adicional_2": "DX ADICIONAL2:",
+        }
+    })
+    return config
+
+
+@pytest.fixture
+def orchestrator(mocker):
+    return Orchestrator(
+        config_loader=mocker.MagicMock(),
+        data_loader=mocker.MagicMock(),
+        data_filterer=mocker.MagicMock(),
+        data_validator=mocker.MagicMock(),
+    )
+
+
+@pytest.fixture
+def valid_df():
+    return pd.DataFrame({
+        "HISTORIA": ["HC-1", "HC-2", "HC-3"],
+        "IDENTIFIC": ["CC-1", "CC-2", "CC-3"],
+        "DIAG_INGRESO": ["Q553", "K283", "A001"],
+        "FEC_INGRESO": ["2025-06-15", "no es fecha", "15/05/2025"],
+        "MEDICO": ["Dr. A", "Dr. B", "Dr. C"],
+        "EMPRESA": ["EPS", "EPS", "EPS"],
+        "CONTRATO_EMP": ["C1", "C1", "C2"],
+        "ESTRATO": [1, 2, 3],
+        "DX_ADICIONAL1": ["V884", np.nan, None],
+        "DX_ADICIONAL2": [np.nan, np.nan, "G532"],
+    })
+
+
+def test_transform_builds_dataclasses_column_wise(orchestrator, profile_config, valid_df):
+    """Convierte tipos por columna, normaliza nulos opcionales y descarta en bloque las fechas inválidas."""
+    tasks = orchestrator._transform_to_tasks(valid_df, ProfileSpec.from_config(profile_config, "test"))
+
+    assert [t.numero_historia for t in tasks] == ["HC-1", "HC-3"]
+    assert tasks[0] == FacturacionData(
+        numero_historia="HC-1",
+        identificacion="CC-1",
+        diagnostico_principal="Q553",
+        fecha_ingreso=date(2025, 6, 15),
+        medico_tratante="Dr. A",
+        empresa_aseguradora="EPS",
+        contrato_empresa="C1",
+        estrato="1",
+        diagnostico_adicional_1="V884",
+        diagnostico_adicional_2=None,
+        diagnostico_adicional_3=None,
+    )
+    assert tasks[1].fecha_ingreso == date(2025, 5, 15)
+    assert tasks[1].diagnostico_adicional_1 is None
+    assert tasks[1].diagnostico_adicional_2 == "G532"
+
+
+def test_transform_keeps_required_text_fields_as_str(orchestrator, profile_config, valid_df):
+    """Una identificación vacía llega como cadena vacía, no como NaN, y las cédulas numéricas sin '.0'."""
+    valid_df["IDENTIFIC"] = [np.nan, "CC-2", 1085123456.0]
+
+    tasks = orchestrator._transform_to_tasks(valid_df, ProfileSpec.from_config(profile_config, "test"))
+
+    assert [t.identificacion for t in tasks] == ["", "1085123456"]
+    assert all(isinstance(getattr(t, name), str) for t in tasks for name in Orchestrator._REQUIRED_TASK_FIELDS
+               if name != "fecha_ingreso")
+
+
+def test_transform_reports_missing_mapping_once(orchestrator, profile_config, valid_df, caplog):
+    """Si falta una columna obligatoria no se construye ninguna tarea y se registra un único error."""
+    tasks = orchestrator._transform_to_tasks(valid_df.drop(columns=["MEDICO"]), ProfileSpec.from_config(profile_config, "test"))
+
+    assert len(tasks) == 0
+    assert caplog.text.count("medico_tratante") == 1
+
+
+def test_streaming_pipeline_feeds_automator_chunk_by_chunk(orchestrator, profile_config, valid_df, mocker):
+    """Con chunk_size > 0 el automator se inicializa y recibe cada bloque en orden, sin esperar al libro completo."""
+    profile_config["DataSource"]["chunk_size"] = "1"
+    orchestrator.config_loader.load_profile.return_value = ProfileSpec.from_config(profile_config, "test")
+    orchestrator.data_loader.iter_chunks.side_effect = lambda *args, **kwargs: iter([valid_df.iloc[[0]], valid_df.iloc[[2]]])
+    orchestrator.data_filterer.apply_criteria_stream.side_effect = lambda chunks, profile: chunks
+    orchestrator.data_validator.validate_stream.side_effect = lambda chunks, profile: (
+        (chunk, chunk.iloc[0:0]) for chunk in chunks
+    )
+    summary = mocker.patch.object(orchestrator, "_generate_summary_report")
+    automator = mocker.MagicMock()
+    automator.process_billing_tasks.side_effect = lambda batch: [batch[0].numero_historia]
+    orchestrator.automator = automator
+
+    orchestrator.run("test", "entrada.xlsx")
+
+    calls = [name for name, _, _ in automator.method_calls]
+    assert calls == ["initialize", "process_billing_tasks", "process_billing_tasks", "shutdown"]
+    assert summary.call_args.kwargs == {"raw_count": 2, "valid_count": 2, "results": ["HC-1", "HC-3"]}
+
+
+def test_streaming_pipeline_does_not_touch_the_gui_without_tasks(orchestrator, profile_config, valid_df, mocker):
+    """Si la validación rechaza todas las filas, el automator no se inicializa ni se cierra."""
+    profile_config["DataSource"]["chunk_size"] = "1"
+    orchestrator.config_loader.load_profile.return_value = ProfileSpec.from_config(profile_config, "test")
+    orchestrator.data_loader.iter_chunks.side_effect = lambda *args, **kwargs: iter([valid_df.iloc[[0]], valid_df.iloc[[2]]])
+    orchestrator.data_filterer.apply_criteria_stream.side_effect = lambda chunks, profile: chunks
+    orchestrator.data_validator.validate_stream.side_effect = lambda chunks, profile: (
+        (chunk.iloc[0:0], chunk) for chunk in chunks
+    )
+    mocker.patch.object(orchestrator, "_export_error_report")
+    summary = mocker.patch.object(orchestrator, "_generate_summary_report")
+    automator = mocker.MagicMock()
+    orchestrator.automator = automator
+
+    orchestrator.run("test", "entrada.xlsx")
+
+    assert automator.method_calls == []
+    assert summary.call_args.kwargs == {"raw_count": 2, "valid_count": 0, "results": []}
@@ -0,0 +1,138 @@
+from configparser import ConfigParser
+from dataclasses import dataclass
+
+import pandas as pd
+import pytest
+
+from src.core.profile import ProfileSpec
+from src.data_handler.filter import DataFilterer, FilterPredicate
+
+
+@pytest.fixture
+def profile_config():
+    config = ConfigParser()
+    config.read_dict({
+        "DataSource": {"sheet_name": "Hoja1", "header_row": "1"},
+        "ColumnMapping": {
+            "user_for_filter": "USUARIO:",
+            "pyp_for_filter": "ES PYP:",
+            "cups_for_filter": "CUPS:",
+            "specialty_for_filter": "ESPECIALIDAD:",
+        },
+        "FilterCriteria": {
+            "pyp_for_filter": "no",
+            "user_for_filter": " nancy ",
+            "cups_for_filter": "890201",
+        },
+    })
+    return config
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({
+        "USUARIO": ["NANCY", "nancy ", "PEDRO", "NANCY", "NANCY", None],
+        "ES_PYP": ["No", "NO", "No", "Si", "No", "No"],
+        "CUPS": [890201, 890201, 890201, 890201, 123, 890201],
+    }, index=[10, 11, 12, 13, 14, 15])
+
+
+def test_apply_criteria_selects_matching_rows(profile_config, data):
+    """La comparación es insensible a mayúsculas y espacios y preserva el índice original."""
+    result = DataFilterer().apply_criteria(data, ProfileSpec.from_config(profile_config, "test"))
+
+    assert list(result.index) == [10, 11]
+    pd.testing.assert_frame_equal(result, data.loc[[10, 11]])
+
+
+def test_plan_orders_by_selectivity_and_reports_counts(profile_config, data):
+    """El predicado más restrictivo se evalúa primero y los conteos encadenan las filas vivas."""
+    plan = DataFilterer().compile_plan(profile_config)
+    selection, counts = plan.evaluate(data)
+
+    assert list(selection) == [0, 1]
+    assert counts[0][0].column == "USUARIO"
+    assert [(before, after) for _, before, after in counts] == [(6, 4), (4, 3), (3, 2)]
+
+
+def test_missing_column_is_skipped_with_single_warning(profile_config, data, caplog):
+    """Un filtro sobre una columna inexistente se omite y se advierte una sola vez por recorrido."""
+    profile_config["FilterCriteria"]["specialty_for_filter"] = "MEDICO GENERAL"
+    filterer = DataFilterer()
+
+    chunks = [data.iloc[:3], data.iloc[3:]]
+    results = list(filterer.apply_criteria_stream(chunks, ProfileSpec.from_config(profile_config, "test")))
+
+    assert [list(r.index) for r in results] == [[10, 11], []]
+    assert caplog.text.count("no existe en el DataFrame") == 1
+
+
+def test_cached_profile_carries_no_state_between_runs(profile_config, data, caplog):
+    """El plan del perfil es inmutable: cada recorrido aprende su selectividad y advierte por su cuenta."""
+    profile_config["FilterCriteria"]["specialty_for_filter"] = "MEDICO GENERAL"
+    profile = ProfileSpec.from_config(profile_config, "test")
+    filterer = DataFilterer()
+
+    for _ in range(2):
+        list(filterer.apply_criteria_stream([data.iloc[:3], data.iloc[3:]], profile))
+
+    assert caplog.text.count("no existe en el DataFrame") == 2
+    assert not hasattr(profile.filter_plan, "_pass_ratio")
+
+
+@pytest.fixture
+def operator_data():
+    return pd.DataFrame({
+        "USUARIO": ["NANCY", "PEDRO", "ANA", "nancy", None],
+        "CUPS": ["890201", "890301", "990101", 890205, "x"],
+        "FEC_INGRESO": ["2025-06-15", "2025-05-31 18:00", "2025-07-01", None, "no es fecha"],
+        "EDAD": [10, 25, 40, "18", None],
+    })
+
+
+@pytest.mark.parametrize("column, criterion, expected_positions", [
+    ("USUARIO:", "in: nancy, Ana", [0, 2, 3]),
+    ("USUARIO:", "not in: nancy, ana", [1, 4]),
+    ("USUARIO:", "not: PEDRO", [0, 2, 3, 4]),
+    ("USUARIO:", "eq: pedro", [1]),
+    ("CUPS:", "prefix: 8902", [0, 3]),
+    ("CUPS:", "prefix: 8903, 99", [1, 2]),
+    ("FEC/INGRESO:", "between: 2025-05-31, 2025-06-30", [0, 1]),
+    ("FEC/INGRESO:", "between: 2025-07-01,", [2]),
+    ("EDAD:", "between: 18, 30", [1, 3]),
+    ("EDAD:", "not between: 18, 30", [0, 2]),
+    ("FEC/INGRESO:", "not between: 2025-05-31, 2025-06-30", [2]),
+])
+def test_operators_compile_to_vectorized_predicates(operator_data, column, criterion, expected_positions):
+    """Cada operador de [FilterCriteria] selecciona exactamente las filas esperadas."""
+    config = ConfigParser()
+    config.read_dict({
+        "ColumnMapping": {"campo": column},
+        "FilterCriteria": {"campo": criterion},
+    })
+
+    selection, _ = DataFilterer().compile_plan(config).evaluate(operator_data)
+
+    assert list(selection) == expected_positions
+
+
+@pytest.mark.parametrize("criterion", ["in: ,", "between: 1", "between: ayer, mañana"])
+def test_invalid_operator_arguments_raise(criterion):
+    config = ConfigParser()
+    config.read_dict({
+        "ColumnMapping": {"campo": "CUPS:"},
+        "FilterCriteria": {"campo": criterion},
+    })
+
+    with pytest.raises(ValueError):
+        DataFilterer().compile_plan(config)
+
+
+def test_predicate_without_operation_fails_on_creation():
+    @dataclass(frozen=True)
+    class Incomplete(FilterPredicate):
+        def _matches(self, normalized):
+            return normalized == normalized
+
+    with pytest.raises(TypeError):
+        Incomplete(label="X", column="X")
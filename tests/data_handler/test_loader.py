@@ -0,0 +1,169 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from src.data_handler.loader import ColumnSchema, ExcelLoader
+
+
+@pytest.fixture
+def sample_workbook(tmp_path):
+    """Crea un Excel pequeño con una fila de título antes del encabezado real."""
+    path = tmp_path / "facturacion.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Hoja1"
+    ws.append(["Reporte mensual"])
+    ws.append(["HISTORIA:", "IDENTIFIC:", "FEC/INGRESO:", "ESTRATO:", "NOTAS"])
+    for i in range(1, 8):
+        ws.append([f"HC-{i:04d}", f"CC-{i:04d}", f"2025-06-{i:02d}", "N/A" if i == 3 else "UNO", "x"])
+    ws.append([None, None, None, None, None])
+    wb.save(path)
+    return path
+
+
+def test_iter_chunks_yields_bounded_sanitized_chunks(sample_workbook):
+    """Los bloques respetan el tamaño máximo, sanean columnas y numeran el índice de forma continua."""
+    chunks = list(ExcelLoader().iter_chunks(sample_workbook, "Hoja1", header_row=2, chunk_size=3))
+
+    assert [len(c) for c in chunks] == [3, 3, 1]
+    assert list(chunks[0].columns) == ["HISTORIA", "IDENTIFIC", "FEC_INGRESO", "ESTRATO", "NOTAS"]
+    assert list(chunks[2].index) == [6]
+    # Los nulos textuales se normalizan igual que en pd.read_excel.
+    assert chunks[0]["ESTRATO"].isnull().tolist() == [False, False, True]
+
+
+def test_iter_chunks_projects_requested_columns(sample_workbook):
+    """Solo se conservan las columnas del esquema (nombres saneados)."""
+    chunks = ExcelLoader().iter_chunks(
+        sample_workbook, "Hoja1", header_row=2, chunk_size=10,
+        schema=ColumnSchema(columns=frozenset({"HISTORIA", "ESTRATO"})),
+    )
+    chunk = next(chunks)
+    assert list(chunk.columns) == ["HISTORIA", "ESTRATO"]
+
+
+@pytest.fixture
+def numeric_id_workbook(tmp_path):
+    """Cédulas numéricas con una celda vacía: pandas las leería como float."""
+    path = tmp_path / "ids.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Hoja1"
+    ws.append(["IDENTIFIC:", "FEC/INGRESO:", "EMPRESA:", "SOBRANTE"])
+    ws.append([1085123456, date(2025, 6, 1), "EPS A", 1])
+    ws.append([None, "15/06/2025", "EPS A", 2])
+    ws.append([27000111, "no es fecha", "EPS B", 3])
+    wb.save(path)
+    return path
+
+
+SCHEMA = ColumnSchema(
+    columns=frozenset({"IDENTIFIC", "FEC_INGRESO", "EMPRESA"}),
+    text=frozenset({"IDENTIFIC"}),
+    dates=frozenset({"FEC_INGRESO"}),
+    categorical=frozenset({"EMPRESA"}),
+)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_schema_applies_dtypes_on_load(numeric_id_workbook, streaming):
+    """Los identificadores llegan como texto exacto, las fechas parseadas y las columnas repetitivas como categorías."""
+    loader = ExcelLoader()
+    if streaming:
+        chunks = list(loader.iter_chunks(numeric_id_workbook, "Hoja1", header_row=1, chunk_size=2, schema=SCHEMA))
+    else:
+        chunks = [loader.load_data(numeric_id_workbook, "Hoja1", header_row=1, schema=SCHEMA)]
+    df = pd.concat(chunks)
+
+    assert "SOBRANTE" not in df.columns
+    assert df["IDENTIFIC"].tolist()[::2] == ["1085123456", "27000111"]
+    assert df["IDENTIFIC"].isna().tolist() == [False, True, False]
+    assert all(isinstance(chunk["EMPRESA"].dtype, pd.CategoricalDtype) for chunk in chunks)
+    assert df["FEC_INGRESO"].iloc[1] == pd.Timestamp(2025, 6, 15)
+    # Las fechas no interpretables conservan su valor para el reporte de errores.
+    assert df["FEC_INGRESO"].iloc[2] == "no es fecha"
+
+
+@pytest.mark.parametrize("dates", [["15/06/2025", "01/02/2024"], ["01/02/2024", "15/06/2025"]])
+@pytest.mark.parametrize("date_format, expected", [(None, date(2024, 1, 2)), ("%d/%m/%Y", date(2024, 2, 1))])
+def test_ambiguous_dates_parse_the_same_in_any_order_or_chunk(tmp_path, dates, date_format, expected):
+    """Una fecha ambigua no cambia según la fila en que aparezca ni el bloque en que llegue."""
+    path = tmp_path / "fechas.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Hoja1"
+    ws.append(["FEC/INGRESO:"])
+    for value in dates:
+        ws.append([value])
+    wb.save(path)
+    schema = ColumnSchema(columns=frozenset({"FEC_INGRESO"}), dates=frozenset({"FEC_INGRESO"}), date_format=date_format)
+    loader = ExcelLoader()
+
+    for chunk_size in (0, 1):
+        if chunk_size:
+            df = pd.concat(loader.iter_chunks(path, "Hoja1", header_row=1, chunk_size=chunk_size, schema=schema))
+        else:
+            df = loader.load_data(path, "Hoja1", header_row=1, schema=schema)
+        parsed = dict(zip(dates, df["FEC_INGRESO"].dt.date))
+        assert parsed["01/02/2024"] == expected
+        assert parsed["15/06/2025"] == date(2025, 6, 15)
+
+
+def test_iter_chunks_matches_full_load(sample_workbook):
+    """El modo streaming entrega los mismos datos que la carga completa."""
+    loader = ExcelLoader()
+    full = loader.load_data(sample_workbook, "Hoja1", header_row=2).dropna(how="all")
+    streamed = list(loader.iter_chunks(sample_workbook, "Hoja1", header_row=2, chunk_size=2))
+
+    pd.testing.assert_frame_equal(pd.concat(streamed), full, check_dtype=False)
+
+
+def test_iter_chunks_missing_sheet_raises(sample_workbook):
+    with pytest.raises(ValueError):
+        next(ExcelLoader().iter_chunks(sample_workbook, "NoExiste", header_row=1, chunk_size=5))
+
+
+def test_cache_serves_warm_runs_and_invalidates_on_change(sample_workbook, tmp_path, mocker):
+    """Una segunda carga no re-parsea el Excel; modificar el archivo invalida la entrada."""
+    pytest.importorskip("pyarrow")
+    cache_dir = tmp_path / "cache"
+    loader = ExcelLoader(cache_dir=cache_dir)
+
+    cold = loader.load_data(sample_workbook, "Hoja1", header_row=2)
+    read_excel_spy = mocker.spy(pd, "read_excel")
+    warm = loader.load_data(sample_workbook, "Hoja1", header_row=2)
+
+    assert read_excel_spy.call_count == 0
+    pd.testing.assert_frame_equal(warm.fillna("<nulo>"), cold.fillna("<nulo>"))
+    assert len(list(cache_dir.glob("*.arrow"))) == 1
+
+    wb = load_workbook(sample_workbook)
+    wb.active.append(["HC-9999", "CC-9999", "2025-07-01", "DOS", "y"])
+    wb.save(sample_workbook)
+
+    refreshed = loader.load_data(sample_workbook, "Hoja1", header_row=2)
+    assert read_excel_spy.call_count == 1
+    assert "HC-9999" in refreshed["HISTORIA"].tolist()
+    # La entrada obsoleta del mismo archivo se elimina.
+    assert len(list(cache_dir.glob("*.arrow"))) == 1
+
+
+def test_cache_keeps_entries_of_other_sheets_and_files(sample_workbook, tmp_path, mocker):
+    """Otra combinación hoja/encabezado del mismo libro u otro archivo con prefijo común no se desalojan."""
+    pytest.importorskip("pyarrow")
+    cache_dir = tmp_path / "cache"
+    loader = ExcelLoader(cache_dir=cache_dir)
+    sibling = tmp_path / "facturacion-2024.xlsx"
+    sibling.write_bytes(sample_workbook.read_bytes())
+
+    loader.load_data(sample_workbook, "Hoja1", header_row=2)
+    loader.load_data(sample_workbook, "Hoja1", header_row=1)
+    loader.load_data(sibling, "Hoja1", header_row=2)
+    read_excel_spy = mocker.spy(pd, "read_excel")
+    loader.load_data(sample_workbook, "Hoja1", header_row=2)
+    loader.load_data(sample_workbook, "Hoja1", header_row=1)
+
+    assert read_excel_spy.call_count == 0
+    assert len(list(cache_dir.glob("*.arrow"))) == 3
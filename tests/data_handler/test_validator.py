@@ -0,0 +1,84 @@
+from configparser import ConfigParser
+
+import pandas as pd
+import pytest
+
+from src.core.profile import ProfileSpec
+from src.data_handler.validator import REJECTION_MASK_COLUMN, DataValidator
+
+
+@pytest.fixture
+def profile_config():
+    config = ConfigParser()
+    config.read_dict({
+        "DataSource": {"sheet_name": "Hoja1", "header_row": "1"},
+        "ColumnMapping": {
+            "numero_historia": "HISTORIA:",
+            "diagnostico_principal": "DX:",
+            "fecha_ingreso": "FEC/INGRESO:",
+        },
+        "ValidationRules": {
+            "diagnostico_principal_pattern": "[A-Z][0-9]{2}[0-9A-Z]{0,2}",
+            "duplicate_key": "numero_historia, fecha_ingreso",
+        },
+    })
+    return config
+
+
+@pytest.fixture
+def profile(profile_config):
+    return ProfileSpec.from_config(profile_config, "test")
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({
+        "HISTORIA": ["HC-1", "HC-2", None, "HC-1", "HC-4"],
+        "DX": ["J00", "J00", "K29", "J00", "gripa"],
+        "FEC_INGRESO": ["2025-06-01", "2025-06-02", "2025-06-03", "2025-06-01", "no es fecha"],
+    }, index=[10, 11, 12, 13, 14])
+
+
+def test_validate_data_records_every_failed_rule(profile, data):
+    """Cada fila inválida acumula todas las reglas que incumple, no solo la primera."""
+    validator = DataValidator()
+    valid, invalid = validator.validate_data(data, profile)
+
+    assert list(valid.index) == [10, 11]
+    assert list(invalid.index) == [12, 13, 14]
+
+    reasons = validator.describe_rejections(invalid[REJECTION_MASK_COLUMN], profile)
+    assert reasons[12] == "Falta el valor de 'HISTORIA:'."
+    assert reasons[13] == "Registro duplicado para la clave (HISTORIA:, FEC/INGRESO:)."
+    assert reasons[14] == (
+        "La fecha de 'FEC/INGRESO:' no es interpretable.; "
+        "El valor de 'DX:' no cumple el formato esperado."
+    )
+
+
+def test_validate_data_missing_required_column_rejects_all_rows(profile, data):
+    valid, invalid = DataValidator().validate_data(data.drop(columns=["DX"]), profile)
+
+    assert valid.empty
+    assert (invalid[REJECTION_MASK_COLUMN] == 1).all()
+
+
+def test_validate_stream_detects_duplicates_across_chunks(profile, data):
+    chunks = [data.iloc[:2], data.iloc[2:]]
+    results = list(DataValidator().validate_stream(chunks, profile))
+
+    assert [list(valid.index) for valid, _ in results] == [[10, 11], []]
+    assert 13 in results[1][1].index
+
+
+@pytest.mark.parametrize("rules", [
+    {"identificacion_pattern": "[0-9]+"},
+    {"diagnostico_principal_pattern": "[A-Z"},
+    {"duplicate_key": "numero_historia, inexistente"},
+])
+def test_compile_rules_rejects_invalid_configuration(profile_config, rules):
+    profile_config.remove_section("ValidationRules")
+    profile_config.read_dict({"ValidationRules": rules})
+
+    with pytest.raises(ValueError):
+        DataValidator().compile_rules(profile_config)
@@ -0,0 +1,95 @@
+import os
+from configparser import NoSectionError
+
+import pytest
+
+from src.config_loader import ConfigLoader
+
+PROFILE = """
+[DataSource]
+sheet_name = Hoja1
+header_row = 2
+
+[ColumnMapping]
+numero_historia = HISTORIA:
+fecha_ingreso = FEC/INGRESO:
+
+[FilterCriteria]
+numero_historia = prefix: HC
+
+[AutomationTimeouts]
+patient_load_wait_ms = 1500
+"""
+
+
+@pytest.fixture
+def profiles_dir(tmp_path):
+    (tmp_path / "demo.ini").write_text(PROFILE, encoding="utf-8")
+    return tmp_path
+
+
+def test_load_profile_compiles_spec(profiles_dir):
+    spec = ConfigLoader(profiles_dir).load_profile("demo")
+
+    assert spec.data_source.header_row == 2
+    assert spec.columns["fecha_ingreso"] == "FEC_INGRESO"
+    assert spec.original_column_names["HISTORIA"] == "HISTORIA:"
+    assert len(spec.filter_plan) == 1
+    assert spec.automation.patient_load_wait == 1.5
+    assert spec.automation.window_title is None
+
+
+def test_load_profile_is_cached_until_file_changes(profiles_dir):
+    loader = ConfigLoader(profiles_dir)
+    first = loader.load_profile("demo")
+    assert loader.load_profile("demo") is first
+
+    path = profiles_dir / "demo.ini"
+    path.write_text(PROFILE.replace("header_row = 2", "header_row = 3"), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    refreshed = loader.load_profile("demo")
+    assert refreshed is not first
+    assert refreshed.data_source.header_row == 3
+
+
+def test_load_profile_rejects_invalid_profiles(profiles_dir):
+    (profiles_dir / "roto.ini").write_text("[DataSource]\nsheet_name = Hoja1\nheader_row = 1\n", encoding="utf-8")
+    loader = ConfigLoader(profiles_dir)
+
+    with pytest.raises(NoSectionError):
+        loader.load_profile("roto")
+    with pytest.raises(FileNotFoundError):
+        loader.load_profile("no_existe")
+
+
+def test_load_profile_compiles_sessions(profiles_dir):
+    sessions = "\n[AutomationSessions]\nsede_a = Facturación @ :2\nsede_b = Facturación - Sede B\n"
+    (profiles_dir / "multi.ini").write_text(PROFILE + sessions, encoding="utf-8")
+    (profiles_dir / "choque.ini").write_text(
+        PROFILE + "\n[AutomationSessions]\na = Uno @ :2\nb = Dos @ :2\n", encoding="utf-8"
+    )
+    loader = ConfigLoader(profiles_dir)
+
+    first, second = loader.load_profile("multi").automation.sessions
+    assert (first.name, first.window_title, first.display) == ("sede_a", "Facturación", ":2")
+    assert (second.window_title, second.display) == ("Facturación - Sede B", None)
+    with pytest.raises(ValueError):
+        loader.load_profile("choque")
+
+
+def test_load_profile_compiles_mission_manifest_next_to_ini(profiles_dir):
+    from src.automation.common.states import TaskState
+
+    loader = ConfigLoader(profiles_dir)
+    default = loader.load_profile("demo")
+    assert default.automation.mission.initial == TaskState.ENSURING_INITIAL_STATE
+
+    (profiles_dir / "demo.mission.json").write_text(
+        '{"states": [{"name": "FINDING_PATIENT", "steps": [{"call": "find_patient"}], "next": "TASK_SUCCESSFUL"}]}',
+        encoding="utf-8",
+    )
+    mission = loader.load_profile("demo").automation.mission
+    assert list(mission.states) == [TaskState.FINDING_PATIENT]
+    assert mission.retryable == default.automation.mission.retryable
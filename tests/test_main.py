@@ -0,0 +1,24 @@
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_help_does_not_import_heavy_modules():
+    """`--help` responde sin cargar la capa de datos ni la de automatización."""
+    code = (
+        "import sys\n"
+        "sys.argv = ['main', '--help']\n"
+        "from src.main import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "heavy = {'pandas', 'pywinauto', 'pyperclip', 'PIL'} & {m.split('.')[0] for m in sys.modules}\n"
+        "print(sorted(heavy))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip().splitlines()[-1] == "[]"
@@ -1,5 +1,6 @@
+import pandas as pd
 import pytest
-from src.utils.dataframe_helpers import sanitize_column_name
+from src.utils.dataframe_helpers import sanitize_column_name, to_datetime_tolerant
 
 # Usamos parametrize para probar múltiples casos de forma limpia y eficiente.
 # Cada tupla contiene (entrada, salida_esperada).
@@ -32,4 +33,31 @@ def test_sanitize_column_name_non_string_input():
     """
     Verifica que la función maneja entradas no-string (como números) sin fallar.
     """
-    assert sanitize_column_name(12345) == '12345'
\ No newline at end of file
+    assert sanitize_column_name(12345) == '12345'
+
+
+@pytest.mark.parametrize("values", [
+    ['15/06/2025', '01/02/2024'],
+    ['01/02/2024', '15/06/2025'],
+])
+def test_to_datetime_tolerant_does_not_depend_on_row_order(values):
+    """
+    Una fecha ambigua se interpreta igual sin importar qué celda aparece primero.
+    """
+    parsed = dict(zip(values, to_datetime_tolerant(pd.Series(values, dtype=object))))
+
+    assert parsed['01/02/2024'] == pd.Timestamp(2024, 1, 2)
+    assert parsed['15/06/2025'] == pd.Timestamp(2025, 6, 15)
+
+
+def test_to_datetime_tolerant_applies_configured_format():
+    """
+    Con un formato explícito, las fechas ambiguas siguen su orden día/mes, también
+    las celdas que no lo cumplen y se re-interpretan individualmente.
+    """
+    series = pd.Series(['01/02/2024', '03/04/2024 10:30', 'no es fecha', None], dtype=object)
+
+    parsed = to_datetime_tolerant(series, '%d/%m/%Y')
+
+    assert parsed.tolist()[:2] == [pd.Timestamp(2024, 2, 1), pd.Timestamp(2024, 4, 3, 10, 30)]
+    assert parsed.isna().tolist()[2:] == [True, True]